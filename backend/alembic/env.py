@@ -10,7 +10,7 @@ from app.models import extracted_json_model
 load_dotenv()
 
 from app.core.database import Base
-from app.models import user_model, vendor_model, extraction_model, log_model  # import all model files
+from app.models import user_model, vendor_model, extraction_model, log_model, extraction_job_model  # import all model files
 target_metadata = Base.metadata
 
 config = context.config
@@ -0,0 +1,31 @@
+"""Add updated_at to tb_inai_extracted_json
+
+Revision ID: 3c7d2f8a1b6e
+Revises: 5b1e0c7a9d24
+Create Date: 2026-10-18 14:10:00.000000
+
+Row version for the ETags on the extracted-json read endpoints. Adding a
+nullable column without a default is a catalog-only change on the
+partitioned parent and cascades to every partition.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7d2f8a1b6e'
+down_revision: Union[str, None] = '5b1e0c7a9d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tb_inai_extracted_json', sa.Column('updated_at', sa.TIMESTAMP(timezone=False), nullable=True),
+                  schema='invoai')
+
+
+def downgrade() -> None:
+    op.drop_column('tb_inai_extracted_json', 'updated_at', schema='invoai')
@@ -0,0 +1,110 @@
+"""Partition tb_inai_extracted_json by month on created_at
+
+Revision ID: 5b1e0c7a9d24
+Revises: 98626e20ed39
+Create Date: 2026-10-18 11:30:00.000000
+
+Rebuilds the table as PARTITION BY RANGE (created_at) with one partition
+per month, from the oldest stored invoice up to three months ahead; later
+months are pre-created by `python -m app.maintenance.partitions`.
+
+The data is copied into the new table under an ACCESS EXCLUSIVE lock, so
+run it in a maintenance window. A partitioned table's primary key must
+contain the partition key, so the key becomes (return_id, created_at) and
+created_at becomes NOT NULL (existing NULLs are backfilled with now()).
+The indexes are created on the parent and cascade to every partition,
+including the ones created later.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e0c7a9d24'
+down_revision: Union[str, None] = '98626e20ed39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE = 'invoai.tb_inai_extracted_json'
+OLD_TABLE = 'invoai.tb_inai_extracted_json_unpartitioned'
+SEQUENCE = 'invoai.tb_inai_extracted_json_return_id_seq'
+COLUMNS = 'return_id, invoice_number, extracted_json, vendor_id, created_by, created_at, is_deleted'
+
+INDEXES = [
+    "CREATE INDEX ix_invoai_tb_inai_extracted_json_return_id ON {table} (return_id)",
+    "CREATE INDEX ix_invoai_tb_inai_extracted_json_vendor_created_active "
+    "ON {table} (vendor_id, created_at) WHERE is_deleted = 0",
+    "CREATE INDEX ix_invoai_tb_inai_extracted_json_vendor_return_active "
+    "ON {table} (vendor_id, return_id) WHERE is_deleted = 0",
+    "CREATE INDEX ix_invoai_tb_inai_extracted_json_extracted_json_gin "
+    "ON {table} USING gin (extracted_json jsonb_path_ops)",
+]
+
+
+def _create_table(partitioned: bool) -> None:
+    op.execute(f"""
+        CREATE TABLE {TABLE} (
+            return_id INTEGER NOT NULL DEFAULT nextval('{SEQUENCE}'),
+            invoice_number VARCHAR(30),
+            extracted_json JSONB,
+            vendor_id INTEGER REFERENCES invoai.tb_inai_mas_vendor (vendor_id),
+            created_by INTEGER,
+            created_at TIMESTAMP WITHOUT TIME ZONE {'NOT NULL' if partitioned else ''},
+            is_deleted INTEGER
+        ){' PARTITION BY RANGE (created_at)' if partitioned else ''}
+    """)
+
+
+def upgrade() -> None:
+    op.execute(f"UPDATE {TABLE} SET created_at = now() WHERE created_at IS NULL")
+
+    # Keep the id sequence alive when the old table is dropped
+    op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY NONE")
+    op.execute(f"ALTER TABLE {TABLE} RENAME TO tb_inai_extracted_json_unpartitioned")
+    _create_table(partitioned=True)
+
+    # Months from the oldest stored invoice up to three months ahead
+    op.execute(f"""
+        DO $$
+        DECLARE
+            partition_month DATE;
+        BEGIN
+            FOR partition_month IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE((SELECT min(created_at) FROM {OLD_TABLE}), now())),
+                    date_trunc('month', now()) + interval '3 months',
+                    interval '1 month')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE invoai.%I PARTITION OF {TABLE} FOR VALUES FROM (%L) TO (%L)',
+                    'tb_inai_extracted_json_p' || to_char(partition_month, 'YYYY_MM'),
+                    partition_month, (partition_month + interval '1 month')::date);
+            END LOOP;
+        END $$
+    """)
+
+    op.execute(f"INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {OLD_TABLE}")
+    op.execute(f"DROP TABLE {OLD_TABLE}")
+    op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.return_id")
+
+    op.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT tb_inai_extracted_json_pkey PRIMARY KEY (return_id, created_at)")
+    for index in INDEXES:
+        op.execute(index.format(table=TABLE))
+
+
+def downgrade() -> None:
+    # Archived (detached) partitions are not merged back
+    op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY NONE")
+    op.execute(f"ALTER TABLE {TABLE} RENAME TO tb_inai_extracted_json_unpartitioned")
+    _create_table(partitioned=False)
+
+    op.execute(f"INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {OLD_TABLE}")
+    op.execute(f"DROP TABLE {OLD_TABLE}")
+    op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.return_id")
+
+    op.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT tb_inai_extracted_json_pkey PRIMARY KEY (return_id)")
+    for index in INDEXES:
+        op.execute(index.format(table=TABLE))
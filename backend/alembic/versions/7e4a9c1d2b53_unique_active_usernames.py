@@ -0,0 +1,109 @@
+"""Make active usernames unique
+
+Revision ID: 7e4a9c1d2b53
+Revises: 3c7d2f8a1b6e
+Create Date: 2026-10-18 15:00:00.000000
+
+Replaces the partial user_name index with a partial UNIQUE index over live
+rows (is_deleted = 0), so login is one indexed lookup and one bcrypt check.
+Soft-deleted users keep their names without blocking reuse.
+
+Existing duplicates must be resolved by hand (rename or soft delete all but
+one per name): the upgrade stops and lists them before touching any index.
+The index is built CONCURRENTLY. If a duplicate slips in while it builds
+(or the build hits a lock timeout), the build fails and leaves an INVALID
+index behind; re-running the revision drops that leftover and builds it
+again. The old index is only dropped once the new one is valid.
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e4a9c1d2b53'
+down_revision: Union[str, None] = '3c7d2f8a1b6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+OLD_INDEX = 'ix_invoai_tb_inai_mas_user_user_name_active'
+NEW_INDEX = 'uq_invoai_tb_inai_mas_user_user_name_active'
+
+# A DO block rather than a Python-side query so `alembic upgrade --sql` scripts check too
+REPORT_DUPLICATES = """
+    DO $$
+    DECLARE
+        duplicates TEXT;
+    BEGIN
+        SELECT string_agg(format('%s (user_ids %s)', user_name, user_ids), '; ')
+        INTO duplicates
+        FROM (
+            SELECT user_name, array_agg(user_id ORDER BY user_id) AS user_ids
+            FROM invoai.tb_inai_mas_user
+            WHERE is_deleted = 0
+            GROUP BY user_name
+            HAVING count(*) > 1
+        ) AS dup;
+
+        IF duplicates IS NOT NULL THEN
+            RAISE EXCEPTION 'Duplicate active usernames, resolve before upgrading: %', duplicates;
+        END IF;
+    END $$
+"""
+
+
+INDEX_VALID = sa.text(
+    "SELECT i.indisvalid FROM pg_index i "
+    "JOIN pg_class c ON c.oid = i.indexrelid "
+    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE n.nspname = 'invoai' AND c.relname = :name"
+)
+
+
+def index_valid(name: str) -> Optional[bool]:
+    """pg_index.indisvalid of the index, None when it does not exist (or with --sql)."""
+    if op.get_context().as_sql:
+        return None
+    return op.get_bind().execute(INDEX_VALID, {'name': name}).scalar()
+
+
+def create_index_concurrently(name: str, unique: bool) -> None:
+    # A failed concurrent build leaves an INVALID index under the same name,
+    # which IF NOT EXISTS would keep; drop it and build again instead
+    valid = index_valid(name)
+    if valid is False:
+        op.drop_index(name, table_name='tb_inai_mas_user', schema='invoai', postgresql_concurrently=True)
+    if not valid:
+        op.create_index(
+            name, 'tb_inai_mas_user', ['user_name'], unique=unique, schema='invoai',
+            postgresql_where=sa.text('is_deleted = 0'),
+            postgresql_concurrently=True,
+        )
+
+
+def upgrade() -> None:
+    op.execute(REPORT_DUPLICATES)
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        create_index_concurrently(NEW_INDEX, unique=True)
+        if index_valid(NEW_INDEX) is False:
+            raise RuntimeError(f'{NEW_INDEX} is INVALID, keeping {OLD_INDEX}; re-run the upgrade')
+        op.drop_index(
+            OLD_INDEX, table_name='tb_inai_mas_user', schema='invoai',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        create_index_concurrently(OLD_INDEX, unique=False)
+        op.drop_index(
+            NEW_INDEX, table_name='tb_inai_mas_user', schema='invoai',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,85 @@
+"""Convert extracted_json to JSONB with a GIN index
+
+Revision ID: 98626e20ed39
+Revises: c84e11fb21a1
+Create Date: 2026-10-18 10:45:00.000000
+
+The type change rewrites tb_inai_extracted_json under an ACCESS EXCLUSIVE
+lock, so schedule it in a maintenance window on large tables. The GIN
+index (jsonb_path_ops) is then built concurrently. It serves @> and the
+equality conditions of @@ jsonpath predicates used by the
+/extracted-json/query endpoint; range conditions (total > 10000) cannot use
+it and are checked row by row. A failed concurrent build leaves an INVALID
+index behind; re-running the revision drops it and builds it again.
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '98626e20ed39'
+down_revision: Union[str, None] = 'c84e11fb21a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+GIN_INDEX = 'ix_invoai_tb_inai_extracted_json_extracted_json_gin'
+
+INDEX_VALID = sa.text(
+    "SELECT i.indisvalid FROM pg_index i "
+    "JOIN pg_class c ON c.oid = i.indexrelid "
+    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE n.nspname = 'invoai' AND c.relname = :name"
+)
+
+
+def index_valid(name: str) -> Optional[bool]:
+    """pg_index.indisvalid of the index, None when it does not exist (or with --sql)."""
+    if op.get_context().as_sql:
+        return None
+    return op.get_bind().execute(INDEX_VALID, {'name': name}).scalar()
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'tb_inai_extracted_json', 'extracted_json',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_type=sa.JSON(),
+        postgresql_using='extracted_json::jsonb',
+        schema='invoai',
+    )
+
+    with op.get_context().autocommit_block():
+        # IF NOT EXISTS would keep an INVALID leftover of a failed build
+        valid = index_valid(GIN_INDEX)
+        if valid is False:
+            op.drop_index(GIN_INDEX, table_name='tb_inai_extracted_json', schema='invoai',
+                          postgresql_concurrently=True)
+        if not valid:
+            op.create_index(
+                GIN_INDEX, 'tb_inai_extracted_json', ['extracted_json'], unique=False, schema='invoai',
+                postgresql_using='gin',
+                postgresql_ops={'extracted_json': 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            GIN_INDEX,
+            table_name='tb_inai_extracted_json', schema='invoai',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.alter_column(
+        'tb_inai_extracted_json', 'extracted_json',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='extracted_json::json',
+        schema='invoai',
+    )
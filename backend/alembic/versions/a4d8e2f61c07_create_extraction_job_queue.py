@@ -0,0 +1,61 @@
+"""Create tb_inai_extraction_job
+
+Revision ID: a4d8e2f61c07
+Revises: 7e4a9c1d2b53
+Create Date: 2026-10-18 16:00:00.000000
+
+Queue table for background invoice extraction (app.workers.extraction_worker).
+Workers claim the oldest claimable row with FOR UPDATE SKIP LOCKED, served by
+a partial index over the queued/running rows only. return_id has no foreign
+key: tb_inai_extracted_json is partitioned and keyed on (return_id, created_at).
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e2f61c07'
+down_revision: Union[str, None] = '7e4a9c1d2b53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tb_inai_extraction_job',
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('vendor_id', sa.Integer(), nullable=True),
+        sa.Column('file_name', sa.String(length=255), nullable=True),
+        sa.Column('content_type', sa.String(length=100), nullable=False),
+        sa.Column('document', sa.LargeBinary(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('available_at', sa.TIMESTAMP(timezone=False), nullable=False),
+        sa.Column('locked_by', sa.String(length=64), nullable=True),
+        sa.Column('return_id', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=False), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=False), nullable=True),
+        sa.Column('finished_at', sa.TIMESTAMP(timezone=False), nullable=True),
+        sa.ForeignKeyConstraint(['vendor_id'], ['invoai.tb_inai_mas_vendor.vendor_id']),
+        sa.PrimaryKeyConstraint('job_id'),
+        schema='invoai'
+    )
+    op.create_index(op.f('ix_invoai_tb_inai_extraction_job_job_id'), 'tb_inai_extraction_job', ['job_id'],
+                    unique=False, schema='invoai')
+    op.create_index('ix_invoai_tb_inai_extraction_job_available_pending', 'tb_inai_extraction_job',
+                    ['available_at'], unique=False, schema='invoai',
+                    postgresql_where=sa.text("status IN ('queued', 'running')"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_invoai_tb_inai_extraction_job_available_pending', table_name='tb_inai_extraction_job',
+                  schema='invoai')
+    op.drop_index(op.f('ix_invoai_tb_inai_extraction_job_job_id'), table_name='tb_inai_extraction_job',
+                  schema='invoai')
+    op.drop_table('tb_inai_extraction_job', schema='invoai')
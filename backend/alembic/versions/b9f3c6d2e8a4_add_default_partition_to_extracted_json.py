@@ -0,0 +1,47 @@
+"""Add a DEFAULT partition to tb_inai_extracted_json
+
+Revision ID: b9f3c6d2e8a4
+Revises: a4d8e2f61c07
+Create Date: 2026-10-18 17:00:00.000000
+
+Without it, an invoice whose created_at has no monthly partition (the
+maintenance command stopped running for longer than the months it
+pre-creates) fails to insert with "no partition of relation found". Such
+rows now land in tb_inai_extracted_json_default; the next
+`python -m app.maintenance.partitions` run creates their month and moves
+them out (see that module).
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9f3c6d2e8a4'
+down_revision: Union[str, None] = 'a4d8e2f61c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE = 'invoai.tb_inai_extracted_json'
+DEFAULT_PARTITION = 'invoai.tb_inai_extracted_json_default'
+
+# A DO block rather than a Python-side query so `alembic downgrade --sql` scripts check too
+REFUSE_NON_EMPTY_DEFAULT = f"""
+    DO $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM {DEFAULT_PARTITION}) THEN
+            RAISE EXCEPTION 'Rows in {DEFAULT_PARTITION}: run python -m app.maintenance.partitions first';
+        END IF;
+    END $$
+"""
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+
+
+def downgrade() -> None:
+    op.execute(REFUSE_NON_EMPTY_DEFAULT)
+    op.execute(f"DROP TABLE {DEFAULT_PARTITION}")
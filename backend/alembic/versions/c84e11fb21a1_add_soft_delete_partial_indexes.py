@@ -0,0 +1,75 @@
+"""Add soft-delete partial and composite indexes
+
+Revision ID: c84e11fb21a1
+Revises: 2f3404437eee
+Create Date: 2026-10-18 10:20:00.000000
+
+Every lookup filters is_deleted = 0 together with a lookup column, so the
+indexes only cover live rows. They are built CONCURRENTLY (outside the
+migration transaction) so the revision can be applied to a live database.
+A failed concurrent build leaves an INVALID index behind; re-running the
+revision drops it and builds it again.
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c84e11fb21a1'
+down_revision: Union[str, None] = '2f3404437eee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_invoai_tb_inai_mas_user_user_name_active', 'tb_inai_mas_user', ['user_name']),
+    ('ix_invoai_tb_inai_mas_user_bio_id_active', 'tb_inai_mas_user', ['bio_id']),
+    ('ix_invoai_tb_inai_extraction_details_vendor_id_active', 'tb_inai_extraction_details', ['vendor_id']),
+    ('ix_invoai_tb_inai_extracted_json_vendor_created_active', 'tb_inai_extracted_json', ['vendor_id', 'created_at']),
+    ('ix_invoai_tb_inai_extracted_json_vendor_return_active', 'tb_inai_extracted_json', ['vendor_id', 'return_id']),
+]
+
+
+INDEX_VALID = sa.text(
+    "SELECT i.indisvalid FROM pg_index i "
+    "JOIN pg_class c ON c.oid = i.indexrelid "
+    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE n.nspname = 'invoai' AND c.relname = :name"
+)
+
+
+def index_valid(name: str) -> Optional[bool]:
+    """pg_index.indisvalid of the index, None when it does not exist (or with --sql)."""
+    if op.get_context().as_sql:
+        return None
+    return op.get_bind().execute(INDEX_VALID, {'name': name}).scalar()
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            # IF NOT EXISTS would keep an INVALID leftover the planner never uses
+            valid = index_valid(name)
+            if valid is False:
+                op.drop_index(name, table_name=table, schema='invoai', postgresql_concurrently=True)
+            if not valid:
+                op.create_index(
+                    name, table, columns, unique=False, schema='invoai',
+                    postgresql_where=sa.text('is_deleted = 0'),
+                    postgresql_concurrently=True,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, schema='invoai',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -1,11 +1,18 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from app.core import database
+from app.core.config import settings
 from app.services.extracted_json_service import OCRExtractionService
 from app.schemas.extracted_json_schema import ReturnJsonCreate, ReturnJsonUpdate
 from app.core.database import get_db
 from app.utils.api_response import ApiResponse
+from app.utils.etag import conditional_response, page_etag, record_etag
 from app.core.logger import logger
 from app.repositories.extracted_json_repository import ReturnJsonRepository
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, TotalMode
 
 
 router = APIRouter()
@@ -17,20 +24,89 @@ def get_return_json_service(db: Session = Depends(get_db)) -> OCRExtractionServi
 
 
 @router.get("/", summary="Get all return JSON records")
-async def get_all_returns(service: OCRExtractionService = Depends(get_return_json_service)):
+async def get_all_returns(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    vendor_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    invoice_number_prefix: Optional[str] = None,
+    total: TotalMode = Query("none", description="none, exact (COUNT(*)) or estimated (planner statistics)"),
+    if_none_match: Optional[str] = Header(None),
+    service: OCRExtractionService = Depends(get_return_json_service),
+):
     try:
-        result = await service.get_all_returns()
-        return ApiResponse.from_result(result)
+        result = await service.get_all_returns(
+            limit=limit, after=after, vendor_id=vendor_id,
+            created_from=created_from, created_to=created_to,
+            invoice_number_prefix=invoice_number_prefix, total=total)
+        etag = None
+        if result.success and total != "estimated":
+            page = result.data
+            etag = page_etag(page["records"], "return_id", page["next_cursor"], page["total"])
+        return conditional_response(result, etag, if_none_match)
     except Exception as e:
         logger.exception("Error fetching return JSON records.")
         return ApiResponse.error(str(e), 500)
 
 
+@router.get("/query", summary="Filter return JSON records by values inside extracted_json")
+async def query_returns(
+    where: List[str] = Query(..., description="Predicate '<path> <op> <value>', e.g. 'total > 10000' "
+                                               "or 'supplier.gstin = 29ABCDE1234F1Z5'; repeat to AND"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    vendor_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    service: OCRExtractionService = Depends(get_return_json_service),
+):
+    try:
+        result = await service.query_returns(
+            where, limit=limit, after=after, vendor_id=vendor_id,
+            created_from=created_from, created_to=created_to)
+        return ApiResponse.from_result(result)
+    except Exception as e:
+        logger.exception("Error querying return JSON records.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/export", summary="Stream return JSON records as NDJSON")
+async def export_returns(
+    vendor_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    after_id: Optional[int] = Query(None, description="Resume after this return_id"),
+):
+    """
+    Streams one JSON object per line in return_id order with constant memory.
+    The request-scoped session is closed before the body is sent, so the
+    stream owns its own session for the lifetime of the response.
+    """
+    filters = dict(vendor_id=vendor_id, created_from=created_from, created_to=created_to,
+                   after_id=after_id, batch_size=settings.EXPORT_BATCH_SIZE)
+
+    if database.AsyncSessionLocal is not None:
+        async def body():
+            async with database.AsyncSessionLocal() as db:
+                async for chunk in OCRExtractionService(ReturnJsonRepository(db)).aiter_export_ndjson(**filters):
+                    yield chunk
+    else:
+        # Sync iterators are consumed from Starlette's threadpool, keeping the loop free
+        def body():
+            with database.SessionLocal() as db:
+                yield from OCRExtractionService(ReturnJsonRepository(db)).iter_export_ndjson(**filters)
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
 @router.get("/{return_id}", summary="Get return JSON by ID")
-async def get_return_by_id(return_id: int, service: OCRExtractionService = Depends(get_return_json_service)):
+async def get_return_by_id(return_id: int, if_none_match: Optional[str] = Header(None),
+                           service: OCRExtractionService = Depends(get_return_json_service)):
     try:
         result = await service.get_return_by_id(return_id)
-        return ApiResponse.from_result(result)
+        etag = record_etag(result.data, "return_id") if result.success else None
+        return conditional_response(result, etag, if_none_match)
     except Exception as e:
         logger.exception(f"Error fetching return JSON {return_id}")
         return ApiResponse.error(str(e), 500)
@@ -1,3 +1,4 @@
+from typing import List
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from app.services.extraction_details_service import ExtractionService
@@ -40,6 +41,15 @@ async def create_extraction(payload: ExtractionCreate, service: ExtractionServic
         logger.exception("Error creating extraction.")
         return ApiResponse.error(str(e), 500)
 
+@router.post("/bulk", summary="Create many extraction zones in one transaction", status_code=status.HTTP_201_CREATED)
+async def bulk_create_extractions(payload: List[ExtractionCreate], service: ExtractionService = Depends(get_extraction_service)):
+    try:
+        result = await service.bulk_create_extractions(payload)
+        return ApiResponse.from_result(result)
+    except Exception as e:
+        logger.exception("Error bulk creating extractions.")
+        return ApiResponse.error(str(e), 500)
+
 @router.put("/{extraction_id}", summary="Update extraction")
 async def update_extraction(extraction_id: int, payload: ExtractionUpdate, service: ExtractionService = Depends(get_extraction_service)):
     try:
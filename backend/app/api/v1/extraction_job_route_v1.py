@@ -0,0 +1,70 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Request
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.logger import logger
+from app.repositories.extracted_json_repository import ReturnJsonRepository
+from app.repositories.extraction_job_repository import ExtractionJobRepository
+from app.services.extracted_json_service import OCRExtractionService
+from app.services.extraction_job_service import ExtractionJobService
+from app.utils.api_response import ApiResponse
+
+
+router = APIRouter()
+
+
+def get_extraction_job_service(db: Session = Depends(get_db)) -> ExtractionJobService:
+    return ExtractionJobService(ExtractionJobRepository(db), OCRExtractionService(ReturnJsonRepository(db)))
+
+
+@router.post("/", summary="Queue an invoice (PDF or image as the raw request body) for extraction")
+async def submit_extraction_job(
+    request: Request,
+    vendor_id: Optional[int] = Query(None, description="Vendor whose extraction zones are read"),
+    file_name: Optional[str] = Query(None, max_length=255),
+    created_by: Optional[int] = None,
+    content_type: Optional[str] = Header(None),
+    content_length: Optional[int] = Header(None),
+    service: ExtractionJobService = Depends(get_extraction_job_service),
+):
+    try:
+        too_large = f"Documents are limited to {settings.EXTRACTION_MAX_DOCUMENT_BYTES} bytes"
+        # Refuse oversized uploads before reading them into memory
+        if content_length is not None and content_length > settings.EXTRACTION_MAX_DOCUMENT_BYTES:
+            return ApiResponse.error(too_large, 413)
+
+        # Chunked uploads carry no Content-Length: stop reading once the limit is passed
+        document = bytearray()
+        async for chunk in request.stream():
+            document.extend(chunk)
+            if len(document) > settings.EXTRACTION_MAX_DOCUMENT_BYTES:
+                return ApiResponse.error(too_large, 413)
+
+        result = await service.submit(bytes(document), content_type, file_name=file_name,
+                                      vendor_id=vendor_id, created_by=created_by)
+        return ApiResponse.from_result(result)
+    except Exception as e:
+        logger.exception("Error queuing extraction job.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/{job_id}", summary="Get the status of an extraction job")
+async def get_extraction_job(job_id: int, service: ExtractionJobService = Depends(get_extraction_job_service)):
+    try:
+        result = await service.get_job(job_id)
+        return ApiResponse.from_result(result)
+    except Exception as e:
+        logger.exception(f"Error fetching extraction job {job_id}.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/{job_id}/result", summary="Get the return JSON record produced by a finished extraction job")
+async def get_extraction_job_result(job_id: int,
+                                    service: ExtractionJobService = Depends(get_extraction_job_service)):
+    try:
+        result = await service.get_result(job_id)
+        return ApiResponse.from_result(result)
+    except Exception as e:
+        logger.exception(f"Error fetching the result of extraction job {job_id}.")
+        return ApiResponse.error(str(e), 500)
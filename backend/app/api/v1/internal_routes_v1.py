@@ -0,0 +1,73 @@
+from fastapi import APIRouter
+from app.core import database
+from app.core.cache import CACHES
+from app.core.db_executor import POOLS
+from app.core.db_pool import pool_stats
+from app.core.middleware.admission import admission_limiters
+from app.core.security import password_hasher
+from app.utils.api_response import ApiResponse
+from app.core.logger import logger
+
+router = APIRouter()
+
+
+@router.get("/db-pool-stats", summary="Connection pool stats for this worker")
+async def get_db_pool_stats():
+    try:
+        stats = {"primary": pool_stats(database.engine)}
+        if database.replica_engine is not None:
+            stats["replica"] = pool_stats(database.replica_engine)
+        if database.async_engine is not None:
+            stats["async"] = pool_stats(database.async_engine)
+        if database.async_replica_engine is not None:
+            stats["async_replica"] = pool_stats(database.async_replica_engine)
+
+        logger.info("db_pool_stats", **stats)
+        return ApiResponse.success("Pool stats fetched successfully", 200, stats)
+    except Exception as e:
+        logger.exception("Error fetching pool stats.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/db-threadpool-stats", summary="Saturation counters of the sync-Session thread pools for this worker")
+async def get_db_threadpool_stats():
+    try:
+        stats = {name: pool.stats() for name, pool in POOLS.items()}
+        logger.info("db_threadpool_stats", **stats)
+        return ApiResponse.success("Thread pool stats fetched successfully", 200, stats)
+    except Exception as e:
+        logger.exception("Error fetching thread pool stats.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/admission-stats", summary="Adaptive concurrency limits and shed requests per route group for this worker")
+async def get_admission_stats():
+    try:
+        stats = {name: limiter.stats() for name, limiter in admission_limiters.items()}
+        logger.info("admission_stats", **stats)
+        return ApiResponse.success("Admission stats fetched successfully", 200, stats)
+    except Exception as e:
+        logger.exception("Error fetching admission stats.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/cache-stats", summary="Service cache hit/miss counters for this worker")
+async def get_cache_stats():
+    try:
+        stats = {cache.name: cache.stats() for cache in CACHES}
+        logger.info("cache_stats", **stats)
+        return ApiResponse.success("Cache stats fetched successfully", 200, stats)
+    except Exception as e:
+        logger.exception("Error fetching cache stats.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/password-hasher-stats", summary="bcrypt process pool usage for this worker")
+async def get_password_hasher_stats():
+    try:
+        stats = password_hasher.stats()
+        logger.info("password_hasher_stats", **stats)
+        return ApiResponse.success("Password hasher stats fetched successfully", 200, stats)
+    except Exception as e:
+        logger.exception("Error fetching password hasher stats.")
+        return ApiResponse.error(str(e), 500)
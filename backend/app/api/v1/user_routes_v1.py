@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 from app.services.user_service import UserService
 from app.schemas.user_schema import UserCreate, UserUpdate, PasswordUpdate
 from app.core.database import get_db
 from app.utils.api_response import ApiResponse
+from app.utils.etag import conditional_response, page_etag, record_etag
 from app.core.result import Result   # ✅ Import FIRST
 from app.core.logger import logger
 from app.repositories.user_repository import UserRepository
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, TotalMode
 
 router = APIRouter()
 
@@ -18,14 +22,29 @@ def get_user_service(db: Session = Depends(get_db)) -> UserService:
 
 
 @router.get("/get-all-user-details", summary="Get all users")
-async def get_all_users(service: UserService = Depends(get_user_service)):
+async def get_all_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    name_prefix: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    # exact by default: the response always carried a total
+    total: TotalMode = Query("exact", description="none, exact (COUNT(*)) or estimated (planner statistics)"),
+    if_none_match: Optional[str] = Header(None),
+    service: UserService = Depends(get_user_service),
+):
     try:
-        result = await service.get_all_users()
+        result = await service.get_all_users(
+            limit=limit, after=after, name_prefix=name_prefix,
+            created_from=created_from, created_to=created_to, total=total)
 
         if not result.success:
             return ApiResponse.error(result.message, result.code, result.data)
 
-        return ApiResponse.success(result.message, result.code, result.data)
+        page = result.data
+        etag = page_etag(page["users"], "user_id", page["next_cursor"], page["total"]) \
+            if total != "estimated" else None
+        return conditional_response(result, etag, if_none_match)
 
     except Exception as e:
         logger.exception("Unexpected error fetching users.")
@@ -33,12 +52,12 @@ async def get_all_users(service: UserService = Depends(get_user_service)):
 
 
 @router.get("/get-user-details-by-id", summary="Get user by ID")
-async def get_user_by_id(user_id: int, service: UserService = Depends(get_user_service)):
+async def get_user_by_id(user_id: int, if_none_match: Optional[str] = Header(None),
+                         service: UserService = Depends(get_user_service)):
     try:
         result = await service.get_user_by_id(user_id)
-        if not result.success:
-            return ApiResponse.error(result.message, result.code)
-        return ApiResponse.success(result.message, result.code, result.data)
+        etag = record_etag(result.data, "user_id") if result.success else None
+        return conditional_response(result, etag, if_none_match)
     except Exception as e:
         logger.exception(f"Error fetching user {user_id}")
         return ApiResponse.error(str(e), 500)
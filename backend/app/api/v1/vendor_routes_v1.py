@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 from app.services.vendor_service import VendorService
 from app.schemas.vendor_schema import VendorCreate, VendorUpdate
 from app.core.database import get_db
 from app.utils.api_response import ApiResponse
+from app.utils.etag import conditional_response, page_etag, record_etag
 from app.core.logger import logger
 from app.repositories.vendor_repository import VendorRepository
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, TotalMode
 
 router = APIRouter()
 
@@ -17,26 +21,69 @@ def get_vendor_service(db: Session = Depends(get_db)) -> VendorService:
 
 
 @router.get("/get-all-vendors", summary="Get all vendors")
-async def get_all_vendors(service: VendorService = Depends(get_vendor_service)):
+async def get_all_vendors(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    name_prefix: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    total: TotalMode = Query("none", description="none, exact (COUNT(*)) or estimated (planner statistics)"),
+    if_none_match: Optional[str] = Header(None),
+    service: VendorService = Depends(get_vendor_service),
+):
     try:
-        result = await service.get_all_vendors()
-        if not result.success:
-            return ApiResponse.error(result.message, result.code)
-        return ApiResponse.success(result.message, result.code, result.data)
+        result = await service.get_all_vendors(
+            limit=limit, after=after, name_prefix=name_prefix,
+            created_from=created_from, created_to=created_to, total=total)
+        etag = None
+        # Planner estimates drift without any row changing, so they get no ETag
+        if result.success and total != "estimated":
+            page = result.data
+            etag = page_etag(page["vendors"], "vendor_id", page["next_cursor"], page["total"])
+        return conditional_response(result, etag, if_none_match)
     except Exception as e:
         logger.exception("Error fetching vendors.")
         return ApiResponse.error(str(e), 500)
 
 
 @router.get("/get-vendor-details-by-id", summary="Get vendor by ID")
-async def get_vendor_by_id(vendor_id: int, service: VendorService = Depends(get_vendor_service)):
+async def get_vendor_by_id(vendor_id: int, if_none_match: Optional[str] = Header(None),
+                           service: VendorService = Depends(get_vendor_service)):
     try:
         result = await service.get_vendor_by_id(vendor_id)
+        etag = record_etag(result.data, "vendor_id") if result.success else None
+        return conditional_response(result, etag, if_none_match)
+    except Exception as e:
+        logger.exception(f"Error fetching vendor {vendor_id}")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/get-vendor-templates", summary="Get vendors with their active extraction zones")
+async def get_vendor_templates(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    name_prefix: Optional[str] = None,
+    service: VendorService = Depends(get_vendor_service),
+):
+    try:
+        result = await service.get_vendor_templates(limit=limit, after=after, name_prefix=name_prefix)
         if not result.success:
             return ApiResponse.error(result.message, result.code)
         return ApiResponse.success(result.message, result.code, result.data)
     except Exception as e:
-        logger.exception(f"Error fetching vendor {vendor_id}")
+        logger.exception("Error fetching vendor templates.")
+        return ApiResponse.error(str(e), 500)
+
+
+@router.get("/get-vendor-template-by-id", summary="Get a vendor with its active extraction zones")
+async def get_vendor_template_by_id(vendor_id: int, service: VendorService = Depends(get_vendor_service)):
+    try:
+        result = await service.get_vendor_template_by_id(vendor_id)
+        if not result.success:
+            return ApiResponse.error(result.message, result.code)
+        return ApiResponse.success(result.message, result.code, result.data)
+    except Exception as e:
+        logger.exception(f"Error fetching template of vendor {vendor_id}")
         return ApiResponse.error(str(e), 500)
 
 
@@ -52,6 +99,18 @@ async def create_vendor(payload: VendorCreate, service: VendorService = Depends(
         return ApiResponse.error(str(e), 500)
 
 
+@router.post("/bulk-upsert-vendors", summary="Create or update many vendors in one transaction")
+async def bulk_upsert_vendors(payload: List[VendorCreate], service: VendorService = Depends(get_vendor_service)):
+    try:
+        result = await service.bulk_upsert_vendors(payload)
+        if not result.success:
+            return ApiResponse.error(result.message, result.code)
+        return ApiResponse.success(result.message, result.code, result.data)
+    except Exception as e:
+        logger.exception("Error bulk upserting vendors.")
+        return ApiResponse.error(str(e), 500)
+
+
 @router.put("/update-vendor-details", summary="Update existing vendor")
 async def update_vendor(vendor_id: int, payload: VendorUpdate, service: VendorService = Depends(get_vendor_service)):
     try:
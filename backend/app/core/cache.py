@@ -0,0 +1,275 @@
+# app/core/cache.py
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable, List, Optional
+from fastapi.encoders import jsonable_encoder
+from app.core.cache_backend import CacheBackend, RedisCacheBackend
+from app.core.config import settings
+from app.core.database import primary_reads
+from app.core.logger import logger
+from app.core.result import Result
+from app.core.single_flight import SingleFlight
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded in-process read-through cache (LRU eviction + per-entry TTL).
+
+    The per-worker tier of a ServiceCache.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the cached value, or _MISSING when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                value = _MISSING
+            lookups = self.hits + self.misses
+
+        if settings.CACHE_STATS_LOG_EVERY and lookups % settings.CACHE_STATS_LOG_EVERY == 0:
+            logger.info("cache_stats", **self.stats())
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys: Optional[Iterable[Hashable]] = None):
+        """Drops the given keys, or every entry when keys is None."""
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+            self.invalidations += 1
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cache": self.name,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class ServiceCache:
+    """
+    Read-through cache for service methods returning a Result.
+
+    Lookups go to this worker's TTLCache first, then to the shared backend
+    (when one is configured), then to the loader. Only successful Results
+    are cached, so errors and 404s are always re-checked. Concurrent misses
+    for the same key share one load (SingleFlight). invalidate()
+    evicts the entries in the shared backend and broadcasts the eviction so
+    every other worker drops its local copies too. A load that straddles an
+    invalidation on any worker is not written to the shared backend (see
+    CacheBackend). Loads read from the primary even with a read replica
+    configured: a lagging replica would refill the cache with the row a
+    write just evicted.
+    """
+
+    def __init__(self, name: str, max_entries: int = settings.CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = settings.CACHE_TTL_SECONDS,
+                 backend: Optional[CacheBackend] = None):
+        self.name = name
+        self.local = TTLCache(name, max_entries, ttl_seconds)
+        self.flight = SingleFlight(name)
+        # Bumped by every invalidation; a load that straddles one is not cached
+        self._generation = 0
+        self.backend = backend
+        self.origin = uuid.uuid4().hex
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.shared_errors = 0
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, default=str, separators=(",", ":"))
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable],
+                          timeout_seconds: Optional[float] = None):
+        key = self._key(key)
+        if not settings.CACHE_ENABLED:
+            return await self.flight.do(key, loader, timeout_seconds)
+
+        cached = self.local.get(key)
+        if cached is not _MISSING:
+            return cached
+        return await self.flight.do(key, lambda: self._load(key, loader), timeout_seconds)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable]):
+        generation = self._generation
+        version = None
+        if self.backend is not None:
+            raw = await self._shared("get", self.backend.get(self.name, key))
+            if raw is not None:
+                self.shared_hits += 1
+                stored = json.loads(raw)
+                result = Result.Ok(stored["data"], message=stored["message"], code=stored["code"])
+                self.local.set(key, result)
+                return result
+            self.shared_misses += 1
+            # Read before loading: an invalidation on any worker during the load moves it
+            version = await self._shared("version", self.backend.version(self.name))
+
+        with primary_reads():
+            result = await loader()
+        if result.success and generation == self._generation:
+            self.local.set(key, result)
+            if version is not None:
+                raw = json.dumps({"data": jsonable_encoder(result.data), "message": result.message,
+                                  "code": result.code})
+                await self._shared("set", self.backend.set(self.name, key, raw, settings.CACHE_SHARED_TTL_SECONDS,
+                                                           version))
+        return result
+
+    async def invalidate(self, *keys: Hashable):
+        """Evicts the given keys (or everything) here, in the shared backend and on other workers."""
+        keys = [self._key(key) for key in keys] or None
+        self._forget(keys)
+        if self.backend is None:
+            return
+        await self._shared("delete", self.backend.delete(self.name, keys))
+        await self._shared("publish", self.backend.publish(json.dumps(
+            {"cache": self.name, "keys": keys, "origin": self.origin})))
+
+    def on_invalidation(self, message: dict):
+        """Applies another worker's broadcast eviction to the local tier."""
+        if message.get("cache") == self.name and message.get("origin") != self.origin:
+            self._forget(message.get("keys"))
+
+    def _forget(self, keys: Optional[List[str]]):
+        self._generation += 1
+        self.local.invalidate(keys)
+        self.flight.forget(keys)
+
+    async def _shared(self, operation: str, call: Awaitable):
+        # The shared tier is an optimisation: if it is down, fall through to the database
+        try:
+            return await call
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning("cache_backend_error", cache=self.name, operation=operation, error=str(e))
+            return None
+
+    def reset_stats(self):
+        self.local.reset_stats()
+        self.flight.reset_stats()
+        self.shared_hits = self.shared_misses = self.shared_errors = 0
+
+    def stats(self) -> dict:
+        stats = self.local.stats()
+        stats["backend"] = self.backend.name if self.backend is not None else "local"
+        stats["coalescing"] = self.flight.stats()
+        if self.backend is not None:
+            stats.update(shared_hits=self.shared_hits, shared_misses=self.shared_misses,
+                         shared_errors=self.shared_errors)
+        return stats
+
+
+# Vendor master data: vendor pages and single vendors
+vendor_cache = ServiceCache("vendors")
+# Extraction zones and vendor templates (vendor + zones)
+extraction_cache = ServiceCache("extraction_templates")
+# User pages and single users (never the password hash)
+user_cache = ServiceCache("users")
+# Single extracted-JSON records, evicted per key
+extracted_json_cache = ServiceCache("extracted_json")
+
+CACHES = [vendor_cache, extraction_cache, user_cache, extracted_json_cache]
+
+
+def _dispatch(raw: str, caches: List[ServiceCache]):
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        logger.warning("cache_invalidation_malformed", message=raw)
+        return
+    for cache in caches:
+        cache.on_invalidation(message)
+
+
+async def listen_for_invalidations(backend: CacheBackend, caches: List[ServiceCache]):
+    """Runs until cancelled, applying broadcast evictions to the given caches."""
+    while True:
+        try:
+            await backend.listen(lambda raw: _dispatch(raw, caches))
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Missed broadcasts are bounded by CACHE_TTL_SECONDS; keep reconnecting
+            logger.warning("cache_invalidation_listener_error", error=str(e))
+            await asyncio.sleep(1)
+
+
+_listener: Optional[asyncio.Task] = None
+
+
+async def start_cache_backend(backend: Optional[CacheBackend] = None):
+    """Connects the service caches to the shared backend (CACHE_BACKEND) and starts the listener."""
+    global _listener
+    if backend is None:
+        if settings.CACHE_BACKEND != "redis":
+            return
+        backend = RedisCacheBackend(settings.CACHE_REDIS_URL, settings.CACHE_KEY_PREFIX)
+
+    for cache in CACHES:
+        cache.backend = backend
+    _listener = asyncio.get_running_loop().create_task(listen_for_invalidations(backend, CACHES))
+    logger.info("cache_backend_started", backend=backend.name)
+
+
+async def stop_cache_backend():
+    global _listener
+    backend = CACHES[0].backend
+    if _listener is not None:
+        _listener.cancel()
+        try:
+            await _listener
+        except asyncio.CancelledError:
+            pass
+        _listener = None
+    for cache in CACHES:
+        cache.backend = None
+    if backend is not None:
+        await backend.close()
@@ -0,0 +1,191 @@
+# app/core/cache_backend.py
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # optional: only needed for CACHE_BACKEND=redis
+    redis_asyncio = None
+
+
+# KEYS: version, entry, namespace index; ARGV: expected version, value, ttl in ms
+SET_IF_VERSION = """
+if tonumber(redis.call('GET', KEYS[1]) or '0') ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('SET', KEYS[2], ARGV[2], 'PX', ARGV[3])
+redis.call('SADD', KEYS[3], KEYS[2])
+redis.call('PEXPIRE', KEYS[3], ARGV[3])
+return 1
+"""
+
+
+class CacheBackend(ABC):
+    """
+    Storage shared by every worker behind the service caches.
+
+    Values are JSON strings grouped by namespace (one per ServiceCache), so
+    a whole namespace can be evicted at once. publish()/listen() carry the
+    invalidation broadcast that clears each worker's local copies.
+
+    Every delete bumps the namespace version. A loader reads the version
+    before loading and passes it to set(), which skips the write once the
+    version moved: the value may predate a write another worker evicted.
+    """
+
+    name = "backend"
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def version(self, namespace: str) -> int:
+        ...
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: str, ttl_seconds: float,
+                  version: Optional[int] = None):
+        """Stores the value, unless version is given and no longer current."""
+
+    @abstractmethod
+    async def delete(self, namespace: str, keys: Optional[List[str]] = None):
+        """Deletes the given keys, or the whole namespace when keys is None, and bumps the version."""
+
+    @abstractmethod
+    async def publish(self, message: str):
+        ...
+
+    @abstractmethod
+    async def listen(self, handler: Callable[[str], None]):
+        """Calls handler for every published message until cancelled."""
+
+    async def close(self):
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process stand-in for a shared backend (tests, single-process dev).
+    Every ServiceCache given the same instance behaves like a worker
+    connected to the same Redis.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, tuple]] = {}
+        self._versions: Dict[str, int] = {}
+        self._handlers: List[Callable[[str], None]] = []
+        self.published: List[str] = []
+
+    async def get(self, namespace, key):
+        entry = self._entries.get(namespace, {}).get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    async def version(self, namespace):
+        return self._versions.get(namespace, 0)
+
+    async def set(self, namespace, key, value, ttl_seconds, version=None):
+        if version is not None and version != self._versions.get(namespace, 0):
+            return
+        self._entries.setdefault(namespace, {})[key] = (time.monotonic() + ttl_seconds, value)
+
+    async def delete(self, namespace, keys=None):
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+        if keys is None:
+            self._entries.pop(namespace, None)
+            return
+        for key in keys:
+            self._entries.get(namespace, {}).pop(key, None)
+
+    async def publish(self, message):
+        self.published.append(message)
+        for handler in list(self._handlers):
+            handler(message)
+
+    async def listen(self, handler):
+        self._handlers.append(handler)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self._handlers.remove(handler)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis implementation. Each namespace keeps a set of its keys so a
+    namespace can be evicted without SCAN; an entry written while the
+    namespace is being evicted can survive until its TTL. Versioned writes
+    are a Lua script, so the compare and the set are one atomic step.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str):
+        if redis_asyncio is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        self.client = redis_asyncio.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.channel = f"{prefix}:invalidate"
+        self._set_if_version = self.client.register_script(SET_IF_VERSION)
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def _index(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:__keys__"
+
+    def _version(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:__version__"
+
+    async def get(self, namespace, key):
+        return await self.client.get(self._key(namespace, key))
+
+    async def version(self, namespace):
+        return int(await self.client.get(self._version(namespace)) or 0)
+
+    async def set(self, namespace, key, value, ttl_seconds, version=None):
+        ttl_ms = int(ttl_seconds * 1000)
+        if version is not None:
+            await self._set_if_version(
+                keys=[self._version(namespace), self._key(namespace, key), self._index(namespace)],
+                args=[version, value, ttl_ms])
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(namespace, key), value, px=ttl_ms)
+            pipe.sadd(self._index(namespace), self._key(namespace, key))
+            pipe.pexpire(self._index(namespace), ttl_ms)
+            await pipe.execute()
+
+    async def delete(self, namespace, keys=None):
+        if keys is not None:
+            redis_keys = [self._key(namespace, key) for key in keys]
+        else:
+            redis_keys = list(await self.client.smembers(self._index(namespace))) + [self._index(namespace)]
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incr(self._version(namespace))
+            if redis_keys:
+                pipe.delete(*redis_keys)
+            await pipe.execute()
+
+    async def publish(self, message):
+        await self.client.publish(self.channel, message)
+
+    async def listen(self, handler):
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(self.channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    handler(message["data"])
+        finally:
+            await pubsub.aclose()
+
+    async def close(self):
+        await self.client.aclose()
@@ -1,8 +1,13 @@
 # app/core/config.py
 
+from typing import Dict, Literal, Optional
+from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+# Load variables from .env file (walks up from the working directory)
+load_dotenv()
+
 class Settings(BaseSettings):
     # --- App Meta ---
     APP_NAME: str = Field("InvoAI User Management", description="FastAPI App Name")
@@ -11,6 +16,84 @@ class Settings(BaseSettings):
     # --- Database ---
     DATABASE_URL: str = Field(..., description="SQLAlchemy DB URL")
     DB_SCHEMA: str = Field("invoai", description="Database Schema")
+    DB_ASYNC_MODE: bool = Field(False, description="Serve requests with AsyncSession instead of the sync Session")
+    ASYNC_DATABASE_URL: Optional[str] = Field(
+        None, description="Async driver URL; derived from DATABASE_URL when not set")
+    DATABASE_REPLICA_URL: Optional[str] = Field(
+        None, description="Read replica URL; when set, repository reads are routed to it")
+
+    # --- Connection Pool (per worker process) ---
+    DB_POOL_SIZE: int = Field(5, description="Persistent connections kept in the pool")
+    DB_MAX_OVERFLOW: int = Field(10, description="Extra connections allowed above DB_POOL_SIZE under burst")
+    DB_POOL_TIMEOUT: float = Field(30.0, description="Seconds to wait for a free connection before failing")
+    DB_POOL_RECYCLE: int = Field(1800, description="Recycle connections older than this many seconds (-1 disables)")
+    DB_POOL_PRE_PING: bool = Field(True, description="Test connections on checkout to drop stale ones after failover")
+    DB_POOL_SLOW_CHECKOUT_MS: float = Field(500.0, description="Log a warning when a checkout waits longer than this")
+    DB_SYNC_EXECUTION: Literal["threadpool", "inline"] = Field(
+        "threadpool", description="Where sync-Session calls run: a bounded thread pool, or inline on the event loop")
+    DB_THREADPOOL_SIZE: int = Field(
+        15, description="Threads for sync-Session calls; keep at or below DB_POOL_SIZE + DB_MAX_OVERFLOW")
+
+    # --- Bulk Import / Export ---
+    BULK_MAX_ITEMS: int = Field(1000, description="Maximum items accepted by a single bulk create/upsert call")
+    EXPORT_BATCH_SIZE: int = Field(1000, description="Rows fetched per server-side cursor batch when streaming exports")
+
+    # --- Service Cache ---
+    CACHE_ENABLED: bool = Field(True, description="Read-through cache for vendor, user and extracted-JSON reads")
+    CACHE_TTL_SECONDS: float = Field(60.0, description="Per-worker entry lifetime; bounds staleness if a broadcast is missed")
+    CACHE_MAX_ENTRIES: int = Field(1024, description="Entries per cache before least-recently-used eviction")
+    CACHE_STATS_LOG_EVERY: int = Field(1000, description="Log hit/miss counters every N lookups (0 disables)")
+    CACHE_BACKEND: Literal["local", "redis"] = Field("local", description="'redis' shares entries and invalidations across workers")
+    CACHE_REDIS_URL: Optional[str] = Field(None, description="Redis URL for CACHE_BACKEND=redis")
+    CACHE_SHARED_TTL_SECONDS: float = Field(300.0, description="Lifetime of entries in the shared backend")
+    CACHE_KEY_PREFIX: str = Field("invoai:cache", description="Prefix for shared cache keys and the invalidation channel")
+    COALESCE_ENABLED: bool = Field(True, description="Concurrent identical cached reads share one in-flight query")
+    COALESCE_TIMEOUT_SECONDS: float = Field(5.0, description="How long a coalesced read waits before querying itself")
+
+    # --- Partitioning / Retention (tb_inai_extracted_json, PostgreSQL) ---
+    EXTRACTED_JSON_PARTITION_MONTHS_AHEAD: int = Field(3, description="Future monthly partitions kept pre-created")
+    EXTRACTED_JSON_RETENTION_MONTHS: int = Field(24, description="Months of invoices kept attached, current month included")
+    EXTRACTED_JSON_ARCHIVE_SCHEMA: str = Field("invoai_archive", description="Schema expired partitions are moved to")
+
+    # --- Login Audit Log ---
+    AUDIT_LOG_MODE: Literal["batched", "sync"] = Field(
+        "batched", description="batched: background multi-row inserts; sync: write inside the login request")
+    AUDIT_LOG_BATCH_SIZE: int = Field(200, description="Flush once this many login rows are queued")
+    AUDIT_LOG_FLUSH_INTERVAL_MS: float = Field(1000.0, description="Flush at the latest this long after the first queued row")
+    AUDIT_LOG_QUEUE_SIZE: int = Field(10000, description="Queued rows before logins fall back to synchronous writes")
+
+    # --- Password Hashing ---
+    PASSWORD_HASH_WORKERS: int = Field(2, description="bcrypt processes per worker (0 runs bcrypt inline on the event loop)")
+    PASSWORD_HASH_MAX_PENDING: int = Field(32, description="Queued or running hashes before new logins get 503")
+
+    # --- Extraction Jobs ---
+    EXTRACTION_WORKER_PROCESSES: int = Field(2, description="Processes started by `python -m app.workers.extraction_worker`")
+    EXTRACTION_MAX_ATTEMPTS: int = Field(3, description="Runs of a job before it is marked failed")
+    EXTRACTION_VISIBILITY_TIMEOUT_SECONDS: float = Field(
+        300.0, description="A claimed job not finished within this long is handed to another worker")
+    EXTRACTION_RETRY_BACKOFF_SECONDS: float = Field(10.0, description="Delay before the first retry, doubled per attempt")
+    EXTRACTION_POLL_INTERVAL_SECONDS: float = Field(1.0, description="Idle workers poll the queue this often")
+    EXTRACTION_MAX_PENDING_JOBS: int = Field(1000, description="Queued or running jobs before new submissions get 503")
+    EXTRACTION_MAX_DOCUMENT_BYTES: int = Field(10 * 1024 * 1024, description="Largest invoice accepted for extraction")
+
+    # --- Admission Control (per worker process) ---
+    ADMISSION_CONTROL_ENABLED: bool = Field(True, description="Limit concurrent requests per route group and shed the excess")
+    ADMISSION_MAX_CONCURRENCY: Dict[str, int] = Field(
+        {"reads": 64, "writes": 32, "auth": 16, "extraction": 8},
+        description="Upper bound of the adaptive concurrency limit per route group; groups left out are not limited")
+    ADMISSION_TARGET_LATENCY_MS: Dict[str, float] = Field(
+        {"reads": 250.0, "writes": 500.0, "auth": 1000.0, "extraction": 2000.0},
+        description="Responses slower than this shrink the group's limit; faster ones grow it back")
+    ADMISSION_MIN_CONCURRENCY: int = Field(2, description="The adaptive limit never drops below this")
+    ADMISSION_MAX_QUEUE: int = Field(32, description="Requests per group waiting for a slot before new ones get 503")
+    ADMISSION_QUEUE_TIMEOUT_MS: float = Field(500.0, description="Queued requests still waiting after this get 503")
+
+    # --- Startup ---
+    DB_STARTUP_MODE: Literal["check_migrations", "create_all", "skip"] = Field(
+        "check_migrations",
+        description="check_migrations: refuse to start unless the DB is at the Alembic head; "
+                    "create_all: create missing tables (local development only); skip: no DB work at boot")
+    STARTUP_BUDGET_MS: float = Field(2000.0, description="Warn when worker startup takes longer than this")
 
     # --- Logging / Environment ---
     LOG_LEVEL: str = Field("INFO", description="App log level")
@@ -18,5 +101,6 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
+        extra = "ignore"
 
 settings = Settings()
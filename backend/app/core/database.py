@@ -1,8 +1,13 @@
 import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
+from app.core.config import settings
+from app.core.db_pool import pool_options
 
 # Load variables from .env file
 load_dotenv()
@@ -10,12 +15,109 @@ load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 DB_SCHEMA = os.getenv("DB_SCHEMA", "public")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sync driver -> async driver used when DB_ASYNC_MODE is enabled
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Swap the sync driver of a SQLAlchemy URL for its async counterpart."""
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Sends the reads made inside the block to the primary, without pinning
+    the session. For loads whose result outlives the request (the service
+    caches): a lagging replica would put back the row a write just evicted.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to the replica and writes to the primary.
+
+    The first write (flush, INSERT/UPDATE/DELETE or an explicit
+    use_primary()) pins the session to the primary for the rest of its
+    life. Sessions are request-scoped, so a request always reads its own
+    writes even while the replica lags. Reads inside primary_reads() also
+    go to the primary.
+    """
+
+    def __init__(self, primary=None, replica=None, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+
+    def use_primary(self):
+        self.info["use_primary"] = True
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        writes = isinstance(clause, UpdateBase) or getattr(clause, "_for_update_arg", None) is not None
+        if self.info.get("use_primary") or self._flushing or writes:
+            self.use_primary()
+            return self.primary
+        return self.primary if _primary_reads.get() else self.replica
+
+
+engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL))
+# expire_on_commit=False: writes return their rows (RETURNING), so nothing
+# needs to be re-SELECTed after commit
+replica_engine = None
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(settings.DATABASE_REPLICA_URL, **pool_options(settings.DATABASE_REPLICA_URL))
+    SessionLocal = sessionmaker(class_=RoutingSession, primary=engine, replica=replica_engine,
+                                autocommit=False, autoflush=False, expire_on_commit=False)
+else:
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# The async engine is only built when requested so asyncpg/aiosqlite stay optional
+async_engine = None
+async_replica_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC_MODE:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL, is_async=True))
+    # expire_on_commit=False: expired attributes would need an implicit (blocking) reload
+    if settings.DATABASE_REPLICA_URL:
+        ASYNC_REPLICA_URL = to_async_url(settings.DATABASE_REPLICA_URL)
+        async_replica_engine = create_async_engine(ASYNC_REPLICA_URL, **pool_options(ASYNC_REPLICA_URL, is_async=True))
+        AsyncSessionLocal = async_sessionmaker(
+            sync_session_class=RoutingSession,
+            primary=async_engine.sync_engine, replica=async_replica_engine.sync_engine,
+            autoflush=False, expire_on_commit=False)
+    else:
+        AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
-def get_db():
+async def get_db():
+    """
+    Yields a request-scoped session.
+    AsyncSession when DB_ASYNC_MODE is on, otherwise the classic sync Session.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
     db = SessionLocal()
     try:
         yield db
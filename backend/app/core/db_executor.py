@@ -0,0 +1,96 @@
+# app/core/db_executor.py
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class BlockingCallPool:
+    """
+    Bounded thread pool for blocking sync-Session calls made from async
+    handlers (DB_SYNC_EXECUTION=threadpool), so one slow query occupies a
+    pool thread instead of the event loop.
+
+    Keep max_workers at or below the connection pool's capacity: a thread
+    beyond it would only wait for a connection. Calls submitted while every
+    thread is busy queue up and are counted as saturated.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.metrics = {"calls": 0, "saturated": 0, "peak_queued": 0, "total_wait_ms": 0.0, "max_wait_ms": 0.0}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{self.name}-io")
+        return self._executor
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        with self._lock:
+            self.metrics["calls"] += 1
+            if self.active + self.queued >= self.max_workers:
+                self.metrics["saturated"] += 1
+            self.queued += 1
+            self.metrics["peak_queued"] = max(self.metrics["peak_queued"], self.queued)
+        submitted = time.perf_counter()
+        # Carry the request's contextvars (structlog request_id) into the pool thread
+        call = functools.partial(contextvars.copy_context().run, self._call, submitted, fn, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+
+    def _call(self, submitted: float, fn: Callable, *args, **kwargs):
+        wait_ms = (time.perf_counter() - submitted) * 1000
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.metrics["total_wait_ms"] += wait_ms
+            self.metrics["max_wait_ms"] = max(self.metrics["max_wait_ms"], wait_ms)
+        if wait_ms > settings.DB_POOL_SLOW_CHECKOUT_MS:
+            logger.warning("db_threadpool_saturated", pool=self.name, wait_ms=round(wait_ms, 2), **self.stats())
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            calls = self.metrics["calls"]
+            return {
+                "max_workers": self.max_workers,
+                "active": self.active,
+                "queued": self.queued,
+                "calls": calls,
+                "saturated": self.metrics["saturated"],
+                "peak_queued": self.metrics["peak_queued"],
+                "avg_wait_ms": round(self.metrics["total_wait_ms"] / calls, 3) if calls else 0.0,
+                "max_wait_ms": round(self.metrics["max_wait_ms"], 3),
+            }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# One pool for every sync Session (primary and replica share the request's session)
+db_threadpool = BlockingCallPool("db", settings.DB_THREADPOOL_SIZE)
+
+POOLS: Dict[str, BlockingCallPool] = {db_threadpool.name: db_threadpool}
+
+
+async def run_blocking(fn: Callable, *args, **kwargs):
+    """Runs a blocking sync-Session call per DB_SYNC_EXECUTION: on db_threadpool, or inline."""
+    if settings.DB_SYNC_EXECUTION == "threadpool":
+        return await db_threadpool.run(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
@@ -0,0 +1,106 @@
+# app/core/db_pool.py
+
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class PoolMetrics:
+    """
+    Running counters for connection checkouts on a single pool.
+    Wait time covers the whole checkout: queueing for a free slot,
+    opening an overflow connection and the pre-ping.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def record_checkout(self, wait_ms: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            avg = self.total_wait_ms / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(avg, 3),
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times every checkout and reports exhaustion."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            logger.warning("db_pool_exhausted", **self.stats())
+            raise
+
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.metrics.record_checkout(wait_ms)
+        if wait_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS:
+            logger.warning("db_pool_slow_checkout", wait_ms=round(wait_ms, 3), **self.stats())
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            **self.metrics.snapshot(),
+        }
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """asyncio flavour used by the AsyncEngine."""
+
+
+def pool_options(url: str, is_async: bool = False) -> dict:
+    """
+    Engine keyword arguments for the configured pool.
+    SQLite keeps SQLAlchemy's default pool since sizing does not apply to it.
+    """
+    if url.startswith("sqlite"):
+        return {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def pool_stats(engine) -> dict:
+    """Live stats for an engine's pool; non-instrumented pools report status only."""
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.stats()
+    return {"status": pool.status()}
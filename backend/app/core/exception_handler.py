@@ -4,28 +4,8 @@ from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from app.utils.api_response import ApiResponse
 from app.core.logger import logger
-import time
 
-# ============================
-# Middleware: Request Logging
-# ============================
-
-async def log_requests_middleware(request: Request, call_next):
-    """Middleware to log all incoming requests and responses."""
-    start_time = time.time()
-    try:
-        logger.info(f"➡️  {request.method} {request.url.path}")
-        response = await call_next(request)
-    except Exception as exc:
-        logger.exception(f"🔥 Unhandled exception in {request.url.path}: {exc}")
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=ApiResponse.error("Internal server error", code=500).dict(),
-        )
-
-    process_time = (time.time() - start_time) * 1000
-    logger.info(f"⬅️  {request.method} {request.url.path} - {response.status_code} ({process_time:.2f}ms)")
-    return response
+# Request logging lives in app/core/middleware/log_context.py (one line per request)
 
 
 # ===========================================
@@ -35,10 +15,7 @@ async def log_requests_middleware(request: Request, call_next):
 async def global_exception_handler(request: Request, exc: Exception):
     """Catches all unhandled exceptions globally and logs them."""
     logger.exception(f"🌋 Global exception caught for {request.url.path}: {exc}")
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response("Unexpected server error", code=500).dict(),
-    )
+    return ApiResponse.error("Unexpected server error", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 # ===========================================
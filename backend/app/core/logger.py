@@ -9,8 +9,6 @@ from pythonjsonlogger import jsonlogger
 import hashlib
 
 LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
-
 LOG_FILE = LOG_DIR / "app.log"
 
 # ------------------------------------------------------------
@@ -57,49 +55,63 @@ def compare_log_files(file1: Path, file2: Path) -> bool:
 
 
 # ------------------------------------------------------------
-# 1️⃣ Configure standard logging handlers
+# Handlers are created on first configure_logging() call (app startup),
+# not at import, so importing app modules stays side-effect free.
+# Until then structlog's default config prints to stdout.
 # ------------------------------------------------------------
-log_level = logging.INFO
-
-# Custom rotating handler (10 MB max, 5 backups)
-file_handler = CompressedRotatingFileHandler(LOG_FILE, maxBytes=10 * 1024 * 1024, backupCount=5)
-console_handler = logging.StreamHandler(sys.stdout)
-
-# JSON formatter for structured logs
-json_formatter = jsonlogger.JsonFormatter(
-    fmt="%(asctime)s %(levelname)s %(name)s %(funcName)s %(lineno)d %(message)s"
-)
-file_handler.setFormatter(json_formatter)
-
-# Readable console logs
-console_formatter = logging.Formatter(
-    fmt="%(asctime)s | %(levelname)s | %(name)s:%(funcName)s:%(lineno)d - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-console_handler.setFormatter(console_formatter)
-
-logging.basicConfig(
-    level=log_level,
-    handlers=[file_handler, console_handler],
-)
+_configured = False
+
+
+def configure_logging():
+    """Creates the log directory, handlers and structlog config once per process."""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    # 1️⃣ Configure standard logging handlers
+    LOG_DIR.mkdir(exist_ok=True)
+    log_level = logging.INFO
+
+    # Custom rotating handler (10 MB max, 5 backups)
+    file_handler = CompressedRotatingFileHandler(LOG_FILE, maxBytes=10 * 1024 * 1024, backupCount=5)
+    console_handler = logging.StreamHandler(sys.stdout)
+
+    # JSON formatter for structured logs
+    json_formatter = jsonlogger.JsonFormatter(
+        fmt="%(asctime)s %(levelname)s %(name)s %(funcName)s %(lineno)d %(message)s"
+    )
+    file_handler.setFormatter(json_formatter)
+
+    # Readable console logs
+    console_formatter = logging.Formatter(
+        fmt="%(asctime)s | %(levelname)s | %(name)s:%(funcName)s:%(lineno)d - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    console_handler.setFormatter(console_formatter)
+
+    logging.basicConfig(
+        level=log_level,
+        handlers=[file_handler, console_handler],
+    )
+
+    # 2️⃣ Configure Structlog (structured, contextual logs)
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(),
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
+        cache_logger_on_first_use=True,
+    )
+
+    logger.info("✅ Structlog-based logger initialized with compression and hash checking.")
 
-# ------------------------------------------------------------
-# 2️⃣ Configure Structlog (structured, contextual logs)
-# ------------------------------------------------------------
-structlog.configure(
-    processors=[
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer(),
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.make_filtering_bound_logger(log_level),
-    cache_logger_on_first_use=True,
-)
 
 logger = structlog.get_logger("invoai")
-logger.info("✅ Structlog-based logger initialized with compression and hash checking.")
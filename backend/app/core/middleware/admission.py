@@ -0,0 +1,174 @@
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Optional
+from app.core.config import settings
+from app.utils.api_response import ApiResponse
+
+# (group, path prefix, methods) matched in order; None matches anything.
+# Paths outside every group (docs, /api/v1/internal stats) are never limited,
+# so the metrics stay reachable while the API sheds load.
+ROUTE_GROUPS = [
+    ("auth", "/api/v1/auth", None),
+    ("extraction", "/api/v1/extraction-jobs", None),
+    ("extraction", "/api/v1/extracted-json/export", None),
+    ("internal", "/api/v1/internal", None),
+    ("reads", "/api/", {"GET", "HEAD"}),
+    ("writes", "/api/", None),
+]
+
+# Additive increase: the limit grows by about one slot per `limit` fast responses
+# Multiplicative decrease: a slow response cuts it by this factor, at most once per target latency
+DECREASE_FACTOR = 0.9
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for one route group. Requests beyond the limit
+    wait in a bounded FIFO queue for at most queue_timeout_ms; when the
+    queue is full or the wait times out they are rejected immediately, so a
+    slow database turns into fast 503s instead of a growing backlog of
+    requests that will time out anyway.
+
+    The limit starts at max_limit and shrinks while responses are slower
+    than target_latency_ms, then grows back once they are fast again. Runs
+    on the worker's event loop only, so no locking is needed.
+    """
+
+    def __init__(self, name: str, max_limit: int, min_limit: int, target_latency_ms: float,
+                 max_queue: int, queue_timeout_ms: float):
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.target_latency_ms = target_latency_ms
+        self.max_queue = max_queue
+        self.queue_timeout_ms = queue_timeout_ms
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._waiters: deque = deque()
+        self._last_decrease = 0.0
+        self.metrics = {"admitted": 0, "queued": 0, "rejected": 0, "queue_timeouts": 0,
+                        "peak_in_flight": 0, "decreases": 0}
+
+    def _admit(self):
+        self.in_flight += 1
+        self.metrics["admitted"] += 1
+        self.metrics["peak_in_flight"] = max(self.metrics["peak_in_flight"], self.in_flight)
+
+    async def acquire(self) -> bool:
+        """True once the request holds a slot; False when it has to be shed."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self._admit()
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.metrics["rejected"] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.metrics["queued"] += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout_ms / 1000)
+            return True
+        except asyncio.TimeoutError:
+            if waiter.done():  # the slot was handed over as the wait timed out
+                return True
+            self._waiters.remove(waiter)
+            self.metrics["queue_timeouts"] += 1
+            self.metrics["rejected"] += 1
+            return False
+        except asyncio.CancelledError:  # client went away while queued
+            if waiter.done():
+                self.in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+                waiter.cancel()
+            raise
+
+    def _wake(self):
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._admit()
+                waiter.set_result(True)
+
+    def release(self, latency_ms: float):
+        self.in_flight -= 1
+        now = time.monotonic()
+        if latency_ms > self.target_latency_ms:
+            # One cut per latency window: a burst of slow responses is one signal, not many
+            if (now - self._last_decrease) * 1000 >= self.target_latency_ms:
+                self.limit = max(self.min_limit, self.limit * DECREASE_FACTOR)
+                self._last_decrease = now
+                self.metrics["decreases"] += 1
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._wake()
+
+    def stats(self) -> dict:
+        return {**self.metrics, "limit": round(self.limit, 2), "max_limit": self.max_limit,
+                "in_flight": self.in_flight, "queue_depth": len(self._waiters),
+                "target_latency_ms": self.target_latency_ms}
+
+
+def build_limiters() -> Dict[str, AdaptiveLimiter]:
+    return {
+        group: AdaptiveLimiter(group, max_limit, settings.ADMISSION_MIN_CONCURRENCY,
+                               settings.ADMISSION_TARGET_LATENCY_MS.get(group, 1000.0),
+                               settings.ADMISSION_MAX_QUEUE, settings.ADMISSION_QUEUE_TIMEOUT_MS)
+        for group, max_limit in settings.ADMISSION_MAX_CONCURRENCY.items()
+    }
+
+
+admission_limiters = build_limiters()
+
+
+def route_group(path: str, method: str) -> Optional[str]:
+    for group, prefix, methods in ROUTE_GROUPS:
+        if path.startswith(prefix) and (methods is None or method in methods):
+            return group
+    return None
+
+
+class AdmissionControlMiddleware:
+    """
+    Pure ASGI middleware: holds a slot of the request's route-group limiter
+    (see ROUTE_GROUPS) for the whole request, and answers 503 with
+    Retry-After without calling the app when no slot frees up in time.
+    Latency fed back to the limiter is measured to the start of the
+    response, so long streamed bodies (exports) do not read as slowness.
+    """
+
+    def __init__(self, app, limiters: Optional[Dict[str, AdaptiveLimiter]] = None):
+        self.app = app
+        self.limiters = admission_limiters if limiters is None else limiters
+
+    async def __call__(self, scope, receive, send):
+        limiter = None
+        if scope["type"] == "http" and settings.ADMISSION_CONTROL_ENABLED:
+            limiter = self.limiters.get(route_group(scope["path"], scope["method"]))
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            response = ApiResponse.error("Server is busy, try again shortly", 503)
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        latency_ms = None
+
+        async def send_timed(message):
+            nonlocal latency_ms
+            if message["type"] == "http.response.start":
+                latency_ms = (time.perf_counter() - started) * 1000
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            if latency_ms is None:
+                latency_ms = (time.perf_counter() - started) * 1000
+            limiter.release(latency_ms)
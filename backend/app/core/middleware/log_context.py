@@ -1,15 +1,45 @@
-import structlog
+import time
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
+import structlog
+from app.core.logger import logger
+
+
+class RequestContextLogMiddleware:
+    """
+    Pure ASGI middleware: binds request_id/path/method into the structlog
+    context for everything logged while the request runs, and writes one
+    `request` line with the status and duration once the response has been
+    sent (streamed bodies included).
+
+    Unlike BaseHTTPMiddleware it does not run the endpoint in a separate
+    task or buffer the body through a memory stream, so the per-request cost
+    is one wrapped `send`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class RequestContextLogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
         request_id = str(uuid.uuid4())
-        structlog.contextvars.bind_contextvars(
-            request_id=request_id,
-            path=str(request.url.path),
-            method=request.method,
-        )
-        response = await call_next(request)
-        structlog.contextvars.clear_contextvars()
-        return response
+        status_code = 500  # reported when the app raises before starting a response
+        started = time.perf_counter()
+
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"x-request-id", request_id.encode("ascii"))]
+            await send(message)
+
+        with structlog.contextvars.bound_contextvars(request_id=request_id, path=scope["path"],
+                                                     method=scope["method"]):
+            try:
+                await self.app(scope, receive, send_with_request_id)
+            finally:
+                logger.info("request", status=status_code,
+                            duration_ms=round((time.perf_counter() - started) * 1000, 2))
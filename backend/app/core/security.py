@@ -0,0 +1,96 @@
+# app/core/security.py
+
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+from passlib.context import CryptContext
+from app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt hash (same cost as pwd_context) of a random password nobody knows: unknown usernames
+# are verified against it so a failed login costs the same whether or not the user exists
+DUMMY_PASSWORD_HASH = "$2b$12$5PxKPsA3SZM6.4hI8m0Ete4ThFCTCVNQu1DwjqmzWacOYlQZ/ZlXO"
+
+
+def _prehash(password: str) -> str:
+    # SHA-256 first so passwords longer than bcrypt's 72-byte limit still count in full
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def hash_password_sync(password: str) -> str:
+    return pwd_context.hash(_prehash(password))
+
+
+def verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(_prehash(plain_password), hashed_password)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when PASSWORD_HASH_MAX_PENDING calls are already queued or running."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt (~100-300 ms of CPU per call) on a bounded process pool so
+    logins never block the event loop or hold the GIL against other requests.
+
+    At most max_pending calls may be queued or running per worker; beyond
+    that calls fail fast with PasswordHasherBusy (a 503 for the client)
+    instead of piling up behind each other. workers=0 runs bcrypt inline,
+    for scripts and tests.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self.metrics = {"completed": 0, "failed": 0, "rejected": 0, "peak_pending": 0}
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # spawn: never fork a process that already holds DB connections and logging threads
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self.workers == 0:
+            return fn(*args)
+        if self._pending >= self.max_pending:
+            self.metrics["rejected"] += 1
+            raise PasswordHasherBusy(f"{self._pending} password hashes already pending")
+
+        self._pending += 1
+        self.metrics["peak_pending"] = max(self.metrics["peak_pending"], self._pending)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        except (Exception, asyncio.CancelledError):  # a raising hash, a broken pool, a cancelled request
+            self.metrics["failed"] += 1
+            raise
+        else:
+            self.metrics["completed"] += 1
+            return result
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password_sync, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password_sync, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        return {**self.metrics, "pending": self._pending, "workers": self.workers,
+                "max_pending": self.max_pending}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
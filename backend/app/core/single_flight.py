@@ -0,0 +1,90 @@
+# app/core/single_flight.py
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Optional
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class _LeaderCancelled(Exception):
+    """The request running the shared call went away; waiters run their own."""
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls in one worker: the first caller for
+    a key (the leader) runs the loader, later callers await its result
+    instead of issuing the same query on another pooled connection.
+
+    A waiter gives up after the per-key timeout (COALESCE_TIMEOUT_SECONDS
+    unless the caller passes one) and runs the loader itself, so a slow
+    leader never holds everyone else hostage.
+    """
+
+    def __init__(self, name: str, timeout_seconds: float = settings.COALESCE_TIMEOUT_SECONDS):
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.metrics = {"leaders": 0, "deduplicated": 0, "timeouts": 0, "retried": 0}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable],
+                 timeout_seconds: Optional[float] = None):
+        if not settings.COALESCE_ENABLED:
+            return await loader()
+
+        future = self._calls.get(key)
+        if future is not None:
+            return await self._wait(key, future, loader, timeout_seconds or self.timeout_seconds)
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the outcome as retrieved even when nobody waited for it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        self.metrics["leaders"] += 1
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    async def _wait(self, key, future, loader, timeout_seconds):
+        self.metrics["deduplicated"] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout_seconds)
+        except asyncio.TimeoutError:
+            self.metrics["timeouts"] += 1
+            logger.warning("single_flight_timeout", name=self.name, key=str(key), timeout_seconds=timeout_seconds)
+        except _LeaderCancelled:
+            self.metrics["retried"] += 1
+        return await loader()
+
+    def forget(self, keys: Optional[Iterable[Hashable]] = None):
+        """
+        Detaches in-flight calls (all of them when keys is None) after a
+        write, so later callers start a fresh load instead of joining one
+        that may have read the old rows. Current waiters still get it.
+        """
+        if keys is None:
+            self._calls.clear()
+            return
+        for key in keys:
+            self._calls.pop(key, None)
+
+    def reset_stats(self):
+        self.metrics = dict.fromkeys(self.metrics, 0)
+
+    def stats(self) -> dict:
+        return {**self.metrics, "in_flight": self.in_flight}
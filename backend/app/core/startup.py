@@ -0,0 +1,79 @@
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict
+from app.core.config import settings
+from app.core.logger import logger
+
+# backend/alembic
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+class MigrationsOutOfDate(RuntimeError):
+    """Raised at boot when the database is not at the Alembic head revision."""
+
+
+class StartupTimer:
+    """
+    Collects per-phase durations of worker startup and reports them against
+    STARTUP_BUDGET_MS, so cold-start regressions show up in the boot log.
+    """
+
+    def __init__(self, started_at: float = None):
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - started) * 1000, 2)
+
+    def report(self) -> dict:
+        total_ms = round((time.perf_counter() - self.started_at) * 1000, 2)
+        report = {"total_ms": total_ms, "budget_ms": settings.STARTUP_BUDGET_MS, "phases": self.phases}
+        if total_ms > settings.STARTUP_BUDGET_MS:
+            logger.warning("startup_budget_exceeded", **report)
+        else:
+            logger.info("startup_complete", **report)
+        return report
+
+
+def check_migrations(engine) -> str:
+    """
+    Verifies the database is at the Alembic head without touching any table
+    but alembic_version. Returns the current revision.
+    """
+    # Alembic is only needed at boot, keep it out of the import path
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    expected = set(ScriptDirectory.from_config(config).get_heads())
+
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={"version_table_schema": settings.DB_SCHEMA})
+        current = set(context.get_current_heads())
+
+    if current != expected:
+        raise MigrationsOutOfDate(
+            f"Database revision {sorted(current) or 'none'} does not match Alembic head {sorted(expected)}; "
+            f"run 'alembic upgrade head' before starting the API")
+    return ", ".join(sorted(current))
+
+
+def prepare_database(engine):
+    """Runs the DB_STARTUP_MODE check once per worker."""
+    if settings.DB_STARTUP_MODE == "check_migrations":
+        revision = check_migrations(engine)
+        logger.info("db_migrations_checked", revision=revision)
+    elif settings.DB_STARTUP_MODE == "create_all":
+        from app.core.database import Base
+        import app.models  # noqa: F401  register all tables on Base.metadata
+
+        Base.metadata.create_all(bind=engine)
+        logger.info("✅ Database tables created and engine initialized.")
@@ -0,0 +1,212 @@
+"""
+Partition maintenance for invoai.tb_inai_extracted_json (monthly RANGE
+partitions on created_at, see alembic revision 5b1e0c7a9d24).
+
+Pre-creates the partitions for the coming months so inserts never hit a
+missing range, and detaches partitions older than the retention window.
+Detached partitions are moved to the archive schema (or dropped with
+--drop-expired), so retention is a metadata operation instead of a mass
+DELETE.
+
+If this command stops running for longer than the months it pre-creates,
+inserts still succeed: rows without a monthly partition land in the
+DEFAULT partition (alembic revision b9f3c6d2e8a4). Creating a month that
+the DEFAULT partition already holds rows for would fail, so each run
+checks it first: every month found there gets its partition, created in
+one transaction that detaches the DEFAULT partition, moves the month's
+rows over and attaches it again (inserts wait on the parent's lock
+meanwhile). Past months are recovered the same way and then detached
+with the rest once they fall outside the retention window. PostgreSQL
+refuses DETACH ... CONCURRENTLY while a DEFAULT partition exists, so
+expired partitions are then detached with a plain DETACH, each in its own
+transaction.
+
+Usage (from backend/, e.g. daily from cron):
+    python -m app.maintenance.partitions
+    python -m app.maintenance.partitions --months-ahead 6 --retention-months 36 --dry-run
+"""
+import argparse
+import re
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.logger import logger
+
+PARENT_TABLE = "tb_inai_extracted_json"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_PATTERN = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    match = PARTITION_PATTERN.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def plan(today: date, existing: List[str], months_ahead: int,
+         retention_months: int, default_months: Iterable[date] = ()) -> Tuple[List[date], List[str]]:
+    """
+    Returns (months to create, partitions to detach). Keeps the current
+    month plus months_ahead future months, and the retention_months most
+    recent months (including the current one). default_months (months
+    holding rows in the DEFAULT partition) are always created, and detached
+    in the same run when already expired. Names that do not follow the
+    monthly pattern are never touched.
+    """
+    if retention_months < 1:
+        raise ValueError("retention_months must keep at least the current month")
+
+    current = month_start(today)
+    wanted = {add_months(current, i) for i in range(months_ahead + 1)} | set(default_months)
+    present = {partition_month(name) for name in existing}
+    to_create = sorted(month for month in wanted if month not in present)
+
+    oldest_kept = add_months(current, -(retention_months - 1))
+    names = list(existing) + [partition_name(month) for month in to_create]
+    to_detach = sorted(name for name in names
+                       if partition_month(name) is not None and partition_month(name) < oldest_kept)
+    return to_create, to_detach
+
+
+def existing_partitions(conn, schema: str) -> List[str]:
+    rows = conn.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "JOIN pg_namespace ns ON ns.oid = parent.relnamespace "
+        "WHERE parent.relname = :parent AND ns.nspname = :schema"
+    ), {"parent": PARENT_TABLE, "schema": schema}).scalars().all()
+    return list(rows)
+
+
+def default_partition_months(conn, schema: str) -> List[date]:
+    rows = conn.execute(text(
+        f'SELECT DISTINCT date_trunc(\'month\', created_at)::date FROM "{schema}"."{DEFAULT_PARTITION}"'
+    )).scalars().all()
+    return sorted(rows)
+
+
+def create_partition_sql(schema: str, month: date) -> str:
+    return (f'CREATE TABLE IF NOT EXISTS "{schema}"."{partition_name(month)}" '
+            f'PARTITION OF "{schema}"."{PARENT_TABLE}" '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')")
+
+
+def move_from_default_sql(schema: str, month: date) -> List[str]:
+    """
+    One transaction creating the month's partition while the DEFAULT
+    partition holds rows for it: PostgreSQL refuses the new partition as
+    long as the DEFAULT one contains rows of its range.
+    """
+    parent, default = f'"{schema}"."{PARENT_TABLE}"', f'"{schema}"."{DEFAULT_PARTITION}"'
+    return [
+        f"ALTER TABLE {parent} DETACH PARTITION {default}",
+        create_partition_sql(schema, month),
+        f"WITH moved AS (DELETE FROM {default} WHERE created_at >= '{month.isoformat()}' "
+        f"AND created_at < '{add_months(month, 1).isoformat()}' RETURNING *) "
+        f"INSERT INTO {parent} SELECT * FROM moved",
+        f"ALTER TABLE {parent} ATTACH PARTITION {default} DEFAULT",
+    ]
+
+
+def detach_partition_sql(schema: str, name: str, archive_schema: Optional[str],
+                         concurrently: bool = True) -> List[str]:
+    # CONCURRENTLY (PostgreSQL 14+) only takes a SHARE UPDATE EXCLUSIVE lock on the parent,
+    # but PostgreSQL refuses it while the parent has a DEFAULT partition
+    detach = f'ALTER TABLE "{schema}"."{PARENT_TABLE}" DETACH PARTITION "{schema}"."{name}"'
+    statements = [f"{detach} CONCURRENTLY" if concurrently else detach]
+    if archive_schema:
+        statements.append(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"')
+        statements.append(f'ALTER TABLE "{schema}"."{name}" SET SCHEMA "{archive_schema}"')
+    else:
+        statements.append(f'DROP TABLE "{schema}"."{name}"')
+    return statements
+
+
+def maintenance_steps(schema: str, existing: List[str], to_create: List[date], to_detach: List[str],
+                      archive_schema: Optional[str], default_months: Iterable[date] = ()) -> list:
+    """
+    Each step is one statement run on its own, or a list of statements run
+    as one transaction. With a DEFAULT partition, detaches cannot use
+    CONCURRENTLY: each becomes a plain DETACH (ACCESS EXCLUSIVE on the
+    parent for the duration of its transaction) instead.
+    """
+    default_months = set(default_months)
+    steps: list = [move_from_default_sql(schema, month) if month in default_months
+                   else create_partition_sql(schema, month) for month in to_create]
+    concurrently = DEFAULT_PARTITION not in existing
+    for name in to_detach:
+        statements = detach_partition_sql(schema, name, archive_schema, concurrently)
+        if concurrently:
+            steps.extend(statements)
+        else:
+            steps.append(statements)
+    return steps
+
+
+def run_maintenance(engine, months_ahead: int, retention_months: int,
+                    archive_schema: Optional[str], dry_run: bool = False,
+                    today: Optional[date] = None) -> dict:
+    schema = settings.DB_SCHEMA
+    if engine.dialect.name != "postgresql":
+        logger.info("partition_maintenance_skipped", dialect=engine.dialect.name)
+        return {"created": [], "detached": [], "recovered_from_default": [],
+                "archive_schema": archive_schema, "dry_run": dry_run}
+
+    # DETACH ... CONCURRENTLY cannot run inside a transaction block, so single
+    # statements autocommit and only multi-statement steps open a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        existing = existing_partitions(conn, schema)
+        default_months = default_partition_months(conn, schema) if DEFAULT_PARTITION in existing else []
+        if default_months:
+            logger.warning("partition_rows_in_default", months=[m.isoformat() for m in default_months])
+        to_create, to_detach = plan(today or date.today(), existing, months_ahead, retention_months,
+                                    default_months)
+        steps = maintenance_steps(schema, existing, to_create, to_detach, archive_schema, default_months)
+
+        for step in steps:
+            if dry_run:
+                print("\n".join(["BEGIN;", *(s + ";" for s in step), "COMMIT;"]) if isinstance(step, list)
+                      else step + ";")
+            elif isinstance(step, list):
+                with engine.begin() as tx:
+                    for statement in step:
+                        tx.execute(text(statement))
+            else:
+                conn.execute(text(step))
+
+    summary = {"created": [partition_name(m) for m in to_create], "detached": to_detach,
+               "recovered_from_default": [partition_name(m) for m in default_months],
+               "archive_schema": archive_schema, "dry_run": dry_run}
+    logger.info("partition_maintenance", **summary)
+    return summary
+
+
+if __name__ == "__main__":
+    from app.core.database import engine
+    from app.core.logger import configure_logging
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--months-ahead", type=int, default=settings.EXTRACTED_JSON_PARTITION_MONTHS_AHEAD)
+    parser.add_argument("--retention-months", type=int, default=settings.EXTRACTED_JSON_RETENTION_MONTHS)
+    parser.add_argument("--archive-schema", default=settings.EXTRACTED_JSON_ARCHIVE_SCHEMA)
+    parser.add_argument("--drop-expired", action="store_true", help="drop expired partitions instead of archiving")
+    parser.add_argument("--dry-run", action="store_true", help="print the DDL without running it")
+    args = parser.parse_args()
+
+    configure_logging()
+    run_maintenance(engine, args.months_ahead, args.retention_months,
+                    None if args.drop_expired else args.archive_schema, dry_run=args.dry_run)
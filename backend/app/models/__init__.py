@@ -3,3 +3,4 @@ from app.models.vendor_model import Vendor
 from app.models.extraction_model import Extraction
 from app.models.extracted_json_model import ReturnJson
 from app.models.log_model import Log
+from app.models.extraction_job_model import ExtractionJob
@@ -1,17 +1,36 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, JSON
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, JSON, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
 class ReturnJson(Base):
+    # On PostgreSQL the table is PARTITION BY RANGE (created_at), one partition
+    # per month (alembic 5b1e0c7a9d24, app.maintenance.partitions), with
+    # PRIMARY KEY (return_id, created_at). return_id alone stays unique (serial),
+    # so the ORM keeps it as the identity.
     __tablename__ = "tb_inai_extracted_json"
-    __table_args__ = {"schema": "invoai"}
+    __table_args__ = (
+        # Date-range filters / export per vendor
+        Index("ix_invoai_tb_inai_extracted_json_vendor_created_active", "vendor_id", "created_at",
+              postgresql_where=text("is_deleted = 0"), sqlite_where=text("is_deleted = 0")),
+        # Keyset pages per vendor (ORDER BY return_id DESC)
+        Index("ix_invoai_tb_inai_extracted_json_vendor_return_active", "vendor_id", "return_id",
+              postgresql_where=text("is_deleted = 0"), sqlite_where=text("is_deleted = 0")),
+        # Serves @> containment and the equality (==) conditions of @@ jsonpath predicates, Postgres only
+        Index("ix_invoai_tb_inai_extracted_json_extracted_json_gin", "extracted_json",
+              postgresql_using="gin", postgresql_ops={"extracted_json": "jsonb_path_ops"}
+              ).ddl_if(dialect="postgresql"),
+        {"schema": "invoai"},
+    )
 
     return_id = Column(Integer, primary_key=True, index=True)
     invoice_number = Column(String(30))
-    extracted_json = Column(JSON)
+    extracted_json = Column(JSON().with_variant(JSONB(), "postgresql"))
     vendor_id = Column(Integer, ForeignKey("invoai.tb_inai_mas_vendor.vendor_id"))
     created_by = Column(Integer)
-    created_at = Column(TIMESTAMP(timezone=False))
+    created_at = Column(TIMESTAMP(timezone=False), nullable=False, default=datetime.now)  # partition key
+    updated_at = Column(TIMESTAMP(timezone=False))
     is_deleted = Column(Integer, default=0)
 
     vendor = relationship("Vendor", backref="extracted_invoices")
@@ -0,0 +1,43 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, LargeBinary, ForeignKey, Index, text
+from sqlalchemy.orm import deferred
+from app.core.database import Base
+
+# Job lifecycle: queued -> running -> succeeded | failed (running -> queued again on a retry)
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+
+class ExtractionJob(Base):
+    """
+    Queue row for one invoice extraction. A job is claimable while it is
+    queued or running with available_at in the past: claiming moves
+    available_at forward by the visibility timeout, so the job of a worker
+    that died mid-run becomes claimable again on its own.
+    """
+    __tablename__ = "tb_inai_extraction_job"
+    __table_args__ = (
+        # Claim query: oldest claimable job first
+        Index("ix_invoai_tb_inai_extraction_job_available_pending", "available_at",
+              postgresql_where=text("status IN ('queued', 'running')"),
+              sqlite_where=text("status IN ('queued', 'running')")),
+        {"schema": "invoai"},
+    )
+
+    job_id = Column(Integer, primary_key=True, index=True)
+    vendor_id = Column(Integer, ForeignKey("invoai.tb_inai_mas_vendor.vendor_id"))
+    file_name = Column(String(255))
+    content_type = Column(String(100), nullable=False)
+    # Loaded only by the worker that runs the job; cleared once the job is finished
+    document = deferred(Column(LargeBinary))
+    status = Column(String(20), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    available_at = Column(TIMESTAMP(timezone=False), nullable=False, default=datetime.now)
+    locked_by = Column(String(64))
+    # No FK: tb_inai_extracted_json is partitioned with PRIMARY KEY (return_id, created_at)
+    return_id = Column(Integer)
+    error = Column(Text)
+    created_by = Column(Integer)
+    created_at = Column(TIMESTAMP(timezone=False), nullable=False, default=datetime.now)
+    updated_at = Column(TIMESTAMP(timezone=False))
+    finished_at = Column(TIMESTAMP(timezone=False))
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
 class Extraction(Base):
     __tablename__ = "tb_inai_extraction_details"
-    __table_args__ = {"schema": "invoai"}
+    __table_args__ = (
+        Index("ix_invoai_tb_inai_extraction_details_vendor_id_active", "vendor_id",
+              postgresql_where=text("is_deleted = 0"), sqlite_where=text("is_deleted = 0")),
+        {"schema": "invoai"},
+    )
 
     extraction_id = Column(Integer, primary_key=True, index=True)
     extraction_name = Column(String(50), nullable=False)
@@ -1,9 +1,17 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP
+from sqlalchemy import Column, Integer, String, TIMESTAMP, Index, text
 from app.core.database import Base
 
 class User(Base):
     __tablename__ = "tb_inai_mas_user"
-    __table_args__ = {"schema": "invoai"}
+    __table_args__ = (
+        # Partial indexes: every lookup also filters out soft-deleted rows.
+        # Active usernames are unique; deleted users keep theirs without blocking reuse.
+        Index("uq_invoai_tb_inai_mas_user_user_name_active", "user_name", unique=True,
+              postgresql_where=text("is_deleted = 0"), sqlite_where=text("is_deleted = 0")),
+        Index("ix_invoai_tb_inai_mas_user_bio_id_active", "bio_id",
+              postgresql_where=text("is_deleted = 0"), sqlite_where=text("is_deleted = 0")),
+        {"schema": "invoai"},
+    )
     
     user_id = Column(Integer, primary_key=True, index=True)
     bio_id = Column(Integer)
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import insert, lambda_stmt, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from app.models.user_model import User
@@ -6,7 +6,7 @@ from app.models.log_model import Log
 from app.repositories.base_repository import BaseRepository
 from app.core.logger import logger
 from app.core.result import Result
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -17,9 +17,11 @@ class AuthRepository(BaseRepository):
     """
 
     async def verify_user(self, user_name: str) -> Result:
+        """The active user with this name; at most one exists (unique partial index)."""
         try:
-            user = self.db.query(User).filter(
-                User.user_name == user_name, User.is_deleted == 0).first()
+            # lambda_stmt: built and compiled once, user_name is extracted as a bound parameter
+            user = (await self.execute(lambda_stmt(
+                lambda: select(User).where(User.user_name == user_name, User.is_deleted == 0)))).scalars().first()
             if not user:
                 return Result.Fail(f"User '{user_name}' not found", code=404)
             return Result.Ok(data=user)
@@ -31,21 +33,20 @@ class AuthRepository(BaseRepository):
         try:
             log = Log(user_id=user_id, login_time=login_time)
             self.add(log)
-            self.commit()
-            self.refresh(log)
+            await self.commit()
             return Result.Ok(data=log)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception("Database error while saving login log.")
             return Result.Fail("Database error while saving login log", code=500)
 
-    async def get_users_by_username(self, user_name: str) -> Result:
+    async def save_login_logs(self, rows: List[dict]) -> Result:
+        """Writes a batch of login rows with one multi-row INSERT in one transaction."""
         try:
-            users = await self.session.execute(
-                select(User).where(User.user_name ==
-                                   user_name, User.is_deleted == 0)
-            )
-            return Result.Ok(users.scalars().all())
-        except SQLAlchemyError as e:
-            logger.exception("Error fetching users by username.")
-            return Result.Fail("Database error", code=500)
+            await self.execute(insert(Log).values(rows))
+            await self.commit()
+            return Result.Ok(data=len(rows))
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception(f"Database error while saving {len(rows)} login logs.")
+            return Result.Fail("Database error while saving login logs", code=500)
@@ -1,44 +1,167 @@
+import json
+from typing import Optional, Union
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from app.core.db_executor import run_blocking
 from app.core.logger import logger
+from app.utils.pagination import Page, TotalMode, encode_cursor, decode_cursor
 
 
 class BaseRepository:
     """
     Base repository that wraps SQLAlchemy Session with safe commit/rollback operations.
+    Works with both the sync Session and AsyncSession; all I/O goes through the
+    awaitable helpers below so derived repositories never block the event loop:
+    AsyncSession awaits the driver, and sync Session calls are dispatched per
+    DB_SYNC_EXECUTION (the bounded db_threadpool by default).
     Provides consistent exception-only logging for derived repositories.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Union[Session, AsyncSession]):
         self.db = db
+        self.is_async = isinstance(db, AsyncSession)
+
+    async def execute(self, statement, params=None):
+        if self.is_async:
+            return await self.db.execute(statement, params)
+        return await run_blocking(self.db.execute, statement, params)
+
+    async def get_active(self, model, key):
+        """
+        Primary-key lookup through Session.get: served from the identity map
+        without SQL when the session already holds the row, otherwise one
+        SELECT from the ORM's cached PK statement (no per-call query
+        construction). Soft-deleted rows are treated as missing.
+        """
+        entity = await self.db.get(model, key) if self.is_async else await run_blocking(self.db.get, model, key)
+        if entity is None or entity.is_deleted:
+            return None
+        return entity
+
+    @property
+    def dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    def dialect_insert(self, model):
+        """insert() construct with ON CONFLICT support for the bound dialect."""
+        if self.dialect_name == "postgresql":
+            return postgresql.insert(model)
+        if self.dialect_name == "sqlite":
+            return sqlite.insert(model)
+        raise NotImplementedError(f"ON CONFLICT is not supported for dialect '{self.dialect_name}'")
+
+    async def count(self, statement) -> int:
+        """Exact COUNT(*) over the statement's filters, without fetching rows."""
+        count_stmt = select(func.count()).select_from(statement.order_by(None).subquery())
+        return (await self.execute(count_stmt)).scalar_one()
+
+    async def estimate_count(self, statement) -> int:
+        """
+        Row estimate from the PostgreSQL planner (EXPLAIN, table statistics);
+        costs no scan, but is only as fresh as the last ANALYZE. Other
+        dialects fall back to the exact count.
+        """
+        if self.dialect_name != "postgresql":
+            return await self.count(statement)
+
+        conn = await self.db.connection() if self.is_async else await run_blocking(self.db.connection)
+        compiled = statement.order_by(None).compile(dialect=conn.dialect)
+        params = (tuple(compiled.params[name] for name in compiled.positiontup)
+                  if compiled.positional else compiled.params)
+        sql = "EXPLAIN (FORMAT JSON) " + str(compiled)
+        if self.is_async:
+            result = await conn.exec_driver_sql(sql, params)
+        else:
+            result = await run_blocking(conn.exec_driver_sql, sql, params)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def fetch_page(self, statement, key_column, limit: int,
+                         after: Optional[str] = None, descending: bool = False,
+                         total: TotalMode = "none") -> Page:
+        """
+        Keyset pagination: seeks past the cursor on an indexed, unique key
+        instead of OFFSET, so every page costs the same regardless of depth.
+        Fetches one extra row to know whether a next page exists.
+        `total` counts the whole filtered set (all pages), see TotalMode.
+        """
+        count = None
+        if total == "exact":
+            count = await self.count(statement)
+        elif total == "estimated":
+            count = await self.estimate_count(statement)
+
+        if after:
+            last_key = decode_cursor(after)
+            statement = statement.where(key_column < last_key if descending else key_column > last_key)
+
+        statement = statement.order_by(key_column.desc() if descending else key_column.asc())
+        rows = (await self.execute(statement.limit(limit + 1))).scalars().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(getattr(rows[-1], key_column.key))
+        return Page(items=rows, next_cursor=next_cursor, total=count)
+
+    async def update_returning(self, model, key_column, key, values: dict):
+        """
+        UPDATE ... WHERE key = :key AND is_deleted = 0 RETURNING *, then commit.
+        Replaces the SELECT (get_by_id) + UPDATE + SELECT (refresh) sequence
+        with one round-trip. Returns the updated entity, or None when no live
+        row matched.
+        """
+        stmt = (
+            update(model)
+            .where(key_column == key, model.is_deleted == 0)
+            .values(**values)
+            .returning(model)
+            .execution_options(synchronize_session="fetch")
+        )
+        entity = (await self.execute(stmt)).scalars().first()
+        await self.commit()
+        return entity
 
     def add(self, entity):
         try:
             self.db.add(entity)
             return entity
         except SQLAlchemyError as e:
-            self.db.rollback()
             logger.exception(f"Error adding entity: {e}")
             raise
 
-    def commit(self):
+    async def commit(self):
         try:
-            self.db.commit()
+            if self.is_async:
+                await self.db.commit()
+            else:
+                await run_blocking(self.db.commit)
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.rollback()
             logger.exception(f"Error committing transaction: {e}")
             raise
 
-    def rollback(self):
+    async def rollback(self):
         try:
-            self.db.rollback()
+            if self.is_async:
+                await self.db.rollback()
+            else:
+                await run_blocking(self.db.rollback)
         except Exception as e:
             logger.exception(f"Error during rollback: {e}")
             raise
 
-    def refresh(self, entity):
+    async def refresh(self, entity):
         try:
-            self.db.refresh(entity)
+            if self.is_async:
+                await self.db.refresh(entity)
+            else:
+                await run_blocking(self.db.refresh, entity)
             return entity
         except SQLAlchemyError as e:
             logger.exception(f"Error refreshing entity: {e}")
@@ -1,8 +1,17 @@
+from datetime import datetime
+from typing import AsyncIterator, Iterator, List, Optional
+from sqlalchemy import select, cast
+from sqlalchemy.dialects.postgresql import JSONPATH
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.extracted_json_model import ReturnJson
 from app.repositories.base_repository import BaseRepository
 from app.core.logger import logger
 from app.core.result import Result
+from app.utils.json_filter import JsonPredicate
+from app.utils.pagination import DEFAULT_PAGE_SIZE, InvalidCursor, Page, TotalMode, encode_cursor
+
+# Rows evaluated per round-trip by the Python fallback of query_by_json
+JSON_SCAN_BATCH_SIZE = 500
 
 
 class ReturnJsonRepository(BaseRepository):
@@ -11,18 +20,132 @@ class ReturnJsonRepository(BaseRepository):
     Logging is limited to exceptions only.
     """
 
-    async def get_all(self) -> Result:
+    async def get_all(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                      vendor_id: Optional[int] = None,
+                      created_from: Optional[datetime] = None,
+                      created_to: Optional[datetime] = None,
+                      invoice_number_prefix: Optional[str] = None,
+                      total: TotalMode = "none") -> Result:
+        """
+        Newest first. return_id follows insertion order, so it doubles as the
+        created_at ordering while staying unique for the keyset.
+        created_from/created_to also prune the monthly partitions on PostgreSQL.
+        """
         try:
-            records = self.db.query(ReturnJson).filter(ReturnJson.is_deleted == 0).all()
-            return Result.Ok(data=records)
+            stmt = select(ReturnJson).where(ReturnJson.is_deleted == 0)
+            if vendor_id is not None:
+                stmt = stmt.where(ReturnJson.vendor_id == vendor_id)
+            if created_from:
+                stmt = stmt.where(ReturnJson.created_at >= created_from)
+            if created_to:
+                stmt = stmt.where(ReturnJson.created_at < created_to)
+            if invoice_number_prefix:
+                stmt = stmt.where(ReturnJson.invoice_number.startswith(invoice_number_prefix, autoescape=True))
+
+            page = await self.fetch_page(stmt, ReturnJson.return_id, limit, after, descending=True, total=total)
+            return Result.Ok(data=page)
+        except InvalidCursor as e:
+            return Result.Fail(str(e), code=400)
         except SQLAlchemyError:
             logger.exception("Database error while fetching return JSON records.")
             return Result.Fail("Database error while fetching return JSON records", code=500)
 
+    async def query_by_json(self, predicates: List[JsonPredicate],
+                            limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                            vendor_id: Optional[int] = None,
+                            created_from: Optional[datetime] = None,
+                            created_to: Optional[datetime] = None) -> Result:
+        """
+        Filters on values inside extracted_json, newest first like get_all.
+        Postgres evaluates each predicate as a jsonpath (@@); the GIN index
+        narrows the rows for equality predicates only, so range predicates
+        are filtered row by row over whatever the other filters select. Other
+        dialects (SQLite) walk the keyset in batches and evaluate
+        the predicates in Python.
+        """
+        try:
+            stmt = select(ReturnJson).where(ReturnJson.is_deleted == 0)
+            if vendor_id is not None:
+                stmt = stmt.where(ReturnJson.vendor_id == vendor_id)
+            if created_from:
+                stmt = stmt.where(ReturnJson.created_at >= created_from)
+            if created_to:
+                stmt = stmt.where(ReturnJson.created_at < created_to)
+
+            if self.dialect_name == "postgresql":
+                for predicate in predicates:
+                    stmt = stmt.where(ReturnJson.extracted_json.bool_op("@@")(
+                        cast(predicate.to_jsonpath(), JSONPATH)))
+                page = await self.fetch_page(stmt, ReturnJson.return_id, limit, after, descending=True)
+            else:
+                page = await self._scan_json_page(stmt, predicates, limit, after)
+            return Result.Ok(data=page)
+        except InvalidCursor as e:
+            return Result.Fail(str(e), code=400)
+        except SQLAlchemyError:
+            logger.exception("Database error while querying return JSON records.")
+            return Result.Fail("Database error while querying return JSON records", code=500)
+
+    async def _scan_json_page(self, stmt, predicates: List[JsonPredicate],
+                              limit: int, after: Optional[str]) -> Page:
+        matched = []
+        cursor = after
+        while len(matched) <= limit:
+            batch = await self.fetch_page(stmt, ReturnJson.return_id, JSON_SCAN_BATCH_SIZE, cursor, descending=True)
+            matched.extend(r for r in batch.items if all(p.matches(r.extracted_json) for p in predicates))
+            if batch.next_cursor is None:
+                break
+            cursor = batch.next_cursor
+
+        next_cursor = None
+        if len(matched) > limit:
+            matched = matched[:limit]
+            next_cursor = encode_cursor(matched[-1].return_id)
+        return Page(items=matched, next_cursor=next_cursor)
+
+    def export_statement(self, vendor_id: Optional[int] = None,
+                         created_from: Optional[datetime] = None,
+                         created_to: Optional[datetime] = None,
+                         after_id: Optional[int] = None,
+                         batch_size: int = 1000):
+        """
+        Column-only select for bulk export, ordered by return_id so an
+        interrupted export can resume with after_id. yield_per turns on a
+        server-side cursor (stream_results) so rows arrive in fixed batches.
+        """
+        stmt = select(
+            ReturnJson.return_id,
+            ReturnJson.invoice_number,
+            ReturnJson.vendor_id,
+            ReturnJson.created_by,
+            ReturnJson.created_at,
+            ReturnJson.extracted_json,
+        ).where(ReturnJson.is_deleted == 0)
+        if vendor_id is not None:
+            stmt = stmt.where(ReturnJson.vendor_id == vendor_id)
+        if created_from:
+            stmt = stmt.where(ReturnJson.created_at >= created_from)
+        if created_to:
+            stmt = stmt.where(ReturnJson.created_at < created_to)
+        if after_id is not None:
+            stmt = stmt.where(ReturnJson.return_id > after_id)
+        return stmt.order_by(ReturnJson.return_id).execution_options(yield_per=batch_size)
+
+    def iter_export(self, **filters) -> Iterator[List]:
+        """Batches of export rows for a sync Session (run from a worker thread)."""
+        result = self.db.execute(self.export_statement(**filters))
+        for rows in result.mappings().partitions():
+            yield rows
+
+    async def aiter_export(self, **filters) -> AsyncIterator[List]:
+        """Batches of export rows for an AsyncSession."""
+        result = await self.db.stream(self.export_statement(**filters))
+        async for rows in result.mappings().partitions():
+            yield rows
+
     async def get_by_id(self, return_id: int) -> Result:
         try:
-            record = self.db.query(ReturnJson).filter(
-                ReturnJson.return_id == return_id, ReturnJson.is_deleted == 0).first()
+            record = await self.get_active(ReturnJson, return_id)
             if not record:
                 return Result.Fail(f"Return JSON {return_id} not found", code=404)
             return Result.Ok(data=record)
@@ -33,20 +156,32 @@ class ReturnJsonRepository(BaseRepository):
     async def create(self, record: ReturnJson) -> Result:
         try:
             self.add(record)
-            self.commit()
-            self.refresh(record)
+            await self.commit()
             return Result.Ok(data=record)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception("Error creating return JSON.")
             return Result.Fail("Database error while creating return JSON", code=500)
 
     async def update(self, record: ReturnJson) -> Result:
         try:
-            self.commit()
-            self.refresh(record)
+            await self.commit()
             return Result.Ok(data=record)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception("Error updating return JSON.")
             return Result.Fail("Database error while updating return JSON", code=500)
+
+    async def update_by_id(self, return_id: int, values: dict) -> Result:
+        try:
+            record = await self.update_returning(ReturnJson, ReturnJson.return_id, return_id, values)
+            if not record:
+                return Result.Fail(f"Return JSON {return_id} not found", code=404)
+            return Result.Ok(data=record)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception(f"Database error while updating return JSON {return_id}.")
+            return Result.Fail("Database error while updating return JSON", code=500)
+
+    async def soft_delete(self, return_id: int) -> Result:
+        return await self.update_by_id(return_id, {"is_deleted": 1, "updated_at": datetime.now()})
@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy import insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.extraction_model import Extraction
 from app.repositories.base_repository import BaseRepository
@@ -13,7 +16,8 @@ class ExtractionRepository(BaseRepository):
 
     async def get_all(self) -> Result:
         try:
-            extractions = self.db.query(Extraction).filter(Extraction.is_deleted == 0).all()
+            extractions = (await self.execute(
+                select(Extraction).where(Extraction.is_deleted == 0))).scalars().all()
             return Result.Ok(data=extractions)
         except SQLAlchemyError:
             logger.exception("Database error while fetching extractions.")
@@ -21,8 +25,7 @@ class ExtractionRepository(BaseRepository):
 
     async def get_by_id(self, extraction_id: int) -> Result:
         try:
-            extraction = self.db.query(Extraction).filter(
-                Extraction.extraction_id == extraction_id, Extraction.is_deleted == 0).first()
+            extraction = await self.get_active(Extraction, extraction_id)
             if not extraction:
                 return Result.Fail(f"Extraction {extraction_id} not found", code=404)
             return Result.Ok(data=extraction)
@@ -33,20 +36,47 @@ class ExtractionRepository(BaseRepository):
     async def create(self, extraction: Extraction) -> Result:
         try:
             self.add(extraction)
-            self.commit()
-            self.refresh(extraction)
+            await self.commit()
             return Result.Ok(data=extraction)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception("Error creating extraction.")
             return Result.Fail("Database error while creating extraction", code=500)
 
     async def update(self, extraction: Extraction) -> Result:
         try:
-            self.commit()
-            self.refresh(extraction)
+            await self.commit()
             return Result.Ok(data=extraction)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception("Error updating extraction.")
             return Result.Fail("Database error while updating extraction", code=500)
+
+    async def update_by_id(self, extraction_id: int, values: dict) -> Result:
+        try:
+            extraction = await self.update_returning(Extraction, Extraction.extraction_id, extraction_id, values)
+            if not extraction:
+                return Result.Fail(f"Extraction {extraction_id} not found", code=404)
+            return Result.Ok(data=extraction)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception(f"Database error while updating extraction {extraction_id}.")
+            return Result.Fail("Database error while updating extraction", code=500)
+
+    async def soft_delete(self, extraction_id: int) -> Result:
+        return await self.update_by_id(extraction_id, {"is_deleted": 1, "updated_at": datetime.now()})
+
+    async def bulk_create(self, rows: List[dict]) -> Result:
+        """
+        Inserts all zones with a single multi-row INSERT ... RETURNING in one
+        transaction. The returned zones are not necessarily in input order.
+        """
+        try:
+            stmt = insert(Extraction).values(rows).returning(Extraction)
+            created = (await self.execute(stmt)).scalars().all()
+            await self.commit()
+            return Result.Ok(data=created)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception(f"Database error while bulk creating {len(rows)} extractions.")
+            return Result.Fail("Database error while bulk creating extractions", code=500)
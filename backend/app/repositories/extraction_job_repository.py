@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import undefer
+from app.models.extraction_job_model import ExtractionJob
+from app.repositories.base_repository import BaseRepository
+from app.core.logger import logger
+from app.core.result import Result
+
+PENDING_STATUSES = ("queued", "running")
+
+
+class ExtractionJobRepository(BaseRepository):
+    """
+    Handles all database-level operations for the extraction job queue.
+    Every state change after the claim is guarded by the claim itself
+    (locked_by + attempts), so a worker whose visibility timeout expired
+    cannot overwrite the outcome of the worker that took the job over.
+    Logging is limited to exceptions only.
+    """
+
+    async def enqueue(self, job: ExtractionJob) -> Result:
+        try:
+            self.add(job)
+            await self.commit()
+            return Result.Ok(data=job)
+        except IntegrityError:
+            await self.rollback()
+            return Result.Fail(f"Vendor {job.vendor_id} does not exist", code=400)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception("Error enqueuing extraction job.")
+            return Result.Fail("Database error while enqueuing extraction job", code=500)
+
+    async def get_by_id(self, job_id: int) -> Result:
+        try:
+            job = (await self.execute(select(ExtractionJob).where(ExtractionJob.job_id == job_id))).scalars().first()
+            if not job:
+                return Result.Fail(f"Extraction job {job_id} not found", code=404)
+            return Result.Ok(data=job)
+        except SQLAlchemyError:
+            logger.exception(f"Database error while fetching extraction job {job_id}.")
+            return Result.Fail("Database error while fetching extraction job", code=500)
+
+    async def count_pending(self) -> int:
+        stmt = select(func.count()).select_from(ExtractionJob).where(ExtractionJob.status.in_(PENDING_STATUSES))
+        return (await self.execute(stmt)).scalar_one()
+
+    async def claim(self, worker_id: str, visibility_timeout_seconds: float) -> Result:
+        """
+        Claims the oldest claimable job in one statement and returns it with
+        its document, or None when the queue is empty. On PostgreSQL the
+        inner SELECT takes FOR UPDATE SKIP LOCKED, so concurrent workers pass
+        over each other's candidate rows instead of waiting on them; SQLite
+        serializes the UPDATE on its database lock.
+        """
+        try:
+            now = datetime.now()
+            candidate = (
+                select(ExtractionJob.job_id)
+                .where(ExtractionJob.status.in_(PENDING_STATUSES),
+                       ExtractionJob.available_at <= now,
+                       ExtractionJob.attempts < ExtractionJob.max_attempts)
+                .order_by(ExtractionJob.available_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            stmt = (
+                update(ExtractionJob)
+                .where(ExtractionJob.job_id.in_(candidate.scalar_subquery()))
+                .values(status="running", attempts=ExtractionJob.attempts + 1, locked_by=worker_id,
+                        available_at=now + timedelta(seconds=visibility_timeout_seconds), updated_at=now)
+                .returning(ExtractionJob)
+                .options(undefer(ExtractionJob.document))
+                .execution_options(synchronize_session=False)
+            )
+            job = (await self.execute(stmt)).scalars().first()
+            await self.commit()
+            return Result.Ok(data=job)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception("Database error while claiming an extraction job.")
+            return Result.Fail("Database error while claiming an extraction job", code=500)
+
+    async def fail_expired(self) -> Result:
+        """
+        Marks failed the jobs whose last allowed attempt outlived the
+        visibility timeout (the worker died or hung); returns their count.
+        """
+        try:
+            now = datetime.now()
+            stmt = (
+                update(ExtractionJob)
+                .where(ExtractionJob.status == "running",
+                       ExtractionJob.available_at <= now,
+                       ExtractionJob.attempts >= ExtractionJob.max_attempts)
+                .values(status="failed", error="Visibility timeout expired on the last attempt",
+                        document=None, locked_by=None, updated_at=now, finished_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            count = (await self.execute(stmt)).rowcount
+            await self.commit()
+            return Result.Ok(data=count)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception("Database error while expiring extraction jobs.")
+            return Result.Fail("Database error while expiring extraction jobs", code=500)
+
+    async def _finish_claim(self, job: ExtractionJob, worker_id: str, values: dict) -> Result:
+        try:
+            stmt = (
+                update(ExtractionJob)
+                .where(ExtractionJob.job_id == job.job_id, ExtractionJob.status == "running",
+                       ExtractionJob.locked_by == worker_id, ExtractionJob.attempts == job.attempts)
+                .values(updated_at=datetime.now(), **values)
+                .execution_options(synchronize_session=False)
+            )
+            matched = (await self.execute(stmt)).rowcount
+            await self.commit()
+            if not matched:
+                return Result.Fail(f"Extraction job {job.job_id} is no longer claimed by {worker_id}", code=409)
+            return Result.Ok(data=job)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception(f"Database error while updating extraction job {job.job_id}.")
+            return Result.Fail("Database error while updating extraction job", code=500)
+
+    async def complete(self, job: ExtractionJob, worker_id: str, return_id: int) -> Result:
+        now = datetime.now()
+        return await self._finish_claim(job, worker_id, {
+            "status": "succeeded", "return_id": return_id, "error": None,
+            "document": None, "locked_by": None, "finished_at": now})
+
+    async def fail(self, job: ExtractionJob, worker_id: str, error: str,
+                   retry_at: Optional[datetime] = None) -> Result:
+        """Requeues the job for retry_at, or marks it failed when retry_at is None."""
+        if retry_at is not None:
+            values = {"status": "queued", "available_at": retry_at, "error": error, "locked_by": None}
+        else:
+            values = {"status": "failed", "error": error, "document": None, "locked_by": None,
+                      "finished_at": datetime.now()}
+        return await self._finish_claim(job, worker_id, values)
@@ -1,8 +1,27 @@
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import lambda_stmt, select
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.models.user_model import User
 from app.repositories.base_repository import BaseRepository
 from app.core.logger import logger
 from app.core.result import Result
+from app.utils.pagination import DEFAULT_PAGE_SIZE, InvalidCursor, TotalMode
+
+ACTIVE_USERNAME_INDEX = "uq_invoai_tb_inai_mas_user_user_name_active"
+
+
+def is_username_taken(error: SQLAlchemyError) -> bool:
+    """True only for a violation of the active-username unique index (not NOT NULL, FK, ...)."""
+    if not isinstance(error, IntegrityError):
+        return False
+    # psycopg2 reports the index in diag, asyncpg on the driver error the adapter wraps
+    driver_error = getattr(error.orig, "diag", None) or getattr(error.orig, "__cause__", None)
+    constraint = getattr(driver_error, "constraint_name", None)
+    if constraint is not None:
+        return constraint == ACTIVE_USERNAME_INDEX
+    # SQLite names the columns instead of the index
+    return "UNIQUE constraint failed: tb_inai_mas_user.user_name" in str(error.orig)
 
 
 class UserRepository(BaseRepository):
@@ -11,18 +30,31 @@ class UserRepository(BaseRepository):
     Logging is limited to exceptions for cleaner output.
     """
 
-    async def get_all(self) -> Result:
+    async def get_all(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                      name_prefix: Optional[str] = None,
+                      created_from: Optional[datetime] = None,
+                      created_to: Optional[datetime] = None,
+                      total: TotalMode = "none") -> Result:
         try:
-            users = self.db.query(User).filter(User.is_deleted == 0).all()
-            return Result.Ok(data=users)
+            stmt = select(User).where(User.is_deleted == 0)
+            if name_prefix:
+                stmt = stmt.where(User.user_name.startswith(name_prefix, autoescape=True))
+            if created_from:
+                stmt = stmt.where(User.created_at >= created_from)
+            if created_to:
+                stmt = stmt.where(User.created_at < created_to)
+
+            page = await self.fetch_page(stmt, User.user_id, limit, after, total=total)
+            return Result.Ok(data=page)
+        except InvalidCursor as e:
+            return Result.Fail(str(e), code=400)
         except SQLAlchemyError:
             logger.exception("Database error while fetching all users.")
             return Result.Fail("Database error while fetching users", code=500)
 
     async def get_by_id(self, user_id: int) -> Result:
         try:
-            user = self.db.query(User).filter(
-                User.user_id == user_id, User.is_deleted == 0).first()
+            user = await self.get_active(User, user_id)
             
             if not user:
                 return Result.Fail(message=f"User with ID {user_id} not found", code=404)
@@ -33,8 +65,9 @@ class UserRepository(BaseRepository):
 
     async def get_by_bio_id(self, bio_id: int) -> Result:
         try:
-            users = self.db.query(User).filter(
-                User.bio_id == bio_id, User.is_deleted == 0).all()
+            # lambda_stmt: built and compiled once, bio_id is extracted as a bound parameter
+            users = (await self.execute(lambda_stmt(
+                lambda: select(User).where(User.bio_id == bio_id, User.is_deleted == 0)))).scalars().all()
             
             if not users:
                 return Result.Fail(f"No users found with bio ID {bio_id}", code=404)
@@ -46,20 +79,36 @@ class UserRepository(BaseRepository):
     async def create(self, user: User) -> Result:
         try:
             self.add(user)
-            self.commit()
-            self.refresh(user)
+            await self.commit()
             return Result.Ok(data=user)
-        except SQLAlchemyError:
-            self.rollback()
+        except SQLAlchemyError as e:
+            await self.rollback()
+            if is_username_taken(e):
+                return Result.Fail(f"User name '{user.user_name}' is already taken", code=409)
             logger.exception(f"Database error while creating user '{user.user_name}'.")
             return Result.Fail("Database error while creating user", code=500)
 
     async def update(self, user: User) -> Result:
         try:
-            self.commit()
-            self.refresh(user)
+            await self.commit()
             return Result.Ok(data=user)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception(f"Database error while updating user {user.user_id}.")
             return Result.Fail("Database error while updating user", code=500)
+
+    async def update_by_id(self, user_id: int, values: dict) -> Result:
+        try:
+            user = await self.update_returning(User, User.user_id, user_id, values)
+            if not user:
+                return Result.Fail(f"User {user_id} not found", code=404)
+            return Result.Ok(data=user)
+        except SQLAlchemyError as e:
+            await self.rollback()
+            if is_username_taken(e):
+                return Result.Fail(f"User name '{values.get('user_name')}' is already taken", code=409)
+            logger.exception(f"Database error while updating user {user_id}.")
+            return Result.Fail("Database error while updating user", code=500)
+
+    async def soft_delete(self, user_id: int) -> Result:
+        return await self.update_by_id(user_id, {"is_deleted": 1, "updated_at": datetime.now()})
@@ -1,8 +1,14 @@
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from datetime import datetime
+from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.vendor_model import Vendor
+from app.models.extraction_model import Extraction
 from app.repositories.base_repository import BaseRepository
 from app.core.logger import logger
 from app.core.result import Result
+from app.utils.pagination import DEFAULT_PAGE_SIZE, InvalidCursor, TotalMode
 
 
 class VendorRepository(BaseRepository):
@@ -11,18 +17,66 @@ class VendorRepository(BaseRepository):
     Logging is limited to exceptions only.
     """
 
-    async def get_all(self) -> Result:
+    async def get_all(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                      name_prefix: Optional[str] = None,
+                      created_from: Optional[datetime] = None,
+                      created_to: Optional[datetime] = None,
+                      total: TotalMode = "none") -> Result:
         try:
-            vendors = self.db.query(Vendor).filter(Vendor.is_deleted == 0).all()
-            return Result.Ok(data=vendors)
+            stmt = select(Vendor).where(Vendor.is_deleted == 0)
+            if name_prefix:
+                stmt = stmt.where(Vendor.vendor_name.startswith(name_prefix, autoescape=True))
+            if created_from:
+                stmt = stmt.where(Vendor.created_at >= created_from)
+            if created_to:
+                stmt = stmt.where(Vendor.created_at < created_to)
+
+            page = await self.fetch_page(stmt, Vendor.vendor_id, limit, after, total=total)
+            return Result.Ok(data=page)
+        except InvalidCursor as e:
+            return Result.Fail(str(e), code=400)
         except SQLAlchemyError:
             logger.exception("Database error while fetching all vendors.")
             return Result.Fail("Database error while fetching vendors", code=500)
 
+    def _template_statement(self):
+        """
+        Vendors with their active extraction zones. selectinload fetches the
+        zones of a whole page with one IN query (per 500 vendors) instead of a
+        lazy load per vendor.
+        """
+        return select(Vendor).where(Vendor.is_deleted == 0).options(
+            selectinload(Vendor.extraction_details.and_(Extraction.is_deleted == 0)))
+
+    async def get_templates(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                            name_prefix: Optional[str] = None) -> Result:
+        try:
+            stmt = self._template_statement()
+            if name_prefix:
+                stmt = stmt.where(Vendor.vendor_name.startswith(name_prefix, autoescape=True))
+
+            page = await self.fetch_page(stmt, Vendor.vendor_id, limit, after)
+            return Result.Ok(data=page)
+        except InvalidCursor as e:
+            return Result.Fail(str(e), code=400)
+        except SQLAlchemyError:
+            logger.exception("Database error while fetching vendor templates.")
+            return Result.Fail("Database error while fetching vendor templates", code=500)
+
+    async def get_template_by_id(self, vendor_id: int) -> Result:
+        try:
+            vendor = (await self.execute(
+                self._template_statement().where(Vendor.vendor_id == vendor_id))).scalars().first()
+            if not vendor:
+                return Result.Fail(f"Vendor with ID {vendor_id} not found", code=404)
+            return Result.Ok(data=vendor)
+        except SQLAlchemyError:
+            logger.exception(f"Database error while fetching template of vendor {vendor_id}.")
+            return Result.Fail("Database error while fetching vendor template", code=500)
+
     async def get_by_id(self, vendor_id: int) -> Result:
         try:
-            vendor = self.db.query(Vendor).filter(
-                Vendor.vendor_id == vendor_id, Vendor.is_deleted == 0).first()
+            vendor = await self.get_active(Vendor, vendor_id)
             if not vendor:
                 return Result.Fail(f"Vendor with ID {vendor_id} not found", code=404)
             return Result.Ok(data=vendor)
@@ -33,20 +87,63 @@ class VendorRepository(BaseRepository):
     async def create(self, vendor: Vendor) -> Result:
         try:
             self.add(vendor)
-            self.commit()
-            self.refresh(vendor)
+            await self.commit()
             return Result.Ok(data=vendor)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception(f"Database error while creating vendor '{vendor.vendor_name}'.")
             return Result.Fail("Database error while creating vendor", code=500)
 
     async def update(self, vendor: Vendor) -> Result:
         try:
-            self.commit()
-            self.refresh(vendor)
+            await self.commit()
             return Result.Ok(data=vendor)
         except SQLAlchemyError:
-            self.rollback()
+            await self.rollback()
             logger.exception(f"Database error while updating vendor {vendor.vendor_id}.")
             return Result.Fail("Database error while updating vendor", code=500)
+
+    async def update_by_id(self, vendor_id: int, values: dict) -> Result:
+        try:
+            vendor = await self.update_returning(Vendor, Vendor.vendor_id, vendor_id, values)
+            if not vendor:
+                return Result.Fail(f"Vendor {vendor_id} not found", code=404)
+            return Result.Ok(data=vendor)
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception(f"Database error while updating vendor {vendor_id}.")
+            return Result.Fail("Database error while updating vendor", code=500)
+
+    async def soft_delete(self, vendor_id: int) -> Result:
+        return await self.update_by_id(vendor_id, {"is_deleted": 1, "updated_at": datetime.now()})
+
+    async def bulk_upsert(self, rows: List[dict]) -> Result:
+        """
+        Upserts vendors keyed on vendor_name in one transaction:
+        one SELECT to tell inserts from updates, then a single multi-row
+        INSERT ... ON CONFLICT (vendor_name) DO UPDATE ... RETURNING.
+        Returns a (vendor, created) pair per row; RETURNING order is not
+        the input order, so callers match them on vendor_name.
+        """
+        try:
+            names = [row["vendor_name"] for row in rows]
+            existing = set((await self.execute(
+                select(Vendor.vendor_name).where(Vendor.vendor_name.in_(names)))).scalars().all())
+
+            stmt = self.dialect_insert(Vendor).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Vendor.vendor_name],
+                set_={
+                    "is_deleted": stmt.excluded.is_deleted,
+                    "updated_by": stmt.excluded.created_by,
+                    "updated_at": datetime.now(),
+                },
+            ).returning(Vendor).execution_options(populate_existing=True)
+
+            upserted = (await self.execute(stmt)).scalars().all()
+            await self.commit()
+            return Result.Ok(data=[(vendor, vendor.vendor_name not in existing) for vendor in upserted])
+        except SQLAlchemyError:
+            await self.rollback()
+            logger.exception(f"Database error while bulk upserting {len(rows)} vendors.")
+            return Result.Fail("Database error while bulk upserting vendors", code=500)
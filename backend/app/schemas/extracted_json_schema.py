@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 class ReturnJsonBase(BaseModel):
@@ -9,7 +9,7 @@ class ReturnJsonBase(BaseModel):
     is_deleted: Optional[int] = 0
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 class ReturnJsonCreate(ReturnJsonBase):
     created_by: Optional[int] = None
@@ -21,9 +21,15 @@ class ReturnJsonUpdate(BaseModel):
     is_deleted: Optional[int] = None
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 class ReturnJsonResponse(ReturnJsonBase):
     return_id: int
     created_by: Optional[int] = None
     created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class ReturnJsonListResponse(BaseModel):
+    records: List[ReturnJsonResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class ExtractionJobResponse(BaseModel):
+    job_id: int
+    vendor_id: Optional[int] = None
+    file_name: Optional[str] = None
+    content_type: str
+    status: str
+    attempts: int
+    max_attempts: int
+    return_id: Optional[int] = None
+    error: Optional[str] = None
+    created_by: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class ExtractionBase(BaseModel):
@@ -12,7 +12,7 @@ class ExtractionBase(BaseModel):
     is_deleted: Optional[int] = 0
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 class ExtractionCreate(ExtractionBase):
     created_by: Optional[int] = None
@@ -28,7 +28,7 @@ class ExtractionUpdate(BaseModel):
     updated_by: Optional[int] = None
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 class ExtractionResponse(ExtractionBase):
     extraction_id: int
@@ -36,3 +36,12 @@ class ExtractionResponse(ExtractionBase):
     created_at: Optional[datetime] = None
     updated_by: Optional[int] = None
     updated_at: Optional[datetime] = None
+
+class ExtractionBulkItemResult(BaseModel):
+    index: int
+    status: str
+    extraction: ExtractionResponse
+
+class ExtractionBulkResponse(BaseModel):
+    results: List[ExtractionBulkItemResult]
+    created: int
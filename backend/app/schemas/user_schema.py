@@ -39,7 +39,8 @@ class UserResponse(UserBase):
 
 class UserListResponse(BaseModel):
     users: List[UserResponse]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # GENERIC RESPONSE WRAPPER
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from app.schemas.extraction_schema import ExtractionResponse
 
 class VendorBase(BaseModel):
     vendor_name: str = Field(..., max_length=100)
@@ -20,4 +21,27 @@ class VendorResponse(VendorBase):
     vendor_id: int
     created_by: Optional[int] = None
     created_at: Optional[datetime] = None
+    updated_by: Optional[int] = None
+    updated_at: Optional[datetime] = None
 
+class VendorListResponse(BaseModel):
+    vendors: List[VendorResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+class VendorTemplateResponse(VendorResponse):
+    extraction_details: List[ExtractionResponse] = []
+
+class VendorTemplateListResponse(BaseModel):
+    vendors: List[VendorTemplateResponse]
+    next_cursor: Optional[str] = None
+
+class VendorBulkItemResult(BaseModel):
+    index: int
+    status: str
+    vendor: VendorResponse
+
+class VendorBulkResponse(BaseModel):
+    results: List[VendorBulkItemResult]
+    created: int
+    updated: int
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime
+from typing import Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core import database
+from app.core.config import settings
+from app.core.logger import logger
+from app.repositories.auth_repository import AuthRepository
+
+_STOP = object()
+
+
+class AuditLogWriter:
+    """
+    Background writer for login audit rows (tb_inai_log).
+
+    Logins enqueue rows in memory; a single task flushes them as one
+    multi-row INSERT when AUDIT_LOG_BATCH_SIZE rows are waiting or
+    AUDIT_LOG_FLUSH_INTERVAL_MS after the first queued row, whichever comes
+    first. stop() drains the queue on shutdown.
+
+    enqueue() returns False while the writer is not running (sync mode,
+    tests, scripts) or the queue is full; callers then write the row
+    synchronously, so an audit row is never dropped silently.
+    """
+
+    def __init__(self, batch_size: int, flush_interval_ms: float, queue_size: int,
+                 session_factory: Optional[Callable] = None):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.queue_size = queue_size
+        self.session_factory = session_factory
+        self.metrics = {"enqueued": 0, "written": 0, "batches": 0, "failed": 0, "fallbacks": 0}
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def start(self):
+        if self.running:
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def enqueue(self, user_id: int, login_time: datetime) -> bool:
+        if not self.running:
+            self.metrics["fallbacks"] += 1
+            return False
+        try:
+            self._queue.put_nowait({"user_id": user_id, "login_time": login_time})
+        except asyncio.QueueFull:
+            self.metrics["fallbacks"] += 1
+            logger.warning("audit_log_queue_full", queue_size=self.queue_size)
+            return False
+        self.metrics["enqueued"] += 1
+        return True
+
+    async def stop(self):
+        """Flushes everything queued so far, then ends the background task."""
+        if self._task is None or self._task.done():
+            return
+        self._stopping = True
+        await self._queue.put(_STOP)
+        await self._task
+        logger.info("audit_log_writer_stopped", **self.metrics)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stop:
+                return
+
+    async def _flush(self, rows: List[dict]):
+        factory = self.session_factory or database.AsyncSessionLocal or database.SessionLocal
+        session = factory()
+        try:
+            result = await AuthRepository(session).save_login_logs(rows)
+        except Exception:
+            logger.exception("Unexpected error while flushing audit log batch.")
+            result = None
+        finally:
+            if isinstance(session, AsyncSession):
+                await session.close()
+            else:
+                session.close()
+
+        if result is not None and result.success:
+            self.metrics["written"] += len(rows)
+            self.metrics["batches"] += 1
+        else:
+            self.metrics["failed"] += len(rows)
+            # Keep the lost rows recoverable from the application log
+            logger.error("audit_log_flush_failed", rows=[
+                {"user_id": row["user_id"], "login_time": row["login_time"].isoformat()} for row in rows])
+
+
+audit_log_writer = AuditLogWriter(
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval_ms=settings.AUDIT_LOG_FLUSH_INTERVAL_MS,
+    queue_size=settings.AUDIT_LOG_QUEUE_SIZE,
+)
@@ -1,14 +1,11 @@
 from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
-from passlib.context import CryptContext
 from app.core.result import Result
 from app.core.logger import logger
+from app.core.security import DUMMY_PASSWORD_HASH, PasswordHasherBusy, password_hasher
 from app.repositories.auth_repository import AuthRepository
+from app.services.audit_log_writer import audit_log_writer
 from app.schemas.auth_schema import LoginRequest, LoginResponse
-import hashlib
-
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 class AuthService:
@@ -19,31 +16,28 @@ class AuthService:
     def __init__(self, repo: AuthRepository):
         self.repo = repo
 
-    def hash_password(self, password: str) -> str:
-        sha256_hashed = hashlib.sha256(password.encode("utf-8")).hexdigest()
-        return pwd_context.hash(sha256_hashed)
+    async def hash_password(self, password: str) -> str:
+        return await password_hasher.hash(password)
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        sha256_hashed = hashlib.sha256(plain_password.encode("utf-8")).hexdigest()
-        return pwd_context.verify(sha256_hashed, hashed_password)
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(plain_password, hashed_password)
 
     async def login(self, payload: LoginRequest) -> Result:
         try:
-            res = await self.repo.get_users_by_username(payload.user_name)
-            if not res.success or not res.data:
-                return Result.Fail("Invalid username or password", code=401)
-
-            matched_user = None
-            for user in res.data:
-                if self.verify_password(payload.password, user.password_hash):
-                    matched_user = user
-                    break
-
-            if not matched_user:
+            # Active usernames are unique: one indexed lookup, exactly one bcrypt check
+            res = await self.repo.verify_user(payload.user_name)
+            if not res.success and res.code != 404:
+                return res
+
+            matched_user = res.data
+            password_hash = matched_user.password_hash if matched_user else DUMMY_PASSWORD_HASH
+            if not await self.verify_password(payload.password, password_hash) or not matched_user:
                 return Result.Fail("Invalid username or password", code=401)
 
             login_time = datetime.now()
-            await self.repo.save_login_log(matched_user.user_id, login_time)
+            # Batched in the background; written inline when the writer is off or saturated
+            if not audit_log_writer.enqueue(matched_user.user_id, login_time):
+                await self.repo.save_login_log(matched_user.user_id, login_time)
 
             response = LoginResponse(
                 bio_id=matched_user.bio_id,
@@ -52,6 +46,9 @@ class AuthService:
             )
             return Result.Ok(response.dict(), message="Login successful", code=200)
 
+        except PasswordHasherBusy:
+            logger.warning("login_rejected_hasher_busy", **password_hasher.stats())
+            return Result.Fail("Too many logins in progress, retry shortly", code=503)
         except SQLAlchemyError:
             logger.exception("Database error during login.")
             return Result.Fail("Database error during login", code=500)
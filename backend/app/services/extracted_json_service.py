@@ -1,10 +1,31 @@
+import json
 from datetime import datetime
+from typing import AsyncIterator, Iterator, List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.extracted_json_model import ReturnJson
-from app.schemas.extracted_json_schema import ReturnJsonCreate, ReturnJsonUpdate, ReturnJsonResponse
+from app.schemas.extracted_json_schema import (
+    ReturnJsonCreate,
+    ReturnJsonUpdate,
+    ReturnJsonResponse,
+    ReturnJsonListResponse,
+)
+from app.core.cache import extracted_json_cache
 from app.core.result import Result
 from app.core.logger import logger
 from app.repositories.extracted_json_repository import ReturnJsonRepository
+from app.utils.json_filter import InvalidPredicate, parse_predicate
+from app.utils.pagination import DEFAULT_PAGE_SIZE
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _ndjson_chunk(rows) -> bytes:
+    """One network chunk per cursor batch: a JSON object per line."""
+    return "".join(json.dumps(dict(row), default=_json_default) + "\n" for row in rows).encode("utf-8")
 
 
 class OCRExtractionService:
@@ -15,21 +36,58 @@ class OCRExtractionService:
     def __init__(self, repo: ReturnJsonRepository):
         self.repo = repo
 
-    async def get_all_returns(self) -> Result:
+    async def get_all_returns(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                              **filters) -> Result:
         try:
-            records = await self.repo.get_all()
-            data = [ReturnJsonResponse.from_orm(r).dict() for r in records]
-            return Result.Ok(data, message="Return JSON records fetched successfully", code=200)
+            res = await self.repo.get_all(limit=limit, after=after, **filters)
+            if not res.success:
+                return res
+
+            records = [ReturnJsonResponse.from_orm(r) for r in res.data.items]
+            response = ReturnJsonListResponse(records=records, next_cursor=res.data.next_cursor, total=res.data.total)
+            return Result.Ok(response.dict(), message="Return JSON records fetched successfully", code=200)
         except SQLAlchemyError:
             logger.exception("Error fetching return JSON records.")
             return Result.Fail("Database error while fetching return JSON records", code=500)
 
+    async def query_returns(self, expressions: List[str], limit: int = DEFAULT_PAGE_SIZE,
+                            after: Optional[str] = None, **filters) -> Result:
+        """Filters records by predicates on extracted_json, e.g. 'total > 10000'."""
+        try:
+            predicates = [parse_predicate(expression) for expression in expressions]
+        except InvalidPredicate as e:
+            return Result.Fail(str(e), code=400)
+
+        try:
+            res = await self.repo.query_by_json(predicates, limit=limit, after=after, **filters)
+            if not res.success:
+                return res
+
+            records = [ReturnJsonResponse.from_orm(r) for r in res.data.items]
+            response = ReturnJsonListResponse(records=records, next_cursor=res.data.next_cursor)
+            return Result.Ok(response.dict(), message="Return JSON records fetched successfully", code=200)
+        except SQLAlchemyError:
+            logger.exception("Error querying return JSON records.")
+            return Result.Fail("Database error while querying return JSON records", code=500)
+
+    def iter_export_ndjson(self, **filters) -> Iterator[bytes]:
+        for rows in self.repo.iter_export(**filters):
+            yield _ndjson_chunk(rows)
+
+    async def aiter_export_ndjson(self, **filters) -> AsyncIterator[bytes]:
+        async for rows in self.repo.aiter_export(**filters):
+            yield _ndjson_chunk(rows)
+
     async def get_return_by_id(self, return_id: int) -> Result:
+        # Pages change with every new invoice, so only single records are cached
+        return await extracted_json_cache.get_or_load(("id", return_id), lambda: self._get_return_by_id(return_id))
+
+    async def _get_return_by_id(self, return_id: int) -> Result:
         try:
-            record = await self.repo.get_by_id(return_id)
-            if not record:
+            res = await self.repo.get_by_id(return_id)
+            if not res.success:
                 return Result.Fail("Return JSON not found", code=404)
-            data = ReturnJsonResponse.from_orm(record).dict()
+            data = ReturnJsonResponse.from_orm(res.data).dict()
             return Result.Ok(data, message="Return JSON fetched successfully", code=200)
         except SQLAlchemyError:
             logger.exception(f"Error fetching return JSON {return_id}.")
@@ -46,40 +104,34 @@ class OCRExtractionService:
                 is_deleted=data.is_deleted,
             )
             created = await self.repo.create(record)
-            data = ReturnJsonResponse.from_orm(created).dict()
+            if not created.success:
+                return created
+
+            data = ReturnJsonResponse.from_orm(created.data).dict()
             return Result.Ok(data, message="Return JSON created successfully", code=201)
         except SQLAlchemyError:
-            self.repo.rollback()
+            await self.repo.rollback()
             logger.exception("Error creating return JSON.")
             return Result.Fail("Database error while creating return JSON", code=500)
 
     async def update_return(self, return_id: int, data: ReturnJsonUpdate) -> Result:
-        existing = await self.repo.get_by_id(return_id)
-        if not existing:
-            return Result.Fail("Return JSON not found", code=404)
+        values = data.dict(exclude_unset=True)
+        if not values:
+            return await self.get_return_by_id(return_id)
 
-        try:
-            for field, value in data.dict(exclude_unset=True).items():
-                setattr(existing, field, value)
-            updated = await self.repo.update(existing)
-            data = ReturnJsonResponse.from_orm(updated).dict()
-            return Result.Ok(data, message="Return JSON updated successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Error updating return JSON.")
-            return Result.Fail("Database error while updating return JSON", code=500)
+        values["updated_at"] = datetime.now()
+        updated = await self.repo.update_by_id(return_id, values)
+        if not updated.success:
+            return Result.Fail("Return JSON not found", code=404) if updated.code == 404 else updated
+
+        await extracted_json_cache.invalidate(("id", return_id))
+        data = ReturnJsonResponse.from_orm(updated.data).dict()
+        return Result.Ok(data, message="Return JSON updated successfully", code=200)
 
     async def soft_delete_return(self, return_id: int) -> Result:
-        existing = await self.repo.get_by_id(return_id)
-        if not existing:
-            return Result.Fail("Return JSON not found", code=404)
+        deleted = await self.repo.soft_delete(return_id)
+        if not deleted.success:
+            return Result.Fail("Return JSON not found", code=404) if deleted.code == 404 else deleted
 
-        try:
-            existing.is_deleted = 1
-            updated = await self.repo.update(existing)
-            data = ReturnJsonResponse.from_orm(updated).dict()
-            return Result.Ok(data, message="Return JSON deleted successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Error deleting return JSON.")
-            return Result.Fail("Database error while deleting return JSON", code=500)
+        await extracted_json_cache.invalidate(("id", return_id))
+        return Result.Ok(message="Return JSON deleted successfully", code=200)
@@ -1,7 +1,16 @@
 from datetime import datetime
+from typing import List
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.extraction_model import Extraction
-from app.schemas.extraction_schema import ExtractionCreate, ExtractionUpdate, ExtractionResponse
+from app.schemas.extraction_schema import (
+    ExtractionCreate,
+    ExtractionUpdate,
+    ExtractionResponse,
+    ExtractionBulkItemResult,
+    ExtractionBulkResponse,
+)
+from app.core.cache import extraction_cache
+from app.core.config import settings
 from app.core.result import Result
 from app.core.logger import logger
 from app.repositories.extraction_details_repository import ExtractionRepository
@@ -16,20 +25,30 @@ class ExtractionService:
         self.repo = repo
 
     async def get_all_extractions(self) -> Result:
+        return await extraction_cache.get_or_load(("extractions",), self._get_all_extractions)
+
+    async def _get_all_extractions(self) -> Result:
         try:
-            extractions = await self.repo.get_all()
-            data = [ExtractionResponse.from_orm(e).dict() for e in extractions]
+            res = await self.repo.get_all()
+            if not res.success:
+                return res
+
+            data = [ExtractionResponse.from_orm(e).dict() for e in res.data]
             return Result.Ok(data, message="Extractions fetched successfully", code=200)
         except SQLAlchemyError:
             logger.exception("Error fetching extractions.")
             return Result.Fail("Database error while fetching extractions", code=500)
 
     async def get_extraction_by_id(self, extraction_id: int) -> Result:
+        return await extraction_cache.get_or_load(
+            ("extraction", extraction_id), lambda: self._get_extraction_by_id(extraction_id))
+
+    async def _get_extraction_by_id(self, extraction_id: int) -> Result:
         try:
-            extraction = await self.repo.get_by_id(extraction_id)
-            if not extraction:
+            res = await self.repo.get_by_id(extraction_id)
+            if not res.success:
                 return Result.Fail("Extraction not found", code=404)
-            data = ExtractionResponse.from_orm(extraction).dict()
+            data = ExtractionResponse.from_orm(res.data).dict()
             return Result.Ok(data, message="Extraction fetched successfully", code=200)
         except SQLAlchemyError:
             logger.exception(f"Error fetching extraction {extraction_id}.")
@@ -49,44 +68,62 @@ class ExtractionService:
                 is_deleted=data.is_deleted,
             )
             created = await self.repo.create(extraction)
-            data = ExtractionResponse.from_orm(created).dict()
+            if not created.success:
+                return created
+
+            await extraction_cache.invalidate()
+            data = ExtractionResponse.from_orm(created.data).dict()
             return Result.Ok(data, message="Extraction created successfully", code=201)
         except SQLAlchemyError:
-            self.repo.rollback()
+            await self.repo.rollback()
             logger.exception("Error creating extraction.")
             return Result.Fail("Database error while creating extraction", code=500)
 
-    async def update_extraction(self, extraction_id: int, data: ExtractionUpdate) -> Result:
-        existing = await self.repo.get_by_id(extraction_id)
-        if not existing:
-            return Result.Fail("Extraction not found", code=404)
+    async def bulk_create_extractions(self, items: List[ExtractionCreate]) -> Result:
+        """
+        Creates a whole zone template in one round-trip; either every zone
+        is stored or none is.
+        """
+        if not items:
+            return Result.Fail("No extractions supplied", code=400)
+        if len(items) > settings.BULK_MAX_ITEMS:
+            return Result.Fail(f"At most {settings.BULK_MAX_ITEMS} extractions per request", code=413)
 
-        try:
-            for field, value in data.dict(exclude_unset=True).items():
-                setattr(existing, field, value)
-            existing.updated_at = datetime.now()
+        # Multi-row INSERT ... RETURNING does not promise input order: rows are matched back on this key
+        keys = [(item.vendor_id, item.extraction_name) for item in items]
+        duplicates = sorted({name for vendor_id, name in keys if keys.count((vendor_id, name)) > 1})
+        if duplicates:
+            return Result.Fail(f"Duplicate extraction names in request: {', '.join(duplicates)}", code=400)
 
-            updated = await self.repo.update(existing)
-            data = ExtractionResponse.from_orm(updated).dict()
-            return Result.Ok(data, message="Extraction updated successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Error updating extraction.")
-            return Result.Fail("Database error while updating extraction", code=500)
+        now = datetime.now()
+        rows = [{**item.dict(), "created_at": now} for item in items]
+        res = await self.repo.bulk_create(rows)
+        if not res.success:
+            return res
+        await extraction_cache.invalidate()
 
-    async def soft_delete_extraction(self, extraction_id: int) -> Result:
-        existing = await self.repo.get_by_id(extraction_id)
-        if not existing:
-            return Result.Fail("Extraction not found", code=404)
+        created = {(e.vendor_id, e.extraction_name): e for e in res.data}
+        results = [
+            ExtractionBulkItemResult(index=i, status="created", extraction=ExtractionResponse.from_orm(created[key]))
+            for i, key in enumerate(keys)
+        ]
+        response = ExtractionBulkResponse(results=results, created=len(results))
+        return Result.Ok(response.dict(), message="Extractions created successfully", code=201)
 
-        try:
-            existing.is_deleted = 1
-            existing.updated_at = datetime.now()
+    async def update_extraction(self, extraction_id: int, data: ExtractionUpdate) -> Result:
+        values = {**data.dict(exclude_unset=True), "updated_at": datetime.now()}
+        updated = await self.repo.update_by_id(extraction_id, values)
+        if not updated.success:
+            return Result.Fail("Extraction not found", code=404) if updated.code == 404 else updated
 
-            deleted = await self.repo.update(existing)
-            data = ExtractionResponse.from_orm(deleted).dict()
-            return Result.Ok(data, message="Extraction deleted successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Error deleting extraction.")
-            return Result.Fail("Database error while deleting extraction", code=500)
+        await extraction_cache.invalidate()
+        data = ExtractionResponse.from_orm(updated.data).dict()
+        return Result.Ok(data, message="Extraction updated successfully", code=200)
+
+    async def soft_delete_extraction(self, extraction_id: int) -> Result:
+        deleted = await self.repo.soft_delete(extraction_id)
+        if not deleted.success:
+            return Result.Fail("Extraction not found", code=404) if deleted.code == 404 else deleted
+
+        await extraction_cache.invalidate()
+        return Result.Ok(message="Extraction deleted successfully", code=200)
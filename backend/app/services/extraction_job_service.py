@@ -0,0 +1,68 @@
+from typing import Optional
+from sqlalchemy.exc import SQLAlchemyError
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.result import Result
+from app.models.extraction_job_model import ExtractionJob
+from app.repositories.extraction_job_repository import ExtractionJobRepository
+from app.schemas.extraction_job_schema import ExtractionJobResponse
+from app.services.extracted_json_service import OCRExtractionService
+from app.services.invoice_extractor import SUPPORTED_CONTENT_TYPES
+
+
+class ExtractionJobService:
+    """
+    Business logic layer for extraction jobs: the request only stores the
+    document and returns a job id; OCR runs in the extraction workers.
+    """
+
+    def __init__(self, repo: ExtractionJobRepository, returns: OCRExtractionService):
+        self.repo = repo
+        self.returns = returns
+
+    async def submit(self, document: bytes, content_type: Optional[str], file_name: Optional[str] = None,
+                     vendor_id: Optional[int] = None, created_by: Optional[int] = None) -> Result:
+        if not document:
+            return Result.Fail("The request body must contain the invoice document", code=400)
+        if len(document) > settings.EXTRACTION_MAX_DOCUMENT_BYTES:
+            return Result.Fail(f"Documents are limited to {settings.EXTRACTION_MAX_DOCUMENT_BYTES} bytes", code=413)
+        content_type = (content_type or "").split(";")[0].strip().lower()
+        if content_type not in SUPPORTED_CONTENT_TYPES:
+            return Result.Fail(f"Unsupported content type '{content_type}'", code=415)
+
+        try:
+            if await self.repo.count_pending() >= settings.EXTRACTION_MAX_PENDING_JOBS:
+                return Result.Fail("The extraction queue is full, try again later", code=503)
+
+            job = ExtractionJob(vendor_id=vendor_id, file_name=file_name, content_type=content_type,
+                                document=document, status="queued", attempts=0,
+                                max_attempts=settings.EXTRACTION_MAX_ATTEMPTS, created_by=created_by)
+            queued = await self.repo.enqueue(job)
+            if not queued.success:
+                return queued
+
+            logger.info("extraction_job_queued", job_id=job.job_id, vendor_id=vendor_id, size=len(document))
+            data = ExtractionJobResponse.from_orm(queued.data).dict()
+            return Result.Ok(data, message="Extraction job queued", code=202)
+        except SQLAlchemyError:
+            logger.exception("Error queuing extraction job.")
+            return Result.Fail("Database error while queuing extraction job", code=500)
+
+    async def get_job(self, job_id: int) -> Result:
+        res = await self.repo.get_by_id(job_id)
+        if not res.success:
+            return res
+        data = ExtractionJobResponse.from_orm(res.data).dict()
+        return Result.Ok(data, message="Extraction job fetched successfully", code=200)
+
+    async def get_result(self, job_id: int) -> Result:
+        res = await self.repo.get_by_id(job_id)
+        if not res.success:
+            return res
+
+        job = res.data
+        if job.status == "failed":
+            return Result.Fail(f"Extraction failed: {job.error}", code=422)
+        if job.status != "succeeded":
+            return Result.Fail(f"Extraction job is still {job.status}", code=409)
+        return await self.returns.get_return_by_id(job.return_id)
@@ -0,0 +1,73 @@
+"""
+OCR of one invoice document into the JSON stored on tb_inai_extracted_json.
+
+Runs inside the extraction worker processes (app.workers.extraction_worker),
+never in a request. The vendor's extraction zones (tb_inai_extraction_details)
+are read off the first page by their pixel box; the full text of every page
+is kept alongside.
+"""
+import io
+from typing import Dict, List
+
+try:
+    import pytesseract
+    from PIL import Image
+except ImportError:  # optional: only needed where extraction workers run
+    pytesseract = None
+    Image = None
+
+try:
+    from pdf2image import convert_from_bytes
+except ImportError:  # optional: images can still be extracted without it
+    convert_from_bytes = None
+
+IMAGE_CONTENT_TYPES = {"image/png", "image/jpeg", "image/tiff", "image/bmp", "image/webp"}
+PDF_CONTENT_TYPE = "application/pdf"
+SUPPORTED_CONTENT_TYPES = IMAGE_CONTENT_TYPES | {PDF_CONTENT_TYPE}
+
+# invoice_number column length on tb_inai_extracted_json
+INVOICE_NUMBER_MAX_LENGTH = 30
+
+
+class ExtractionError(Exception):
+    """The document could not be extracted; the job is retried."""
+
+
+class PermanentExtractionError(ExtractionError):
+    """Retrying cannot help (unsupported document, OCR not installed); the job fails at once."""
+
+
+def _pages(document: bytes, content_type: str) -> list:
+    if pytesseract is None:
+        raise PermanentExtractionError("OCR extraction requires the 'pytesseract' and 'Pillow' packages")
+    if content_type == PDF_CONTENT_TYPE:
+        if convert_from_bytes is None:
+            raise PermanentExtractionError("PDF extraction requires the 'pdf2image' package")
+        return convert_from_bytes(document)
+    if content_type in IMAGE_CONTENT_TYPES:
+        return [Image.open(io.BytesIO(document))]
+    raise PermanentExtractionError(f"Unsupported content type '{content_type}'")
+
+
+def extract_invoice(document: bytes, content_type: str, zones: List[Dict]) -> Dict:
+    """
+    zones: [{"extraction_name", "x_min", "x_max", "y_min", "y_max"}, ...] of
+    the job's vendor (empty without a vendor). Returns
+    {"fields": {extraction_name: text}, "pages": [text per page]}.
+    """
+    try:
+        pages = _pages(document, content_type)
+        fields = {}
+        for zone in zones:
+            box = (zone["x_min"], zone["y_min"], zone["x_max"], zone["y_max"])
+            fields[zone["extraction_name"]] = pytesseract.image_to_string(pages[0].crop(box)).strip()
+        return {"fields": fields, "pages": [pytesseract.image_to_string(page) for page in pages]}
+    except PermanentExtractionError:
+        raise
+    except Exception as e:
+        raise ExtractionError(str(e)) from e
+
+
+def invoice_number_of(extracted: Dict):
+    number = (extracted.get("fields") or {}).get("invoice_number")
+    return number[:INVOICE_NUMBER_MAX_LENGTH] if number else None
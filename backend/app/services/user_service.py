@@ -1,6 +1,6 @@
 from datetime import datetime
+from typing import Optional
 from sqlalchemy.exc import SQLAlchemyError
-from passlib.context import CryptContext
 from app.models.user_model import User
 from app.schemas.user_schema import (
     UserCreate,
@@ -9,13 +9,12 @@ from app.schemas.user_schema import (
     PasswordUpdate,
     UserResponse,
 )
+from app.core.cache import user_cache
 from app.core.result import Result
 from app.core.logger import logger
+from app.core.security import PasswordHasherBusy, password_hasher
 from app.repositories.user_repository import UserRepository
-import hashlib
-
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class UserService:
@@ -26,31 +25,37 @@ class UserService:
     def __init__(self, repo: UserRepository):
         self.repo = repo
 
-    # 🔐 Password Utilities
-    def hash_password(self, password: str) -> str:
-        sha256_hashed = hashlib.sha256(password.encode("utf-8")).hexdigest()
-        return pwd_context.hash(sha256_hashed)
+    # 🔐 Password Utilities (bcrypt runs on the password hasher's process pool)
+    async def hash_password(self, password: str) -> str:
+        return await password_hasher.hash(password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(plain_password, hashed_password)
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        sha256_hashed = hashlib.sha256(
-            plain_password.encode("utf-8")).hexdigest()
-        return pwd_context.verify(sha256_hashed, hashed_password)
+    async def get_all_users(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                            **filters) -> Result:
+        key = ("list", limit, after, tuple(sorted(filters.items())))
+        return await user_cache.get_or_load(key, lambda: self._get_all_users(limit, after, **filters))
 
-    async def get_all_users(self) -> Result:
+    async def _get_all_users(self, limit: int, after: Optional[str], **filters) -> Result:
         try:
-            repo_result = await self.repo.get_all()
+            repo_result = await self.repo.get_all(limit=limit, after=after, **filters)
 
             if not repo_result.success:
                 return repo_result
 
-            user_list = [UserResponse.from_orm(u) for u in repo_result.data]
-            response = UserListResponse(users=user_list, total=len(user_list))
+            page = repo_result.data
+            user_list = [UserResponse.from_orm(u) for u in page.items]
+            response = UserListResponse(users=user_list, total=page.total, next_cursor=page.next_cursor)
             return Result.Ok(data=response.dict())
         except SQLAlchemyError:
             logger.exception("Error fetching users in service.")
             return Result.Fail("Error fetching users in service", code=500)
 
     async def get_user_by_id(self, user_id: int) -> Result:
+        return await user_cache.get_or_load(("id", user_id), lambda: self._get_user_by_id(user_id))
+
+    async def _get_user_by_id(self, user_id: int) -> Result:
         try:
             result = await self.repo.get_by_id(user_id)
 
@@ -84,7 +89,7 @@ class UserService:
 
     async def create_user(self, data: UserCreate) -> Result:
         try:
-            hash_password = self.hash_password(data.password)
+            hash_password = await self.hash_password(data.password)
 
             user = User(
                 bio_id=data.bio_id,
@@ -94,82 +99,57 @@ class UserService:
                 created_at=datetime.now(),
             )
             created = await self.repo.create(user)
+            if not created.success:
+                return created
+            await user_cache.invalidate()
             user_data = UserResponse.from_orm(created.data).dict()
             return Result.Ok(user_data, message="User created successfully", code=201)
+        except PasswordHasherBusy:
+            return Result.Fail("Too many password operations in progress, retry shortly", code=503)
         except SQLAlchemyError:
-            self.repo.rollback()
+            await self.repo.rollback()
             logger.exception("Database error while creating user.")
             return Result.Fail("Database error while creating user", code=500)
         except Exception as e:
-            self.repo.rollback()
+            await self.repo.rollback()
             logger.exception("Unexpected error while creating user.")
             return Result.Fail(str(e), code=500)
 
     async def update_user(self, user_id: int, data: UserUpdate) -> Result:
-        res = await self.repo.get_by_id(user_id)
-        if not res.success:
-            return Result.Fail("User not found", code=404)
-
-        try:
-            existing = res.data
-
-            existing.user_name = data.user_name
-            existing.bio_id = data.bio_id
-            existing.updated_by = data.updated_by
-            existing.updated_at = datetime.now()
-
-            updated = await self.repo.update(existing)
-            user_data = UserResponse.from_orm(updated.data).dict()
-
-            return Result.Ok(data=user_data, message="User updated successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Error updating user.")
-            return Result.Fail("Database error while updating user", code=500)
+        updated = await self.repo.update_by_id(user_id, {
+            "user_name": data.user_name,
+            "bio_id": data.bio_id,
+            "updated_by": data.updated_by,
+            "updated_at": datetime.now(),
+        })
+        if not updated.success:
+            return Result.Fail("User not found", code=404) if updated.code == 404 else updated
+
+        await user_cache.invalidate()
+        user_data = UserResponse.from_orm(updated.data).dict()
+        return Result.Ok(data=user_data, message="User updated successfully", code=200)
 
     async def update_password(self, user_id: int, data: PasswordUpdate) -> Result:
-        res = await self.repo.get_by_id(user_id)
-
-        if not res.success:
-            return Result.Fail("User not found", code=404)
-
         try:
-            new_password = self.hash_password(data.password)
+            password_hash = await self.hash_password(data.password)
+        except PasswordHasherBusy:
+            return Result.Fail("Too many password operations in progress, retry shortly", code=503)
 
-            existing = res.data
-            existing.password_hash = new_password
-            existing.updated_by = data.updated_by
-            existing.updated_at = datetime.now()
+        updated = await self.repo.update_by_id(user_id, {
+            "password_hash": password_hash,
+            "updated_by": data.updated_by,
+            "updated_at": datetime.now(),
+        })
+        if not updated.success:
+            return Result.Fail("User not found", code=404) if updated.code == 404 else updated
 
-            # Ensure update is awaited if async
-            updated = await self.repo.update(existing)
-
-            if not updated.success:
-                return Result.Fail("Failed to update password", code=500)
-
-            return Result.Ok(message="Password updated successfully", code=200)
-        except SQLAlchemyError as e:
-            await self.repo.rollback()
-            logger.exception(str(e))
-            return Result.Fail("Database error while updating password", code=500)
+        await user_cache.invalidate()
+        return Result.Ok(message="Password updated successfully", code=200)
 
     async def soft_delete_user(self, user_id: int) -> Result:
-        res = await self.repo.get_by_id(user_id)
+        deleted = await self.repo.soft_delete(user_id)
+        if not deleted.success:
+            return Result.Fail("User not found", code=404) if deleted.code == 404 else deleted
 
-        if not res.success:
-            return Result.Fail("User not found", code=404)
-
-        try:
-            existing = res.data
-            existing.is_deleted = 1
-            existing.updated_at = datetime.now()
-
-            deleted = await self.repo.update(existing)
-            if not deleted.success:
-                    return Result.Fail("Failed to deleted password", code=500)
-
-            return Result.Ok(message="User deleted successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Error deleting user.")
-            return Result.Fail("Database error while deleting user", code=500)
+        await user_cache.invalidate()
+        return Result.Ok(message="User deleted successfully", code=200)
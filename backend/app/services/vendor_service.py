@@ -1,25 +1,52 @@
 from datetime import datetime
+from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.vendor_model import Vendor
-from app.schemas.vendor_schema import VendorCreate, VendorUpdate, VendorResponse
+from app.schemas.vendor_schema import (
+    VendorCreate,
+    VendorUpdate,
+    VendorResponse,
+    VendorListResponse,
+    VendorTemplateResponse,
+    VendorTemplateListResponse,
+    VendorBulkItemResult,
+    VendorBulkResponse,
+)
+from app.core.cache import vendor_cache, extraction_cache
+from app.core.config import settings
 from app.core.result import Result
 from app.core.logger import logger
 from app.repositories.vendor_repository import VendorRepository
+from app.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class VendorService:
     def __init__(self, repo: VendorRepository):
         self.repo = repo
 
-    async def get_all_vendors(self) -> Result:
+    async def _invalidate(self):
+        # Templates embed the vendor, so both caches go
+        await vendor_cache.invalidate()
+        await extraction_cache.invalidate()
+
+    async def get_all_vendors(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                              **filters) -> Result:
+        key = ("list", limit, after, tuple(sorted(filters.items())))
+        return await vendor_cache.get_or_load(key, lambda: self._get_all_vendors(limit, after, **filters))
+
+    async def _get_all_vendors(self, limit: int, after: Optional[str], **filters) -> Result:
         try:
-            vendors = await self.repo.get_all()
+            vendors = await self.repo.get_all(limit=limit, after=after, **filters)
 
-            if not vendors.success or not vendors.data:
+            if not vendors.success:
+                return vendors
+            if not vendors.data.items:
                 return Result.Fail("No vendors found", code=404)
-            
-            vendor_list = [VendorResponse.from_orm(v).dict() for v in vendors.data]
-            return Result.Ok(vendor_list, message="Vendors fetched successfully", code=200)
+
+            vendor_list = [VendorResponse.from_orm(v) for v in vendors.data.items]
+            response = VendorListResponse(vendors=vendor_list, next_cursor=vendors.data.next_cursor,
+                                          total=vendors.data.total)
+            return Result.Ok(response.dict(), message="Vendors fetched successfully", code=200)
         except SQLAlchemyError:
             logger.exception("Database error while fetching vendors.")
             return Result.Fail("Database error while fetching vendors", code=500)
@@ -28,6 +55,9 @@ class VendorService:
             return Result.Fail(str(e), code=500)
 
     async def get_vendor_by_id(self, vendor_id: int) -> Result:
+        return await vendor_cache.get_or_load(("id", vendor_id), lambda: self._get_vendor_by_id(vendor_id))
+
+    async def _get_vendor_by_id(self, vendor_id: int) -> Result:
         res = await self.repo.get_by_id(vendor_id)
         if not res.success:
             return Result.Fail("Vendor not found", code=404)
@@ -42,6 +72,33 @@ class VendorService:
             logger.exception(str(e))
             return Result.Fail(str(e), code=500)
 
+    async def get_vendor_templates(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None,
+                                   **filters) -> Result:
+        """Vendors together with their active extraction zones."""
+        key = ("templates", limit, after, tuple(sorted(filters.items())))
+        return await extraction_cache.get_or_load(key, lambda: self._get_vendor_templates(limit, after, **filters))
+
+    async def _get_vendor_templates(self, limit: int, after: Optional[str], **filters) -> Result:
+        res = await self.repo.get_templates(limit=limit, after=after, **filters)
+        if not res.success:
+            return res
+
+        templates = [VendorTemplateResponse.from_orm(v) for v in res.data.items]
+        response = VendorTemplateListResponse(vendors=templates, next_cursor=res.data.next_cursor)
+        return Result.Ok(response.dict(), message="Vendor templates fetched successfully", code=200)
+
+    async def get_vendor_template_by_id(self, vendor_id: int) -> Result:
+        return await extraction_cache.get_or_load(
+            ("template", vendor_id), lambda: self._get_vendor_template_by_id(vendor_id))
+
+    async def _get_vendor_template_by_id(self, vendor_id: int) -> Result:
+        res = await self.repo.get_template_by_id(vendor_id)
+        if not res.success:
+            return Result.Fail("Vendor not found", code=404) if res.code == 404 else res
+
+        data = VendorTemplateResponse.from_orm(res.data).dict()
+        return Result.Ok(data, message="Vendor template fetched successfully", code=200)
+
     async def create_vendor(self, data: VendorCreate) -> Result:
         try:
             vendor = Vendor(
@@ -55,63 +112,79 @@ class VendorService:
             if not created.success or not created.data:
                 return Result.Fail("Failed to create vendor", code=500)
 
+            await self._invalidate()
             vendor_data = VendorResponse.from_orm(created.data).dict()
             return Result.Ok(vendor_data, message="Vendor created successfully", code=201)
 
         except SQLAlchemyError:
-            self.repo.rollback()
+            await self.repo.rollback()
             logger.exception("Database error while creating vendor.")
             return Result.Fail("Database error while creating vendor", code=500)
         except Exception as e:
-            self.repo.rollback()
+            await self.repo.rollback()
             logger.exception(str(e))
             return Result.Fail(str(e), code=500)
 
-
-    async def update_vendor(self, vendor_id: int, data: VendorUpdate) -> Result:
-        res = await self.repo.get_by_id(vendor_id)
-        if not res.success:
-            return Result.Fail("Vendor not found", code=404)
+    async def bulk_upsert_vendors(self, items: List[VendorCreate]) -> Result:
+        """
+        Creates new vendors and updates existing ones (matched on vendor_name)
+        in a single transaction, reporting the outcome per input item.
+        """
+        if not items:
+            return Result.Fail("No vendors supplied", code=400)
+        if len(items) > settings.BULK_MAX_ITEMS:
+            return Result.Fail(f"At most {settings.BULK_MAX_ITEMS} vendors per request", code=413)
+
+        names = [item.vendor_name for item in items]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            return Result.Fail(f"Duplicate vendor names in request: {', '.join(duplicates)}", code=400)
 
         try:
-            existing = res.data
-            existing.vendor_name = data.vendor_name
-            existing.is_deleted = data.is_deleted
-            existing.updated_by = data.updated_by
-            existing.updated_at = datetime.now()
+            now = datetime.now()
+            rows = [{**item.dict(), "created_at": now} for item in items]
+            res = await self.repo.bulk_upsert(rows)
+            if not res.success:
+                return res
+            await self._invalidate()
+
+            # Matched back on vendor_name: ON CONFLICT ... RETURNING does not promise input order
+            upserted = {vendor.vendor_name: (vendor, created) for vendor, created in res.data}
+            results = [
+                VendorBulkItemResult(index=i, status="created" if upserted[name][1] else "updated",
+                                     vendor=VendorResponse.from_orm(upserted[name][0]))
+                for i, name in enumerate(names)
+            ]
+            created_count = sum(1 for r in results if r.status == "created")
+            response = VendorBulkResponse(results=results, created=created_count,
+                                          updated=len(results) - created_count)
+            return Result.Ok(response.dict(), message="Vendors upserted successfully", code=200)
+        except Exception as e:
+            logger.exception(str(e))
+            return Result.Fail(str(e), code=500)
 
-            updated = await self.repo.update(existing)
+    async def update_vendor(self, vendor_id: int, data: VendorUpdate) -> Result:
+        try:
+            updated = await self.repo.update_by_id(vendor_id, {
+                "vendor_name": data.vendor_name,
+                "is_deleted": data.is_deleted,
+                "updated_by": data.updated_by,
+                "updated_at": datetime.now(),
+            })
+            if not updated.success:
+                return Result.Fail("Vendor not found", code=404) if updated.code == 404 else updated
+
+            await self._invalidate()
             vendor_data = VendorResponse.from_orm(updated.data).dict()
             return Result.Ok(vendor_data, message="Vendor updated successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Database error while updating vendor.")
-            return Result.Fail("Database error while updating vendor", code=500)
         except Exception as e:
-            self.repo.rollback()
             logger.exception(str(e))
             return Result.Fail(str(e), code=500)
 
     async def soft_delete_vendor(self, vendor_id: int) -> Result:
-        res = await self.repo.get_by_id(vendor_id)
-        if not res.success:
-            return Result.Fail("Vendor not found", code=404)
-
-        try:
-            existing = res.data
-            existing.is_deleted = 1            
-            existing.updated_at = datetime.now()
-
-            deleted = await self.repo.update(existing)
-            if not deleted.success:
-                return Result.Fail("Failed to delete vendor", code=500)
+        deleted = await self.repo.soft_delete(vendor_id)
+        if not deleted.success:
+            return Result.Fail("Vendor not found", code=404) if deleted.code == 404 else deleted
 
-            return Result.Ok(message="Vendor deleted successfully", code=200)
-        except SQLAlchemyError:
-            self.repo.rollback()
-            logger.exception("Database error while deleting vendor.")
-            return Result.Fail("Database error while deleting vendor", code=500)
-        except Exception as e:
-            self.repo.rollback()
-            logger.exception(str(e))
-            return Result.Fail(str(e), code=500)
+        await self._invalidate()
+        return Result.Ok(message="Vendor deleted successfully", code=200)
@@ -2,6 +2,8 @@ from fastapi.responses import JSONResponse
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
 
+RETRY_AFTER_SECONDS = 1
+
 class ApiResponse:
     @staticmethod
     def success(message="Success", code=status.HTTP_200_OK, data=None):
@@ -16,11 +18,21 @@ class ApiResponse:
 
     @staticmethod
     def error(message="Error", code=status.HTTP_400_BAD_REQUEST, details=None):
+        # Overload responses tell the client when to come back
+        headers = {"Retry-After": str(RETRY_AFTER_SECONDS)} if code == status.HTTP_503_SERVICE_UNAVAILABLE else None
         return JSONResponse(
             status_code=code,
+            headers=headers,
             content=jsonable_encoder({
                 "response_status": False,
                 "message": message,
                 "source_output": details,
             }),
         )
+
+    @staticmethod
+    def from_result(result):
+        """Maps a service-layer Result onto the standard success/error envelope."""
+        if not result.success:
+            return ApiResponse.error(result.message, result.code, result.data)
+        return ApiResponse.success(result.message, result.code, result.data)
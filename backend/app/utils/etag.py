@@ -0,0 +1,60 @@
+import hashlib
+from datetime import date, datetime
+from typing import Any, Iterable, Optional
+from fastapi import Response
+from app.core.result import Result
+from app.utils.api_response import ApiResponse
+
+
+def _version(row: dict, id_field: str) -> str:
+    # Every write sets updated_at; rows never written since insert fall back to created_at
+    stamp = row.get("updated_at") or row.get("created_at")
+    if isinstance(stamp, (datetime, date)):
+        stamp = stamp.isoformat()  # cached copies hold the JSON form, so hash that form
+    return f"{row[id_field]}@{stamp}"
+
+
+def make_etag(parts: Iterable[Any]) -> str:
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode("utf-8"), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def record_etag(record: dict, id_field: str) -> str:
+    """Strong ETag for a single row, from its id and last write time."""
+    return make_etag([_version(record, id_field)])
+
+
+def page_etag(items: Iterable[dict], id_field: str, next_cursor: Optional[str] = None,
+              total: Optional[int] = None) -> str:
+    """Strong ETag for a list page: the version of every row on it plus the paging fields."""
+    return make_etag([*(_version(item, id_field) for item in items), next_cursor, total])
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison (RFC 9110 13.1.2), so W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def conditional_response(result: Result, etag: Optional[str], if_none_match: Optional[str]):
+    """
+    304 with no body when the client's copy is current, otherwise the usual
+    envelope with the ETag attached. Errors never carry an ETag, nor do
+    responses passed etag=None.
+    """
+    if not result.success:
+        return ApiResponse.error(result.message, result.code)
+    if etag is None:
+        return ApiResponse.success(result.message, result.code, result.data)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    response = ApiResponse.success(result.message, result.code, result.data)
+    response.headers.update(headers)
+    return response
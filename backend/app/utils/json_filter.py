@@ -0,0 +1,106 @@
+import json
+import math
+import re
+from typing import Any, List
+
+# path  op  value, e.g. "total > 10000", "supplier.gstin = 29ABCDE1234F1Z5"
+PREDICATE_PATTERN = re.compile(r"^\s*([A-Za-z_][\w]*(?:\.[A-Za-z_][\w]*)*)\s*(>=|<=|!=|=|>|<)\s*([^<>=!\s].*?)\s*$")
+
+JSONPATH_OPERATORS = {"=": "==", "!=": "!=", ">": ">", ">=": ">=", "<": "<", "<=": "<="}
+
+
+class InvalidPredicate(ValueError):
+    """Raised for a JSON filter expression that cannot be parsed."""
+
+
+class JsonPredicate:
+    """A single comparison against a value inside extracted_json."""
+
+    def __init__(self, path: List[str], op: str, value: Any):
+        self.path = path
+        self.op = op
+        self.value = value
+
+    def to_jsonpath(self) -> str:
+        """
+        Postgres jsonpath predicate for the @@ operator. The jsonb_path_ops GIN
+        index can only use its equality (==) conditions; ranges such as
+        `total > 10000` are checked row by row.
+        """
+        path = "$" + "".join("." + json.dumps(key) for key in self.path)
+        return f"{path} {JSONPATH_OPERATORS[self.op]} {json.dumps(self.value)}"
+
+    def matches(self, document: Any) -> bool:
+        """
+        Python evaluator mirroring jsonpath lax mode, used where the database
+        cannot evaluate the predicate (SQLite): arrays are unwrapped along the
+        path, missing keys and mismatched types never match.
+        """
+        return any(_compare(candidate, self.op, self.value) for candidate in _resolve(document, self.path))
+
+
+def parse_predicate(expression: str) -> JsonPredicate:
+    match = PREDICATE_PATTERN.match(expression)
+    if not match:
+        raise InvalidPredicate(f"Invalid JSON filter '{expression}', expected '<path> <op> <value>'")
+
+    path, op, raw_value = match.groups()
+    try:
+        value = json.loads(raw_value)
+    except ValueError:
+        value = raw_value  # bare strings need no quotes: supplier.gstin = 29ABC
+
+    if isinstance(value, (dict, list)):
+        raise InvalidPredicate(f"Only scalar values can be compared in '{expression}'")
+    # json.loads accepts NaN, Infinity and 1e999, which jsonpath rejects
+    if isinstance(value, float) and not math.isfinite(value):
+        raise InvalidPredicate(f"Numbers must be finite in '{expression}'")
+    if op not in ("=", "!=") and _kind(value) not in ("number", "string"):
+        raise InvalidPredicate(f"Operator '{op}' needs a number or string in '{expression}'")
+    return JsonPredicate(path.split("."), op, value)
+
+
+def _resolve(document: Any, path: List[str]) -> List[Any]:
+    values = [document]
+    for key in path:
+        next_values = []
+        for value in values:
+            for item in (value if isinstance(value, list) else [value]):
+                if isinstance(item, dict) and key in item:
+                    next_values.append(item[key])
+        values = next_values
+
+    resolved = []
+    for value in values:
+        resolved.extend(value if isinstance(value, list) else [value])
+    return resolved
+
+
+def _kind(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return "other"
+
+
+def _compare(actual: Any, op: str, expected: Any) -> bool:
+    if _kind(actual) != _kind(expected) or _kind(actual) == "other":
+        return False
+    if op == "=":
+        return actual == expected
+    if op == "!=":
+        return actual != expected
+    if _kind(actual) not in ("number", "string"):
+        return False
+    if op == ">":
+        return actual > expected
+    if op == ">=":
+        return actual >= expected
+    if op == "<":
+        return actual < expected
+    return actual <= expected
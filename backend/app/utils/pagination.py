@@ -0,0 +1,44 @@
+import base64
+import json
+from typing import Any, List, Literal, Optional
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# How list endpoints compute `total`: not at all, COUNT(*), or the PostgreSQL planner estimate
+TotalMode = Literal["none", "exact", "estimated"]
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor that was not issued by the API."""
+
+
+class Page:
+    """
+    One keyset page: the rows plus the cursor to fetch the next page (None
+    when exhausted) and, when requested, the total over all pages.
+    """
+
+    def __init__(self, items: List[Any], next_cursor: Optional[str] = None, total: Optional[int] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+
+
+def encode_cursor(key: Any) -> str:
+    """Opaque, URL-safe token for the last key of a page."""
+    raw = json.dumps({"k": key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> int:
+    """Key of a cursor issued by encode_cursor; every keyset column is an integer id."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["k"]
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursor(f"Invalid pagination cursor '{token}'")
+    # Forged keys ('abc', [1, 2], true) would otherwise fail inside the database as a 500
+    if not isinstance(key, int) or isinstance(key, bool):
+        raise InvalidCursor(f"Invalid pagination cursor '{token}'")
+    return key
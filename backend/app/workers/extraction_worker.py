@@ -0,0 +1,193 @@
+"""
+Extraction workers: separate processes that take invoices off the
+tb_inai_extraction_job queue, OCR them (app.services.invoice_extractor) and
+store the JSON through ReturnJsonRepository.create.
+
+Each process runs one job at a time, so EXTRACTION_WORKER_PROCESSES (per
+host) is the concurrency limit; any number of hosts can share the queue.
+A job whose worker dies or hangs becomes claimable again once its
+visibility timeout expires, failed runs are retried with exponential
+backoff up to EXTRACTION_MAX_ATTEMPTS, and delivery is at-least-once: a run
+that outlives its visibility timeout loses its claim and its record is
+soft-deleted.
+
+Usage (from backend/):
+    python -m app.workers.extraction_worker
+    python -m app.workers.extraction_worker --processes 4
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from app.core.config import settings
+from app.core.logger import logger
+from app.models.extracted_json_model import ReturnJson
+from app.models.extraction_job_model import ExtractionJob
+from app.repositories.extracted_json_repository import ReturnJsonRepository
+from app.repositories.extraction_job_repository import ExtractionJobRepository
+from app.repositories.vendor_repository import VendorRepository
+from app.services.invoice_extractor import PermanentExtractionError, extract_invoice, invoice_number_of
+
+# Seconds between liveness checks of the worker processes by the supervisor
+SUPERVISE_INTERVAL_SECONDS = 1.0
+
+
+class ExtractionWorker:
+    """
+    One claim-extract-store loop. `extract(document, content_type, zones)`
+    is the OCR step, replaceable for tests.
+    """
+
+    def __init__(self, session_factory, worker_id: str,
+                 extract: Callable[[bytes, str, List[Dict]], Dict] = extract_invoice,
+                 visibility_timeout_seconds: float = settings.EXTRACTION_VISIBILITY_TIMEOUT_SECONDS,
+                 retry_backoff_seconds: float = settings.EXTRACTION_RETRY_BACKOFF_SECONDS,
+                 poll_interval_seconds: float = settings.EXTRACTION_POLL_INTERVAL_SECONDS):
+        self.session_factory = session_factory
+        self.worker_id = worker_id
+        self.extract = extract
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+
+    async def run_once(self) -> bool:
+        """Claims and runs at most one job; False when there was nothing to do."""
+        with self.session_factory() as session:
+            jobs = ExtractionJobRepository(session)
+            claimed = await jobs.claim(self.worker_id, self.visibility_timeout_seconds)
+            if not claimed.success:
+                return False
+            if claimed.data is None:
+                await jobs.fail_expired()
+                return False
+            await self.process(session, claimed.data)
+            return True
+
+    async def run_forever(self, stop: asyncio.Event):
+        logger.info("extraction_worker_started", worker_id=self.worker_id)
+        while not stop.is_set():
+            if await self.run_once():
+                continue
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+        logger.info("extraction_worker_stopped", worker_id=self.worker_id)
+
+    async def _zones(self, session, vendor_id: Optional[int]) -> List[Dict]:
+        if vendor_id is None:
+            return []
+        template = await VendorRepository(session).get_template_by_id(vendor_id)
+        if not template.success:
+            return []
+        return [{"extraction_name": zone.extraction_name, "x_min": zone.x_min, "x_max": zone.x_max,
+                 "y_min": zone.y_min, "y_max": zone.y_max} for zone in template.data.extraction_details]
+
+    async def process(self, session, job: ExtractionJob):
+        jobs = ExtractionJobRepository(session)
+        started = time.perf_counter()
+        try:
+            extracted = self.extract(job.document, job.content_type, await self._zones(session, job.vendor_id))
+        except PermanentExtractionError as e:
+            logger.error("extraction_job_failed", job_id=job.job_id, attempts=job.attempts, error=str(e))
+            await jobs.fail(job, self.worker_id, str(e))
+            return
+        except Exception as e:
+            await self._retry_or_fail(jobs, job, str(e) or type(e).__name__)
+            return
+
+        returns = ReturnJsonRepository(session)
+        record = ReturnJson(invoice_number=invoice_number_of(extracted), extracted_json=extracted,
+                            vendor_id=job.vendor_id, created_by=job.created_by,
+                            created_at=datetime.now(), is_deleted=0)
+        created = await returns.create(record)
+        if not created.success:
+            await self._retry_or_fail(jobs, job, created.message)
+            return
+
+        done = await jobs.complete(job, self.worker_id, record.return_id)
+        if not done.success:
+            # The visibility timeout expired and another worker owns the job now
+            logger.warning("extraction_job_claim_lost", job_id=job.job_id, worker_id=self.worker_id,
+                           return_id=record.return_id)
+            await returns.soft_delete(record.return_id)
+            return
+        logger.info("extraction_job_succeeded", job_id=job.job_id, return_id=record.return_id,
+                    attempts=job.attempts, duration_ms=round((time.perf_counter() - started) * 1000, 2))
+
+    async def _retry_or_fail(self, jobs: ExtractionJobRepository, job: ExtractionJob, error: str):
+        if job.attempts >= job.max_attempts:
+            logger.error("extraction_job_failed", job_id=job.job_id, attempts=job.attempts, error=error)
+            await jobs.fail(job, self.worker_id, error)
+            return
+        delay = self.retry_backoff_seconds * 2 ** (job.attempts - 1)
+        logger.warning("extraction_job_retry", job_id=job.job_id, attempts=job.attempts,
+                       retry_in_seconds=delay, error=error)
+        await jobs.fail(job, self.worker_id, error, retry_at=datetime.now() + timedelta(seconds=delay))
+
+
+def run_worker_process(index: int):
+    """Entry point of one worker process."""
+    from app.core.database import SessionLocal
+    from app.core.logger import configure_logging
+
+    configure_logging()
+    worker = ExtractionWorker(SessionLocal, f"{socket.gethostname()}:{os.getpid()}")
+
+    async def main():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stop.set)  # finish the current job, then exit
+        await worker.run_forever(stop)
+
+    asyncio.run(main())
+
+
+def supervise(processes: int):
+    """Starts the worker processes and restarts any that die until SIGTERM/SIGINT."""
+    # spawn: never fork a process that already holds DB connections and logging threads
+    context = multiprocessing.get_context("spawn")
+    stopping = False
+
+    def start(index: int):
+        process = context.Process(target=run_worker_process, args=(index,), name=f"extraction-worker-{index}")
+        process.start()
+        return process
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    workers = [start(index) for index in range(processes)]
+    logger.info("extraction_workers_started", processes=processes)
+
+    while not stopping:
+        for index, process in enumerate(workers):
+            if not process.is_alive():
+                logger.warning("extraction_worker_restarted", index=index, exitcode=process.exitcode)
+                workers[index] = start(index)
+        time.sleep(SUPERVISE_INTERVAL_SECONDS)
+
+    for process in workers:
+        process.terminate()
+    for process in workers:
+        process.join()
+    logger.info("extraction_workers_stopped", processes=processes)
+
+
+if __name__ == "__main__":
+    from app.core.logger import configure_logging
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=settings.EXTRACTION_WORKER_PROCESSES)
+    args = parser.parse_args()
+    configure_logging()
+    supervise(args.processes)
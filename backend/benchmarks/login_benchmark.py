@@ -0,0 +1,114 @@
+"""
+Login throughput under concurrency, with bcrypt inline on the event loop
+versus on the password hasher's process pool.
+
+Fires --logins concurrent POST /auth/login requests (--concurrency at a
+time) at an in-process app while a probe request runs every 10 ms, and
+reports logins/s plus how late the probe ran: with bcrypt inline every
+other request on the worker waits behind each hash. On a single core the
+pool cannot raise throughput, only keep the loop responsive.
+
+Usage (from backend/):
+    python -m benchmarks.login_benchmark
+    python -m benchmarks.login_benchmark --logins 200 --concurrency 50 --pool-workers 4
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import auth_route_v1
+from app.core.database import get_db
+from app.core.security import PasswordHasher, hash_password_sync
+from app.models import Log, User
+from app.services import auth_service
+
+
+def build_app():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    engine = engine.execution_options(schema_translate_map={"invoai": None})
+    for table in (User.__table__, Log.__table__):
+        table.create(engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+    with Session() as session:
+        session.add(User(bio_id=1, user_name="alice", password_hash=hash_password_sync("s3cret"), is_deleted=0))
+        session.commit()
+
+    def session_per_request():
+        with Session() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(auth_route_v1.router, prefix="/api/v1/auth")
+    app.dependency_overrides[get_db] = session_per_request
+
+    @app.get("/probe")
+    async def probe():
+        return {}
+
+    return app
+
+
+async def run(app, hasher: PasswordHasher):
+    auth_service.password_hasher = hasher
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/api/v1/auth/login", json={"user_name": "alice", "password": "s3cret"})  # warm up
+
+        limit = asyncio.Semaphore(args.concurrency)
+        statuses = []
+
+        async def login():
+            async with limit:
+                response = await client.post("/api/v1/auth/login", json={"user_name": "alice", "password": "s3cret"})
+                statuses.append(response.status_code)
+
+        probes = []
+        done = asyncio.Event()
+
+        async def probe():
+            # A 10 ms sleep plus a trivial request; anything beyond that is time spent waiting for the loop
+            while not done.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                await client.get("/probe")
+                probes.append((time.perf_counter() - started) * 1000 - 10)
+
+        prober = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await prober
+
+    ok = statuses.count(200)
+    print(f"{hasher.workers or 'inline':>6} | {ok / elapsed:8.1f} logins/s | ok {ok:4d} | 503 {statuses.count(503):4d} | "
+          f"probe delay median {statistics.median(probes):7.1f} ms  max {max(probes):7.1f} ms")
+    hasher.shutdown()
+
+
+def main():
+    app = build_app()
+    print(f"{args.logins} logins, {args.concurrency} concurrent\n")
+    print("  pool |  throughput     |         |          | event-loop responsiveness")
+    asyncio.run(run(app, PasswordHasher(workers=0, max_pending=args.max_pending)))
+    asyncio.run(run(app, PasswordHasher(workers=args.pool_workers, max_pending=args.max_pending)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--pool-workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--max-pending", type=int, default=64)
+    args = parser.parse_args()
+    main()
@@ -0,0 +1,117 @@
+"""
+Requests/second through the request logging middleware: the previous
+stack (RequestContextLogMiddleware as a BaseHTTPMiddleware plus the
+@app.middleware("http") log_requests_middleware, two log lines per
+request) versus the pure ASGI RequestContextLogMiddleware (one line).
+
+The app is driven directly over ASGI (no server, no HTTP client) and the
+log lines are rendered as JSON into /dev/null, so the numbers are the
+middleware and logging overhead around a trivial endpoint.
+
+Usage (from backend/):
+    python -m benchmarks.middleware_benchmark
+    python -m benchmarks.middleware_benchmark --requests 20000 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import structlog
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.logger import logger
+from app.core.middleware.log_context import RequestContextLogMiddleware
+
+
+class LegacyContextMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        structlog.contextvars.bind_contextvars(request_id=str(uuid.uuid4()), path=str(request.url.path),
+                                              method=request.method)
+        response = await call_next(request)
+        structlog.contextvars.clear_contextvars()
+        return response
+
+
+async def legacy_log_requests(request: Request, call_next):
+    start_time = time.time()
+    logger.info(f"➡️  {request.method} {request.url.path}")
+    response = await call_next(request)
+    process_time = (time.time() - start_time) * 1000
+    logger.info(f"⬅️  {request.method} {request.url.path} - {response.status_code} ({process_time:.2f}ms)")
+    return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if stack == "legacy":
+        app.middleware("http")(legacy_log_requests)
+        app.add_middleware(LegacyContextMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(RequestContextLogMiddleware)
+    return app
+
+
+SCOPE = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+         "path": "/ping", "raw_path": b"/ping", "root_path": "", "query_string": b"",
+         "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1234), "server": ("bench", 80)}
+
+
+async def call(app):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(dict(SCOPE), receive, send)
+
+
+async def measure(app) -> float:
+    for _ in range(200):  # warm up
+        await call(app)
+
+    remaining = args.requests
+
+    async def client():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await call(app)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    return args.requests / (time.perf_counter() - started)
+
+
+def main():
+    structlog.configure(
+        processors=[structlog.contextvars.merge_contextvars, structlog.processors.add_log_level,
+                    structlog.processors.TimeStamper(fmt="iso"), structlog.processors.JSONRenderer()],
+        logger_factory=structlog.PrintLoggerFactory(file=open(os.devnull, "w")),
+    )
+    print(f"{args.requests} requests, {args.concurrency} concurrent\n")
+    results = {}
+    for stack, label in [("none", "no logging middleware"), ("legacy", "BaseHTTPMiddleware + http middleware"),
+                         ("asgi", "pure ASGI middleware")]:
+        app = build_app(stack)
+        results[stack] = asyncio.run(measure(app))
+        print(f"{label:<38} {results[stack]:10.0f} req/s")
+    print(f"\npure ASGI vs legacy: {results['asgi'] / results['legacy']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    main()
@@ -0,0 +1,77 @@
+import os
+
+# Point the app at SQLite before any app module reads the environment
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.core.database import Base
+import app.models  # noqa: F401  register all tables on Base.metadata
+
+
+def _attach_schema(schema_file):
+    """SQLite has no schemas; attach a second database file under the 'invoai' name."""
+    def attach(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"ATTACH DATABASE '{schema_file}' AS invoai")
+        cursor.close()
+    return attach
+
+
+@pytest.fixture(autouse=True)
+def empty_service_caches():
+    """Every test starts from a fresh database, so cached reads must not leak between tests."""
+    from app.core.cache import CACHES
+    for cache in CACHES:
+        cache.local.invalidate()
+        cache.reset_stats()
+
+
+@pytest.fixture
+def sync_engine(tmp_path):
+    # Repositories run sync Session calls on db_threadpool, so the connection crosses threads
+    engine = create_engine(f"sqlite:///{tmp_path / 'main.db'}", connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", _attach_schema(tmp_path / "invoai.db"))
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(sync_engine):
+    session = sessionmaker(bind=sync_engine, autoflush=False, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+@pytest_asyncio.fixture
+async def async_db_session(sync_engine, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'main.db'}")
+    event.listen(engine.sync_engine, "connect", _attach_schema(tmp_path / "invoai.db"))
+    async with async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def api_client(db_session):
+    """TestClient over the v1 routers with get_db bound to the SQLite test session."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.database import get_db
+    from app.api.v1 import (auth_route_v1, user_routes_v1, vendor_routes_v1, internal_routes_v1,
+                            extraction_details_route_v1, extracted_json_route_v1, extraction_job_route_v1)
+
+    app = FastAPI()
+    app.include_router(auth_route_v1.router, prefix="/api/v1/auth")
+    app.include_router(user_routes_v1.router, prefix="/api/v1/user")
+    app.include_router(vendor_routes_v1.router, prefix="/api/v1/vendor")
+    app.include_router(extraction_details_route_v1.router, prefix="/api/v1/extraction-details")
+    app.include_router(extracted_json_route_v1.router, prefix="/api/v1/extracted-json")
+    app.include_router(extraction_job_route_v1.router, prefix="/api/v1/extraction-jobs")
+    app.include_router(internal_routes_v1.router, prefix="/api/v1/internal")
+    app.dependency_overrides[get_db] = lambda: db_session
+    return TestClient(app)
@@ -0,0 +1,124 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from app.core.middleware.admission import AdaptiveLimiter, AdmissionControlMiddleware, route_group
+
+
+def make_limiter(max_limit=2, max_queue=1, queue_timeout_ms=50.0, target_latency_ms=100.0, min_limit=1):
+    return AdaptiveLimiter("test", max_limit, min_limit, target_latency_ms, max_queue, queue_timeout_ms)
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_the_limit_queue_until_a_slot_frees():
+    limiter = make_limiter(max_limit=1)
+    assert await limiter.acquire()
+
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.stats()["queue_depth"] == 1
+
+    limiter.release(latency_ms=10)
+    assert await waiting
+    assert (limiter.in_flight, limiter.metrics["queued"], limiter.metrics["rejected"]) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_and_queue_timeout_are_rejected():
+    limiter = make_limiter(max_limit=1, max_queue=1)
+    assert await limiter.acquire()
+
+    results = await asyncio.gather(limiter.acquire(), limiter.acquire())
+
+    assert results == [False, False]
+    stats = limiter.stats()
+    assert (stats["rejected"], stats["queue_timeouts"]) == (2, 1)
+    assert (stats["in_flight"], stats["queue_depth"]) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = make_limiter(max_limit=1, queue_timeout_ms=10_000)
+    assert await limiter.acquire()
+
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    limiter.release(latency_ms=10)
+    assert (limiter.in_flight, limiter.stats()["queue_depth"]) == (0, 0)
+
+
+def test_slow_responses_shrink_the_limit_once_per_window_and_fast_ones_grow_it_back():
+    limiter = make_limiter(max_limit=10, target_latency_ms=60_000)
+    for _ in range(5):
+        limiter.in_flight += 1
+        limiter.release(latency_ms=120_000)
+    assert limiter.limit == 9.0
+    assert limiter.metrics["decreases"] == 1
+
+    for _ in range(20):
+        limiter.in_flight += 1
+        limiter.release(latency_ms=10)
+    assert limiter.limit == 10.0
+
+
+def test_limit_never_drops_below_the_minimum():
+    limiter = make_limiter(max_limit=4, target_latency_ms=0, min_limit=2)
+    for _ in range(50):
+        limiter.in_flight += 1
+        limiter.release(latency_ms=1)
+
+    assert limiter.limit == 2
+
+
+def test_route_groups():
+    assert route_group("/api/v1/auth/login", "POST") == "auth"
+    assert route_group("/api/v1/extraction-jobs/", "POST") == "extraction"
+    assert route_group("/api/v1/extracted-json/export", "GET") == "extraction"
+    assert route_group("/api/v1/vendor/get-all-vendors", "GET") == "reads"
+    assert route_group("/api/v1/vendor/create-new-vendor", "POST") == "writes"
+    assert route_group("/api/v1/internal/admission-stats", "GET") == "internal"
+    assert route_group("/docs", "GET") is None
+
+
+@pytest.mark.asyncio
+async def test_saturated_group_is_shed_with_503_and_retry_after():
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/api/v1/vendor/slow")
+    async def slow():
+        await release.wait()
+        return {"ok": True}
+
+    @app.get("/api/v1/internal/stats")
+    async def stats():
+        return {"ok": True}
+
+    limiter = make_limiter(max_limit=1, max_queue=0)
+    transport = httpx.ASGITransport(app=AdmissionControlMiddleware(app, limiters={"reads": limiter}))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/api/v1/vendor/slow"))
+        while limiter.in_flight == 0:
+            await asyncio.sleep(0.001)
+
+        shed = await client.get("/api/v1/vendor/slow")
+        exempt = await client.get("/api/v1/internal/stats")
+        release.set()
+        admitted = await first
+
+    assert (admitted.status_code, exempt.status_code) == (200, 200)
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert shed.json()["message"] == "Server is busy, try again shortly"
+    assert (limiter.metrics["admitted"], limiter.metrics["rejected"], limiter.in_flight) == (1, 1, 0)
+
+
+def test_admission_stats_route(api_client):
+    response = api_client.get("/api/v1/internal/admission-stats")
+
+    assert response.status_code == 200
+    assert set(response.json()["source_output"]) == {"reads", "writes", "auth", "extraction"}
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import sessionmaker
+from app.models.log_model import Log
+from app.models.user_model import User
+from app.repositories.auth_repository import AuthRepository
+from app.schemas.auth_schema import LoginRequest
+from app.services.audit_log_writer import AuditLogWriter
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture
+def make_writer(sync_engine):
+    factory = sessionmaker(bind=sync_engine, expire_on_commit=False)
+
+    def make(batch_size=100, flush_interval_ms=10_000, queue_size=1000):
+        return AuditLogWriter(batch_size, flush_interval_ms, queue_size, session_factory=factory)
+    return make
+
+
+@pytest.fixture
+def inserts(sync_engine):
+    captured = []
+    event.listen(sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statement.startswith("INSERT") and captured.append(statement))
+    return captured
+
+
+def log_count(db_session):
+    return db_session.execute(select(func.count()).select_from(Log)).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full(make_writer, db_session, inserts):
+    writer = make_writer(batch_size=3)
+    writer.start()
+    for user_id in range(7):
+        assert writer.enqueue(user_id, datetime.now())
+    await asyncio.sleep(0.05)
+
+    assert log_count(db_session) == 6  # two full batches; the 7th waits for the interval
+    await writer.stop()
+    assert log_count(db_session) == 7
+    assert len(inserts) == 3
+    assert writer.metrics["written"] == 7 and writer.metrics["batches"] == 3
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_interval(make_writer, db_session, inserts):
+    writer = make_writer(flush_interval_ms=50)
+    writer.start()
+    writer.enqueue(1, datetime.now())
+    writer.enqueue(2, datetime.now())
+
+    await asyncio.sleep(0.2)
+    assert log_count(db_session) == 2
+    assert len(inserts) == 1
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_when_not_running_or_full(make_writer):
+    writer = make_writer(queue_size=1)
+    assert not writer.enqueue(1, datetime.now())
+
+    writer.start()
+    assert writer.enqueue(1, datetime.now())
+    assert not writer.enqueue(2, datetime.now())
+    await writer.stop()
+    assert not writer.enqueue(3, datetime.now())
+    assert writer.metrics["fallbacks"] == 3
+
+
+@pytest.mark.asyncio
+async def test_login_writes_audit_row_inline_without_writer(db_session):
+    service = AuthService(AuthRepository(db_session))
+    db_session.add(User(bio_id=1, user_name="alice", password_hash=await service.hash_password("s3cret")))
+    db_session.commit()
+
+    result = await service.login(LoginRequest(user_name="alice", password="s3cret"))
+
+    assert result.success
+    assert log_count(db_session) == 1
@@ -0,0 +1,78 @@
+from sqlalchemy import event
+from app.models.vendor_model import Vendor
+from app.repositories.extraction_details_repository import ExtractionRepository
+from app.repositories.vendor_repository import VendorRepository
+
+
+def test_bulk_upsert_vendors_reports_created_and_updated(api_client, db_session):
+    db_session.add(Vendor(vendor_name="Acme", is_deleted=1))
+    db_session.commit()
+
+    response = api_client.post("/api/v1/vendor/bulk-upsert-vendors", json=[
+        {"vendor_name": "Acme", "is_deleted": 0, "created_by": 7},
+        {"vendor_name": "Globex", "created_by": 7},
+    ])
+
+    body = response.json()["source_output"]
+    assert response.status_code == 200
+    assert [(r["index"], r["status"], r["vendor"]["vendor_name"]) for r in body["results"]] == [
+        (0, "updated", "Acme"), (1, "created", "Globex")]
+    assert (body["created"], body["updated"]) == (1, 1)
+    assert body["results"][0]["vendor"]["is_deleted"] == 0
+
+
+def test_bulk_upsert_rejects_duplicate_names(api_client):
+    response = api_client.post("/api/v1/vendor/bulk-upsert-vendors",
+                               json=[{"vendor_name": "Acme"}, {"vendor_name": "Acme"}])
+    assert response.status_code == 400
+
+
+def test_bulk_create_extractions_is_one_insert(api_client, db_session, sync_engine):
+    vendor = Vendor(vendor_name="Acme")
+    db_session.add(vendor)
+    db_session.commit()
+
+    statements = []
+    event.listen(sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    zones = [{"extraction_name": f"zone_{i}", "x_min": i, "x_max": i + 10, "vendor_id": vendor.vendor_id}
+             for i in range(500)]
+    response = api_client.post("/api/v1/extraction-details/bulk", json=zones)
+
+    body = response.json()["source_output"]
+    assert response.status_code == 201
+    assert body["created"] == 500
+    assert body["results"][499]["extraction"]["extraction_name"] == "zone_499"
+    assert len([s for s in statements if s.startswith("INSERT")]) == 1
+
+
+def test_bulk_results_are_matched_on_natural_keys_not_returning_order(api_client, db_session, monkeypatch):
+    vendor = Vendor(vendor_name="Acme")
+    db_session.add(vendor)
+    db_session.commit()
+    for repo, method in ((ExtractionRepository, "bulk_create"), (VendorRepository, "bulk_upsert")):
+        original = getattr(repo, method)
+
+        async def reversed_returning(self, rows, original=original):
+            result = await original(self, rows)
+            result.data = list(reversed(result.data))
+            return result
+        monkeypatch.setattr(repo, method, reversed_returning)
+
+    vendors = api_client.post("/api/v1/vendor/bulk-upsert-vendors",
+                              json=[{"vendor_name": "Acme"}, {"vendor_name": "Globex"}]).json()["source_output"]
+    zones = api_client.post("/api/v1/extraction-details/bulk", json=[
+        {"extraction_name": "total", "vendor_id": vendor.vendor_id},
+        {"extraction_name": "date", "vendor_id": vendor.vendor_id},
+    ]).json()["source_output"]
+
+    assert [(r["index"], r["status"], r["vendor"]["vendor_name"]) for r in vendors["results"]] == [
+        (0, "updated", "Acme"), (1, "created", "Globex")]
+    assert [(r["index"], r["extraction"]["extraction_name"]) for r in zones["results"]] == [(0, "total"), (1, "date")]
+
+
+def test_bulk_create_extractions_rejects_duplicate_zones(api_client):
+    response = api_client.post("/api/v1/extraction-details/bulk", json=[
+        {"extraction_name": "total", "vendor_id": 1}, {"extraction_name": "total", "vendor_id": 1}])
+    assert response.status_code == 400
@@ -0,0 +1,24 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.core.db_pool import InstrumentedQueuePool, pool_stats
+
+
+def test_pool_stats_track_checkouts_and_exhaustion(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+                           pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+    held = engine.connect()
+    stats = pool_stats(engine)
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 1
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    assert pool_stats(engine)["timeouts"] == 1
+
+    held.close()
+    stats = pool_stats(engine)
+    assert stats["checked_out"] == 0
+    assert stats["idle"] == 1
+    engine.dispose()
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+import pytest
+import structlog
+from app.core import db_executor
+from app.core.db_executor import BlockingCallPool, run_blocking
+from app.repositories.base_repository import BaseRepository
+from sqlalchemy import text
+
+
+@pytest.fixture
+def pool():
+    pool = BlockingCallPool("test", max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_slow_call_does_not_block_the_event_loop(pool):
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await pool.run(time.sleep, 0.1)
+    task.cancel()
+
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_calls_run_concurrently_up_to_max_workers(pool):
+    started = time.perf_counter()
+    await asyncio.gather(*(pool.run(time.sleep, 0.1) for _ in range(2)))
+
+    assert time.perf_counter() - started < 0.19
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_max_workers_queue_and_count_as_saturated(pool):
+    await asyncio.gather(*(pool.run(time.sleep, 0.05) for _ in range(4)))
+
+    stats = pool.stats()
+    assert stats["calls"] == 4
+    assert stats["saturated"] == 2
+    assert stats["peak_queued"] >= 2
+    assert stats["max_wait_ms"] >= 40
+    assert (stats["active"], stats["queued"]) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_request_context_is_carried_into_the_pool_thread(pool):
+    with structlog.contextvars.bound_contextvars(request_id="abc"):
+        context = await pool.run(structlog.contextvars.get_contextvars)
+
+    assert context["request_id"] == "abc"
+
+
+@pytest.mark.asyncio
+async def test_inline_mode_runs_on_the_event_loop_thread(monkeypatch):
+    monkeypatch.setattr(db_executor.settings, "DB_SYNC_EXECUTION", "inline")
+
+    assert await run_blocking(threading.get_ident) == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_run_on_the_db_threadpool(db_session):
+    calls = db_executor.db_threadpool.stats()["calls"]
+    result = await BaseRepository(db_session).execute(text("SELECT 1"))
+
+    assert result.scalar_one() == 1
+    assert db_executor.db_threadpool.stats()["calls"] == calls + 1
+
+
+def test_threadpool_stats_route(api_client):
+    response = api_client.get("/api/v1/internal/db-threadpool-stats")
+
+    assert response.status_code == 200
+    assert response.json()["source_output"]["db"]["max_workers"] == db_executor.settings.DB_THREADPOOL_SIZE
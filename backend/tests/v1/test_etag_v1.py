@@ -0,0 +1,98 @@
+import pytest
+from app.models.extracted_json_model import ReturnJson
+from app.models.user_model import User
+from app.models.vendor_model import Vendor
+from app.utils import etag as etag_module
+from app.utils.etag import etag_matches
+
+
+@pytest.fixture
+def seeded(db_session):
+    vendor = Vendor(vendor_name="Acme")
+    db_session.add(vendor)
+    db_session.flush()
+    user = User(bio_id=1, user_name="alice", password_hash="x")
+    record = ReturnJson(invoice_number="INV-1", vendor_id=vendor.vendor_id, extracted_json={"total": 1})
+    db_session.add_all([user, record])
+    db_session.commit()
+    return {"vendor": vendor.vendor_id, "user": user.user_id, "record": record.return_id}
+
+
+READS = [
+    "/api/v1/vendor/get-all-vendors",
+    "/api/v1/vendor/get-vendor-details-by-id?vendor_id={vendor}",
+    "/api/v1/user/get-all-user-details",
+    "/api/v1/user/get-user-details-by-id?user_id={user}",
+    "/api/v1/extracted-json/",
+    "/api/v1/extracted-json/{record}",
+]
+
+
+@pytest.mark.parametrize("url", READS)
+def test_matching_if_none_match_is_304_without_body(api_client, seeded, url):
+    first = api_client.get(url.format(**seeded))
+    etag = first.headers["ETag"]
+
+    second = api_client.get(url.format(**seeded), headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("url, write", [
+    ("/api/v1/vendor/get-vendor-details-by-id?vendor_id={vendor}",
+     ("put", "/api/v1/vendor/update-vendor-details?vendor_id={vendor}", {"vendor_name": "Acme Ltd", "updated_by": 1})),
+    ("/api/v1/vendor/get-all-vendors", ("post", "/api/v1/vendor/create-new-vendor", {"vendor_name": "Globex"})),
+    ("/api/v1/user/get-user-details-by-id?user_id={user}",
+     ("put", "/api/v1/user/update-user-details?user_id={user}", {"user_name": "bob", "bio_id": 2})),
+    ("/api/v1/extracted-json/{record}", ("put", "/api/v1/extracted-json/{record}", {"invoice_number": "INV-9"})),
+    ("/api/v1/extracted-json/", ("delete", "/api/v1/extracted-json/{record}", None)),
+])
+def test_write_changes_the_etag(api_client, seeded, url, write):
+    etag = api_client.get(url.format(**seeded)).headers["ETag"]
+    method, write_url, payload = write
+    kwargs = {"json": payload} if payload is not None else {}
+    assert getattr(api_client, method)(write_url.format(**seeded), **kwargs).status_code < 300
+
+    response = api_client.get(url.format(**seeded), headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_not_modified_skips_serialization(api_client, seeded, monkeypatch):
+    url = f"/api/v1/vendor/get-vendor-details-by-id?vendor_id={seeded['vendor']}"
+    etag = api_client.get(url).headers["ETag"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("body serialized for a 304")
+
+    monkeypatch.setattr(etag_module.ApiResponse, "success", fail)
+    assert api_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_estimated_totals_carry_no_etag(api_client, seeded):
+    response = api_client.get("/api/v1/vendor/get-all-vendors?total=estimated")
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_errors_carry_no_etag(api_client, seeded):
+    response = api_client.get("/api/v1/vendor/get-vendor-details-by-id?vendor_id=99999", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ("*", True),
+    ('"abcd"', False),
+])
+def test_if_none_match_parsing(header, expected):
+    assert etag_matches(header, '"abc"') is expected
@@ -0,0 +1,35 @@
+import json
+from datetime import datetime
+from sqlalchemy.orm import sessionmaker
+from app.core import database
+from app.core.config import settings
+from app.models.vendor_model import Vendor
+from app.models.extracted_json_model import ReturnJson
+
+
+def test_export_streams_ndjson_in_batches(api_client, db_session, sync_engine, monkeypatch):
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=sync_engine))
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 3)
+
+    vendor = Vendor(vendor_name="Acme")
+    db_session.add(vendor)
+    db_session.flush()
+    db_session.add_all([
+        ReturnJson(invoice_number=f"INV-{i}", vendor_id=vendor.vendor_id, extracted_json={"total": i},
+                   created_at=datetime(2025, 2, i), is_deleted=1 if i == 4 else 0)
+        for i in range(1, 9)
+    ])
+    db_session.commit()
+
+    response = api_client.get("/api/v1/extracted-json/export",
+                              params={"vendor_id": vendor.vendor_id, "created_to": "2025-02-08T00:00:00"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["invoice_number"] for r in rows] == ["INV-1", "INV-2", "INV-3", "INV-5", "INV-6", "INV-7"]
+    assert rows[0]["extracted_json"] == {"total": 1}
+    assert rows[0]["created_at"] == "2025-02-01T00:00:00"
+
+    resumed = api_client.get("/api/v1/extracted-json/export", params={"after_id": rows[-1]["return_id"]})
+    assert [json.loads(line)["invoice_number"] for line in resumed.text.splitlines()] == ["INV-8"]
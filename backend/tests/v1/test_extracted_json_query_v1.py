@@ -0,0 +1,48 @@
+import pytest
+from app.models.extracted_json_model import ReturnJson
+from app.utils.json_filter import InvalidPredicate, parse_predicate
+
+
+def test_predicates_follow_jsonpath_lax_semantics():
+    document = {"total": 12500, "supplier": {"gstin": "29ABC"}, "lines": [{"amount": 10}, {"amount": 900}]}
+
+    assert parse_predicate("total > 10000").matches(document)
+    assert parse_predicate("supplier.gstin = 29ABC").matches(document)
+    assert parse_predicate("lines.amount >= 900").matches(document)
+    assert not parse_predicate("total > \"100\"").matches(document)
+    assert not parse_predicate("missing.key = 1").matches(document)
+    assert not parse_predicate("total = true").matches({"total": 1})
+
+
+def test_predicate_compiles_to_quoted_jsonpath():
+    assert parse_predicate('supplier.gstin = "29 AB"').to_jsonpath() == '$."supplier"."gstin" == "29 AB"'
+    with pytest.raises(InvalidPredicate):
+        parse_predicate("total >> 5")
+
+
+@pytest.mark.parametrize("value", ["NaN", "Infinity", "-Infinity", "1e999"])
+def test_non_finite_numbers_are_rejected(value):
+    with pytest.raises(InvalidPredicate):
+        parse_predicate(f"total > {value}")
+
+
+def test_query_endpoint_pages_through_matches(api_client, db_session):
+    db_session.add_all([
+        ReturnJson(invoice_number=f"INV-{i}", extracted_json={"total": i * 1000, "supplier": {"gstin": "X" if i % 2 else "Y"}})
+        for i in range(1, 21)
+    ])
+    db_session.commit()
+
+    params = {"where": ["total > 10000", "supplier.gstin = X"], "limit": 3}
+    body = api_client.get("/api/v1/extracted-json/query", params=params).json()["source_output"]
+    assert [r["invoice_number"] for r in body["records"]] == ["INV-19", "INV-17", "INV-15"]
+
+    body = api_client.get("/api/v1/extracted-json/query",
+                          params={**params, "after": body["next_cursor"]}).json()["source_output"]
+    assert [r["invoice_number"] for r in body["records"]] == ["INV-13", "INV-11"]
+    assert body["next_cursor"] is None
+
+
+def test_query_endpoint_rejects_bad_predicate(api_client):
+    response = api_client.get("/api/v1/extracted-json/query", params={"where": "total ~ 5"})
+    assert response.status_code == 400
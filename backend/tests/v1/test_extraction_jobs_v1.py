@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy.orm import sessionmaker, undefer
+from app.core.config import settings
+from app.models.extracted_json_model import ReturnJson
+from app.models.extraction_job_model import ExtractionJob
+from app.models.extraction_model import Extraction
+from app.models.vendor_model import Vendor
+from app.repositories.extraction_job_repository import ExtractionJobRepository
+from app.services.invoice_extractor import ExtractionError, PermanentExtractionError
+from app.workers.extraction_worker import ExtractionWorker
+
+JOBS = "/api/v1/extraction-jobs"
+
+
+@pytest.fixture
+def session_factory(sync_engine):
+    return sessionmaker(bind=sync_engine, autoflush=False, expire_on_commit=False)
+
+
+def fake_extract(document, content_type, zones):
+    return {"fields": {zone["extraction_name"]: "INV-42" for zone in zones}, "pages": [document.decode()]}
+
+
+def make_worker(session_factory, extract=fake_extract, worker_id="worker-1", **kwargs):
+    return ExtractionWorker(session_factory, worker_id, extract=extract, retry_backoff_seconds=0, **kwargs)
+
+
+def submit(api_client, body=b"invoice text", content_type="image/png", **params):
+    return api_client.post(f"{JOBS}/", content=body, headers={"content-type": content_type}, params=params)
+
+
+def submit_result(api_client, job_id):
+    return api_client.get(f"{JOBS}/{job_id}/result")
+
+
+def job_row(session_factory, job_id) -> ExtractionJob:
+    with session_factory() as session:
+        return session.get(ExtractionJob, job_id, options=[undefer(ExtractionJob.document)])
+
+
+@pytest.mark.asyncio
+async def test_submitted_job_is_extracted_into_a_return_json_record(api_client, db_session, session_factory):
+    db_session.add(Vendor(vendor_id=1, vendor_name="Acme"))
+    db_session.add(Extraction(extraction_name="invoice_number", x_min=0, x_max=10, y_min=0, y_max=10,
+                              vendor_id=1, is_deleted=0))
+    db_session.commit()
+
+    response = submit(api_client, vendor_id=1, file_name="inv.png")
+    assert response.status_code == 202
+    job_id = response.json()["source_output"]["job_id"]
+    assert response.json()["source_output"]["status"] == "queued"
+    assert submit_result(api_client, job_id).status_code == 409
+
+    assert await make_worker(session_factory).run_once()
+
+    job = api_client.get(f"{JOBS}/{job_id}").json()["source_output"]
+    assert (job["status"], job["attempts"]) == ("succeeded", 1)
+    record = submit_result(api_client, job_id).json()["source_output"]
+    assert record["return_id"] == job["return_id"]
+    assert record["invoice_number"] == "INV-42"
+    assert record["extracted_json"] == {"fields": {"invoice_number": "INV-42"}, "pages": ["invoice text"]}
+    assert job_row(session_factory, job_id).document is None
+
+
+@pytest.mark.asyncio
+async def test_empty_queue_is_a_no_op(session_factory):
+    assert not await make_worker(session_factory).run_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_runs_are_retried_then_marked_failed(api_client, session_factory):
+    job_id = submit(api_client).json()["source_output"]["job_id"]
+
+    def broken(document, content_type, zones):
+        raise ExtractionError("tesseract crashed")
+
+    worker = make_worker(session_factory, extract=broken)
+    for _ in range(settings.EXTRACTION_MAX_ATTEMPTS):
+        assert await worker.run_once()
+    assert not await worker.run_once()
+
+    job = job_row(session_factory, job_id)
+    assert (job.status, job.attempts, job.error) == ("failed", settings.EXTRACTION_MAX_ATTEMPTS, "tesseract crashed")
+    assert submit_result(api_client, job_id).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_for_the_backoff(api_client, session_factory):
+    job_id = submit(api_client).json()["source_output"]["job_id"]
+
+    def broken(document, content_type, zones):
+        raise ExtractionError("busy")
+
+    worker = ExtractionWorker(session_factory, "worker-1", extract=broken, retry_backoff_seconds=60)
+    assert await worker.run_once()
+    assert not await worker.run_once()
+
+    job = job_row(session_factory, job_id)
+    assert job.status == "queued"
+    assert job.available_at > datetime.now() + timedelta(seconds=50)
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_are_not_retried(api_client, session_factory):
+    job_id = submit(api_client).json()["source_output"]["job_id"]
+
+    def unsupported(document, content_type, zones):
+        raise PermanentExtractionError("OCR extraction requires the 'pytesseract' and 'Pillow' packages")
+
+    assert await make_worker(session_factory, extract=unsupported).run_once()
+
+    job = job_row(session_factory, job_id)
+    assert (job.status, job.attempts) == ("failed", 1)
+
+
+@pytest.mark.asyncio
+async def test_expired_claim_is_taken_over_and_the_late_result_discarded(api_client, session_factory):
+    job_id = submit(api_client).json()["source_output"]["job_id"]
+    slow = make_worker(session_factory, worker_id="slow")
+
+    with session_factory() as session:
+        stale_job = (await ExtractionJobRepository(session).claim("slow", -1)).data
+
+        # The claim has already expired, so another worker takes the job and finishes first
+        assert await make_worker(session_factory, worker_id="fast").run_once()
+        await slow.process(session, stale_job)
+
+    job = job_row(session_factory, job_id)
+    assert (job.status, job.attempts, job.locked_by) == ("succeeded", 2, None)
+    with session_factory() as session:
+        records = session.query(ReturnJson).order_by(ReturnJson.return_id).all()
+        assert [r.is_deleted for r in records] == [0, 1]
+        assert records[0].return_id == job.return_id
+
+
+@pytest.mark.asyncio
+async def test_job_abandoned_on_its_last_attempt_is_failed(api_client, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_MAX_ATTEMPTS", 1)
+    job_id = submit(api_client).json()["source_output"]["job_id"]
+
+    with session_factory() as session:
+        await ExtractionJobRepository(session).claim("crashed", -1)
+
+    assert not await make_worker(session_factory).run_once()
+    job = job_row(session_factory, job_id)
+    assert (job.status, job.error) == ("failed", "Visibility timeout expired on the last attempt")
+
+
+def test_submission_is_validated(api_client, monkeypatch):
+    assert submit(api_client, body=b"").status_code == 400
+    assert submit(api_client, content_type="text/plain").status_code == 415
+
+    monkeypatch.setattr(settings, "EXTRACTION_MAX_DOCUMENT_BYTES", 4)
+    assert submit(api_client, body=b"too large").status_code == 413
+
+
+def test_chunked_upload_over_the_limit_is_413(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_MAX_DOCUMENT_BYTES", 10)
+
+    def chunks():
+        for _ in range(100):
+            yield b"0123456789"
+
+    response = api_client.post(f"{JOBS}/", content=chunks(), headers={"content-type": "image/png"})
+
+    assert "content-length" not in response.request.headers
+    assert response.status_code == 413
+    assert api_client.get(f"{JOBS}/1").status_code == 404
+
+
+def test_full_queue_is_503_with_retry_after(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_MAX_PENDING_JOBS", 1)
+    assert submit(api_client).status_code == 202
+
+    response = submit(api_client)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_unknown_job_is_404(api_client):
+    assert api_client.get(f"{JOBS}/999").status_code == 404
+    assert submit_result(api_client, 999).status_code == 404
@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import event
+from app.core.security import DUMMY_PASSWORD_HASH, hash_password_sync
+from app.models.user_model import User
+from app.repositories.user_repository import UserRepository
+from app.services import auth_service
+
+LOGIN = "/api/v1/auth/login"
+
+
+@pytest.fixture
+def verifies(monkeypatch):
+    """Password hashes each login verified against."""
+    checked = []
+    real_verify = auth_service.password_hasher.verify
+
+    async def verify(plain_password, hashed_password):
+        checked.append(hashed_password)
+        return await real_verify(plain_password, hashed_password)
+
+    monkeypatch.setattr(auth_service.password_hasher, "verify", verify)
+    return checked
+
+
+@pytest.fixture
+def alice(db_session):
+    user = User(bio_id=1, user_name="alice", password_hash=hash_password_sync("s3cret"), is_deleted=0)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_login_is_one_lookup_and_one_bcrypt_check(api_client, alice, verifies, sync_engine):
+    selects = []
+    event.listen(sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: selects.append(statement)
+                 if statement.lstrip().upper().startswith("SELECT") else None)
+
+    response = api_client.post(LOGIN, json={"user_name": "alice", "password": "s3cret"})
+
+    assert response.status_code == 200
+    assert verifies == [alice.password_hash]
+    assert len(selects) == 1
+
+
+def test_unknown_user_still_costs_one_bcrypt_check(api_client, alice, verifies):
+    response = api_client.post(LOGIN, json={"user_name": "mallory", "password": "s3cret"})
+
+    assert response.status_code == 401
+    assert verifies == [DUMMY_PASSWORD_HASH]
+
+
+def test_wrong_password_is_401(api_client, alice, verifies):
+    response = api_client.post(LOGIN, json={"user_name": "alice", "password": "wrong"})
+
+    assert response.status_code == 401
+    assert response.json()["message"] == "Invalid username or password"
+    assert verifies == [alice.password_hash]
+
+
+def test_active_usernames_are_unique(api_client, alice):
+    response = api_client.post("/api/v1/user/create-new-user",
+                               json={"user_name": "alice", "bio_id": 2, "password": "other"})
+
+    assert response.status_code == 409
+
+
+def test_renaming_onto_an_active_username_is_409(api_client, alice, db_session):
+    bob = User(bio_id=2, user_name="bob", password_hash="x", is_deleted=0)
+    db_session.add(bob)
+    db_session.commit()
+
+    response = api_client.put(f"/api/v1/user/update-user-details?user_id={bob.user_id}",
+                              json={"user_name": "alice", "bio_id": 2})
+
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_other_integrity_errors_are_not_reported_as_taken_names(alice, db_session):
+    repo = UserRepository(db_session)
+
+    created = await repo.create(User(bio_id=3, user_name="carol", password_hash=None))
+    renamed = await repo.update_by_id(alice.user_id, {"user_name": None})
+
+    assert (created.code, renamed.code) == (500, 500)
+    assert "taken" not in created.message + renamed.message
+
+
+def test_deleted_users_release_their_username(api_client, alice):
+    api_client.delete(f"/api/v1/user/delete-user?user_id={alice.user_id}")
+
+    response = api_client.post("/api/v1/user/create-new-user",
+                               json={"user_name": "alice", "bio_id": 2, "password": "other"})
+
+    assert response.json()["response_status"] is True
+    assert api_client.post(LOGIN, json={"user_name": "alice", "password": "other"}).status_code == 200
@@ -0,0 +1,94 @@
+import base64
+from datetime import datetime
+import pytest
+from sqlalchemy import event
+from app.models.vendor_model import Vendor
+from app.models.extracted_json_model import ReturnJson
+
+
+def _seed(db_session):
+    vendor = Vendor(vendor_name="Acme", created_at=datetime(2025, 1, 1))
+    other = Vendor(vendor_name="Globex", created_at=datetime(2025, 1, 1))
+    db_session.add_all([vendor, other])
+    db_session.flush()
+    db_session.add_all([
+        ReturnJson(invoice_number=f"INV-{i:03d}", vendor_id=vendor.vendor_id if i % 2 else other.vendor_id,
+                   extracted_json={"total": i}, created_at=datetime(2025, 1, 1 + i))
+        for i in range(1, 11)
+    ])
+    db_session.commit()
+    return vendor
+
+
+def test_vendor_pages_follow_next_cursor(api_client, db_session):
+    db_session.add_all([Vendor(vendor_name=f"Vendor {i:02d}") for i in range(5)])
+    db_session.commit()
+
+    names, after = [], None
+    while True:
+        params = {"limit": 2, **({"after": after} if after else {})}
+        body = api_client.get("/api/v1/vendor/get-all-vendors", params=params).json()["source_output"]
+        names += [v["vendor_name"] for v in body["vendors"]]
+        after = body["next_cursor"]
+        if after is None:
+            break
+
+    assert names == [f"Vendor {i:02d}" for i in range(5)]
+
+
+def test_extracted_json_filters_and_newest_first(api_client, db_session):
+    vendor = _seed(db_session)
+
+    response = api_client.get("/api/v1/extracted-json/", params={
+        "vendor_id": vendor.vendor_id,
+        "created_from": "2025-01-03T00:00:00",
+        "limit": 2,
+    })
+    body = response.json()["source_output"]
+    assert [r["invoice_number"] for r in body["records"]] == ["INV-009", "INV-007"]
+
+    body = api_client.get("/api/v1/extracted-json/", params={
+        "vendor_id": vendor.vendor_id, "created_from": "2025-01-03T00:00:00",
+        "limit": 2, "after": body["next_cursor"],
+    }).json()["source_output"]
+    assert [r["invoice_number"] for r in body["records"]] == ["INV-005", "INV-003"]
+    assert body["next_cursor"] is None
+
+    prefixed = api_client.get("/api/v1/extracted-json/", params={"invoice_number_prefix": "INV-01"}).json()
+    assert [r["invoice_number"] for r in prefixed["source_output"]["records"]] == ["INV-010"]
+
+
+def test_invalid_cursor_is_rejected(api_client):
+    response = api_client.get("/api/v1/user/get-all-user-details", params={"after": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("key", ['"abc"', "[1,2]", "true", "1.5", "null"])
+def test_forged_cursor_key_is_rejected(api_client, key):
+    token = base64.urlsafe_b64encode(f'{{"k":{key}}}'.encode()).decode().rstrip("=")
+    response = api_client.get("/api/v1/user/get-all-user-details", params={"after": token})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("mode", ["exact", "estimated"])  # estimated falls back to COUNT(*) off PostgreSQL
+def test_total_counts_all_pages_with_same_filters(api_client, db_session, sync_engine, mode):
+    vendor = _seed(db_session)
+    statements = []
+    event.listen(sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    body = api_client.get("/api/v1/extracted-json/", params={
+        "vendor_id": vendor.vendor_id, "created_from": "2025-01-03T00:00:00", "limit": 2, "total": mode,
+    }).json()["source_output"]
+
+    assert len(body["records"]) == 2
+    assert body["total"] == 4
+    assert sum("count(*)" in statement for statement in statements) == 1
+
+
+def test_total_is_omitted_unless_requested(api_client, db_session):
+    _seed(db_session)
+    body = api_client.get("/api/v1/vendor/get-all-vendors").json()["source_output"]
+    assert body["total"] is None
+    body = api_client.get("/api/v1/vendor/get-all-vendors", params={"limit": 1, "total": "exact"}).json()
+    assert body["source_output"]["total"] == 2
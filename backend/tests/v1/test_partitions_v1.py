@@ -0,0 +1,93 @@
+from datetime import date
+import pytest
+from app.maintenance.partitions import (add_months, create_partition_sql, detach_partition_sql,
+                                        maintenance_steps, move_from_default_sql, partition_name, plan,
+                                        run_maintenance)
+
+
+def test_add_months_crosses_years():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_plan_creates_missing_future_months_and_detaches_expired():
+    existing = [partition_name(date(2025, m, 1)) for m in range(1, 13)] + [
+        partition_name(date(2026, 10, 1)), "tb_inai_extracted_json_manual"]
+
+    to_create, to_detach = plan(date(2026, 10, 18), existing, months_ahead=2, retention_months=18)
+
+    assert to_create == [date(2026, 11, 1), date(2026, 12, 1)]
+    # 18 months back from 2026-10 keeps 2025-05 onwards; unknown names are left alone
+    assert to_detach == [partition_name(date(2025, m, 1)) for m in range(1, 5)]
+
+
+def test_plan_recovers_months_caught_by_the_default_partition():
+    existing = ["tb_inai_extracted_json_default", partition_name(date(2026, 10, 1))]
+    default_months = [date(2025, 1, 1), date(2026, 9, 1)]
+
+    to_create, to_detach = plan(date(2026, 10, 18), existing, months_ahead=1, retention_months=18,
+                                default_months=default_months)
+
+    assert to_create == [date(2025, 1, 1), date(2026, 9, 1), date(2026, 11, 1)]
+    # An expired month is moved out of the default partition, then archived with the rest
+    assert to_detach == [partition_name(date(2025, 1, 1))]
+
+
+def test_plan_rejects_empty_retention():
+    with pytest.raises(ValueError):
+        plan(date(2026, 10, 18), [], months_ahead=1, retention_months=0)
+
+
+def test_partition_ddl():
+    assert create_partition_sql("invoai", date(2026, 12, 1)) == (
+        'CREATE TABLE IF NOT EXISTS "invoai"."tb_inai_extracted_json_p2026_12" '
+        'PARTITION OF "invoai"."tb_inai_extracted_json" FOR VALUES FROM (\'2026-12-01\') TO (\'2027-01-01\')')
+    detach, *archive = detach_partition_sql("invoai", "tb_inai_extracted_json_p2024_01", "invoai_archive")
+    assert detach.endswith("DETACH PARTITION \"invoai\".\"tb_inai_extracted_json_p2024_01\" CONCURRENTLY")
+    assert archive[-1] == 'ALTER TABLE "invoai"."tb_inai_extracted_json_p2024_01" SET SCHEMA "invoai_archive"'
+    assert detach_partition_sql("invoai", "tb_inai_extracted_json_p2024_01", None)[-1].startswith("DROP TABLE")
+
+
+def test_moving_rows_out_of_the_default_partition_is_one_detach_create_move_attach():
+    detach, create, move, attach = move_from_default_sql("invoai", date(2026, 12, 1))
+
+    assert detach == ('ALTER TABLE "invoai"."tb_inai_extracted_json" '
+                      'DETACH PARTITION "invoai"."tb_inai_extracted_json_default"')
+    assert create == create_partition_sql("invoai", date(2026, 12, 1))
+    assert move == ('WITH moved AS (DELETE FROM "invoai"."tb_inai_extracted_json_default" '
+                    "WHERE created_at >= '2026-12-01' AND created_at < '2027-01-01' RETURNING *) "
+                    'INSERT INTO "invoai"."tb_inai_extracted_json" SELECT * FROM moved')
+    assert attach.endswith('ATTACH PARTITION "invoai"."tb_inai_extracted_json_default" DEFAULT')
+
+
+def test_detaches_are_plain_transactions_when_a_default_partition_exists():
+    existing = ["tb_inai_extracted_json_default", partition_name(date(2025, 1, 1)),
+                partition_name(date(2026, 10, 1))]
+    default_months = [date(2025, 2, 1)]
+    to_create, to_detach = plan(date(2026, 10, 18), existing, months_ahead=0, retention_months=18,
+                                default_months=default_months)
+
+    steps = maintenance_steps("invoai", existing, to_create, to_detach, "invoai_archive", default_months)
+
+    assert to_detach == [partition_name(date(2025, 1, 1)), partition_name(date(2025, 2, 1))]
+    assert steps[0] == move_from_default_sql("invoai", date(2025, 2, 1))
+    assert steps[1:] == [detach_partition_sql("invoai", name, "invoai_archive", concurrently=False)
+                         for name in to_detach]
+    assert steps[1][0] == ('ALTER TABLE "invoai"."tb_inai_extracted_json" '
+                           'DETACH PARTITION "invoai"."tb_inai_extracted_json_p2025_01"')
+
+
+def test_detaches_run_concurrently_without_a_default_partition():
+    existing = [partition_name(date(2025, 1, 1)), partition_name(date(2026, 10, 1))]
+    to_create, to_detach = plan(date(2026, 10, 18), existing, months_ahead=0, retention_months=18)
+
+    steps = maintenance_steps("invoai", existing, to_create, to_detach, None)
+
+    assert steps == detach_partition_sql("invoai", partition_name(date(2025, 1, 1)), None)
+    assert steps[0].endswith("CONCURRENTLY")
+
+
+def test_maintenance_is_a_no_op_without_partitioning(sync_engine):
+    assert run_maintenance(sync_engine, 3, 24, "invoai_archive") == {
+        "created": [], "detached": [], "recovered_from_default": [], "archive_schema": "invoai_archive",
+        "dry_run": False}
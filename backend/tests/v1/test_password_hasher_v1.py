@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+from app.core import security
+from app.core.security import PasswordHasher, PasswordHasherBusy, verify_password_sync
+from app.models.user_model import User
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_run_in_the_pool(hasher):
+    hashed = await hasher.hash("s3cret")
+
+    assert verify_password_sync("s3cret", hashed)
+    assert await hasher.verify("s3cret", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert hasher.stats()["completed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_hashes_are_not_counted_as_completed(hasher):
+    with pytest.raises(ValueError):
+        await hasher.verify("s3cret", "not a bcrypt hash")
+
+    assert (hasher.stats()["completed"], hasher.stats()["failed"], hasher.stats()["pending"]) == (0, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_running_while_bcrypt_works(hasher):
+    await hasher.hash("warm up the pool")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await hasher.hash("s3cret")
+    task.cancel()
+
+    assert ticks >= 3
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_max_pending_are_rejected(hasher):
+    results = await asyncio.gather(hasher.hash("a"), hasher.hash("b"), return_exceptions=True)
+
+    assert isinstance(results[1], PasswordHasherBusy)
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["pending"] == 0
+
+
+def test_login_is_503_with_retry_after_when_saturated(api_client, db_session, monkeypatch):
+    db_session.add(User(bio_id=1, user_name="alice", password_hash="x"))
+    db_session.commit()
+
+    async def busy(*args):
+        raise PasswordHasherBusy("32 password hashes already pending")
+
+    monkeypatch.setattr(security.password_hasher, "verify", busy)
+    response = api_client.post("/api/v1/auth/login", json={"user_name": "alice", "password": "s3cret"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_created_user_can_log_in(api_client):
+    api_client.post("/api/v1/user/create-new-user", json={"user_name": "alice", "bio_id": 1, "password": "s3cret"})
+
+    assert api_client.post("/api/v1/auth/login", json={"user_name": "alice", "password": "s3cret"}).status_code == 200
+    assert api_client.post("/api/v1/auth/login", json={"user_name": "alice", "password": "nope"}).status_code == 401
@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+from app.core.cache import ServiceCache
+from app.core.database import Base, RoutingSession
+from app.models.vendor_model import Vendor
+from app.repositories.vendor_repository import VendorRepository
+from tests.conftest import _attach_schema
+
+
+@pytest.fixture
+def replica_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    event.listen(engine, "connect", _attach_schema(tmp_path / "invoai_replica.db"))
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Vendor), [{"vendor_id": 1, "vendor_name": "Replica Co", "is_deleted": 0}])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def routing_session(sync_engine, replica_engine):
+    session = sessionmaker(class_=RoutingSession, primary=sync_engine, replica=replica_engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica(routing_session):
+    repo = VendorRepository(routing_session)
+
+    fetched = await repo.get_by_id(1)
+    assert fetched.success
+    assert fetched.data.vendor_name == "Replica Co"
+    assert not routing_session.info.get("use_primary")
+
+
+@pytest.mark.asyncio
+async def test_write_goes_to_primary_and_pins_session(routing_session, sync_engine, replica_engine):
+    repo = VendorRepository(routing_session)
+
+    created = await repo.create(Vendor(vendor_name="Primary Co"))
+    assert created.success
+    assert routing_session.info["use_primary"]
+
+    with replica_engine.connect() as conn:
+        assert conn.execute(select(Vendor.vendor_name)).scalars().all() == ["Replica Co"]
+    with sync_engine.connect() as conn:
+        assert conn.execute(select(Vendor.vendor_name)).scalars().all() == ["Primary Co"]
+
+    # Read-your-writes: the rest of the request reads from the primary
+    fetched = await repo.get_by_id(created.data.vendor_id)
+    assert fetched.data.vendor_name == "Primary Co"
+    page = await repo.get_all()
+    assert [v.vendor_name for v in page.data.items] == ["Primary Co"]
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_of_replica_read_goes_to_primary(routing_session, sync_engine):
+    with sync_engine.begin() as conn:
+        conn.execute(insert(Vendor), [{"vendor_id": 1, "vendor_name": "Replica Co", "is_deleted": 0}])
+    repo = VendorRepository(routing_session)
+
+    vendor = (await repo.get_by_id(1)).data
+    vendor.is_deleted = 1
+    await repo.update(vendor)
+
+    with sync_engine.connect() as conn:
+        assert conn.execute(select(Vendor.is_deleted)).scalar_one() == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_loads_read_the_primary_while_the_replica_lags(routing_session, sync_engine):
+    # The replica still has the name from before the write
+    with sync_engine.begin() as conn:
+        conn.execute(insert(Vendor), [{"vendor_id": 1, "vendor_name": "Renamed Co", "is_deleted": 0}])
+    cache = ServiceCache("replica_lag")
+    repo = VendorRepository(routing_session)
+
+    loaded = await cache.get_or_load(("id", 1), lambda: repo.get_by_id(1))
+
+    assert loaded.data.vendor_name == "Renamed Co"
+    assert (await cache.get_or_load(("id", 1), lambda: repo.get_by_id(1))) is loaded
+    # Reads outside a cache load still go to the replica, and the session is not pinned
+    assert routing_session.execute(select(Vendor.vendor_name)).scalar_one() == "Replica Co"
+    assert not routing_session.info.get("use_primary")
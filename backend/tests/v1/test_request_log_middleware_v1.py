@@ -0,0 +1,69 @@
+import pytest
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from structlog.testing import capture_logs
+from app.core.exception_handler import global_exception_handler
+from app.core.middleware.log_context import RequestContextLogMiddleware
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_exception_handler(Exception, global_exception_handler)
+    app.add_middleware(RequestContextLogMiddleware)
+
+    @app.get("/context")
+    async def context():
+        return structlog.contextvars.get_contextvars()
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse((f"chunk {i}\n".encode() for i in range(3)), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def request_lines(logs):
+    return [line for line in logs if line["event"] == "request"]
+
+
+def test_one_line_per_request_with_status_and_duration(client):
+    with capture_logs() as logs:
+        response = client.get("/context")
+
+    [line] = request_lines(logs)
+    assert line["status"] == 200
+    assert line["duration_ms"] >= 0
+    assert len(logs) == 1
+
+
+def test_request_context_is_bound_for_the_handler(client):
+    response = client.get("/context")
+
+    context = response.json()
+    assert (context["path"], context["method"]) == ("/context", "GET")
+    assert response.headers["x-request-id"] == context["request_id"]
+    assert structlog.contextvars.get_contextvars() == {}
+
+
+def test_streaming_responses_pass_through(client):
+    with capture_logs() as logs:
+        response = client.get("/stream")
+
+    assert response.text == "chunk 0\nchunk 1\nchunk 2\n"
+    assert request_lines(logs)[0]["status"] == 200
+
+
+def test_unhandled_errors_are_logged_as_500(client):
+    with capture_logs() as logs:
+        response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert response.json()["message"] == "Unexpected server error"
+    assert request_lines(logs)[0]["status"] == 500
@@ -0,0 +1,254 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from app.core import cache as cache_module
+from app.core.cache import ServiceCache, TTLCache, extraction_cache, listen_for_invalidations, vendor_cache
+from app.core.cache_backend import MemoryCacheBackend
+from app.core.result import Result
+from app.models.extraction_model import Extraction
+from app.models.vendor_model import Vendor
+
+
+@pytest.fixture
+def selects(sync_engine):
+    captured = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield captured
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def vendor_id(db_session):
+    vendor = Vendor(vendor_name="Acme")
+    db_session.add(vendor)
+    db_session.flush()
+    db_session.add(Extraction(extraction_name="total", vendor_id=vendor.vendor_id))
+    db_session.commit()
+    return vendor.vendor_id
+
+
+def test_repeated_vendor_reads_hit_the_cache(api_client, vendor_id, selects):
+    url = f"/api/v1/vendor/get-vendor-details-by-id?vendor_id={vendor_id}"
+    first = api_client.get(url)
+    queries = len(selects)
+    second = api_client.get(url)
+
+    assert first.json() == second.json()
+    assert queries > 0 and len(selects) == queries
+    assert (vendor_cache.stats()["hits"], vendor_cache.stats()["misses"]) == (1, 1)
+
+
+def test_vendor_update_invalidates_vendor_and_template_reads(api_client, vendor_id):
+    api_client.get(f"/api/v1/vendor/get-vendor-details-by-id?vendor_id={vendor_id}")
+    api_client.get(f"/api/v1/vendor/get-vendor-template-by-id?vendor_id={vendor_id}")
+
+    api_client.put(f"/api/v1/vendor/update-vendor-details?vendor_id={vendor_id}",
+                   json={"vendor_name": "Acme Ltd", "updated_by": 1})
+
+    vendor = api_client.get(f"/api/v1/vendor/get-vendor-details-by-id?vendor_id={vendor_id}").json()
+    template = api_client.get(f"/api/v1/vendor/get-vendor-template-by-id?vendor_id={vendor_id}").json()
+    assert vendor["source_output"]["vendor_name"] == "Acme Ltd"
+    assert template["source_output"]["vendor_name"] == "Acme Ltd"
+
+
+def test_extraction_mutation_invalidates_templates(api_client, vendor_id):
+    url = f"/api/v1/vendor/get-vendor-template-by-id?vendor_id={vendor_id}"
+    api_client.get(url)
+
+    api_client.post("/api/v1/extraction-details/", json={"extraction_name": "date", "vendor_id": vendor_id})
+
+    zones = [z["extraction_name"] for z in api_client.get(url).json()["source_output"]["extraction_details"]]
+    assert zones == ["total", "date"]
+
+
+def test_soft_delete_is_visible_immediately(api_client, vendor_id):
+    url = f"/api/v1/vendor/get-vendor-details-by-id?vendor_id={vendor_id}"
+    assert api_client.get(url).status_code == 200
+
+    api_client.delete(f"/api/v1/vendor/delete-vendor?vendor_id={vendor_id}")
+
+    assert api_client.get(url).status_code == 404
+
+
+def test_cache_stats_endpoint(api_client, vendor_id):
+    api_client.get(f"/api/v1/vendor/get-vendor-details-by-id?vendor_id={vendor_id}")
+
+    body = api_client.get("/api/v1/internal/cache-stats").json()["source_output"]
+
+    assert body["vendors"]["misses"] == 1
+    assert body["extraction_templates"]["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_results_are_not_cached():
+    cache = ServiceCache("test", max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return Result.Fail("Vendor not found", code=404)
+
+    await cache.get_or_load("missing", loader)
+    await cache.get_or_load("missing", loader)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ServiceCache("test", max_entries=10, ttl_seconds=60)
+
+    async def loader():
+        return Result.Ok(now[0])
+
+    assert (await cache.get_or_load("k", loader)).data == 1000.0
+    now[0] += 59
+    assert (await cache.get_or_load("k", loader)).data == 1000.0
+    now[0] += 2
+    assert (await cache.get_or_load("k", loader)).data == 1061.0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache("test", max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is cache_module._MISSING
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_loads(monkeypatch):
+    monkeypatch.setattr(cache_module.settings, "CACHE_ENABLED", False)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return Result.Ok({})
+
+    await extraction_cache.get_or_load("k", loader)
+    await extraction_cache.get_or_load("k", loader)
+
+    assert len(calls) == 2
+
+
+def test_user_update_is_visible_on_next_read(api_client, db_session):
+    from app.models.user_model import User
+    user = User(bio_id=1, user_name="alice", password_hash="x")
+    db_session.add(user)
+    db_session.commit()
+    url = f"/api/v1/user/get-user-details-by-id?user_id={user.user_id}"
+    api_client.get(url)
+
+    api_client.put(f"/api/v1/user/update-user-details?user_id={user.user_id}", json={"user_name": "bob", "bio_id": 2})
+
+    assert api_client.get(url).json()["source_output"]["user_name"] == "bob"
+
+
+@pytest_asyncio.fixture
+async def workers():
+    """Two workers' caches sharing one backend, each with its invalidation listener."""
+    backend = MemoryCacheBackend()
+    caches = [ServiceCache("vendors", backend=backend), ServiceCache("vendors", backend=backend)]
+    listeners = [asyncio.create_task(listen_for_invalidations(backend, [cache])) for cache in caches]
+    await asyncio.sleep(0)
+    yield caches
+    for listener in listeners:
+        listener.cancel()
+
+
+def counting_loader(calls, value):
+    async def loader():
+        calls.append(value)
+        return Result.Ok({"vendor_name": value}, message="Vendor fetched successfully")
+    return loader
+
+
+@pytest.mark.asyncio
+async def test_worker_reads_entry_loaded_by_another_worker(workers):
+    first, second = workers
+    calls = []
+
+    await first.get_or_load(("id", 1), counting_loader(calls, "Acme"))
+    result = await second.get_or_load(("id", 1), counting_loader(calls, "Acme"))
+
+    assert calls == ["Acme"]
+    assert (result.data, result.message) == ({"vendor_name": "Acme"}, "Vendor fetched successfully")
+    assert second.stats()["shared_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_broadcast_to_other_workers(workers):
+    first, second = workers
+    calls = []
+    await first.get_or_load(("id", 1), counting_loader(calls, "Acme"))
+    await second.get_or_load(("id", 1), counting_loader(calls, "Acme"))
+
+    await first.invalidate()
+
+    assert second.local.stats()["size"] == 0
+    assert (await second.get_or_load(("id", 1), counting_loader(calls, "Acme Ltd"))).data == {"vendor_name": "Acme Ltd"}
+
+
+@pytest.mark.asyncio
+async def test_per_key_invalidation_keeps_other_entries(workers):
+    first, second = workers
+    calls = []
+    for key in (1, 2):
+        await first.get_or_load(("id", key), counting_loader(calls, key))
+        await second.get_or_load(("id", key), counting_loader(calls, key))
+
+    await first.invalidate(("id", 1))
+    await second.get_or_load(("id", 1), counting_loader(calls, "reloaded"))
+    await second.get_or_load(("id", 2), counting_loader(calls, "reloaded"))
+
+    assert calls == [1, 2, "reloaded"]
+
+
+@pytest.mark.asyncio
+async def test_backend_failure_falls_back_to_loader():
+    class BrokenBackend(MemoryCacheBackend):
+        async def get(self, namespace, key):
+            raise ConnectionError("redis down")
+
+    cache = ServiceCache("vendors", backend=BrokenBackend())
+    calls = []
+
+    result = await cache.get_or_load(("id", 1), counting_loader(calls, "Acme"))
+
+    assert result.success and calls == ["Acme"]
+    assert cache.stats()["shared_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_load_straddling_another_workers_invalidation_is_not_shared():
+    # No listeners: the broadcast has not reached the loading worker yet
+    backend = MemoryCacheBackend()
+    first, second = ServiceCache("vendors", backend=backend), ServiceCache("vendors", backend=backend)
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return Result.Ok({"vendor_name": "Acme"})  # read before the rename below
+
+    load = asyncio.create_task(first.get_or_load(("id", 1), slow_loader))
+    await started.wait()
+    await second.invalidate(("id", 1))  # the rename commits on the other worker
+    release.set()
+    await load
+
+    calls = []
+    result = await second.get_or_load(("id", 1), counting_loader(calls, "Acme Ltd"))
+    assert result.data == {"vendor_name": "Acme Ltd"} and calls == ["Acme Ltd"]
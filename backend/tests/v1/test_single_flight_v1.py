@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from app.core import cache as cache_module
+from app.core.cache import ServiceCache
+from app.core.result import Result
+from app.core.single_flight import SingleFlight
+
+
+def slow_loader(calls, value, delay=0.05):
+    async def loader():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return Result.Ok(value)
+    return loader
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_load():
+    flight = SingleFlight("test")
+    calls = []
+
+    results = await asyncio.gather(*(flight.do("vendor:1", slow_loader(calls, "Acme")) for _ in range(20)))
+
+    assert calls == ["Acme"]
+    assert {r.data for r in results} == {"Acme"}
+    assert flight.stats() == {"leaders": 1, "deduplicated": 19, "timeouts": 0, "retried": 0, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced():
+    flight = SingleFlight("test")
+    calls = []
+
+    await asyncio.gather(flight.do("vendor:1", slow_loader(calls, 1)), flight.do("vendor:2", slow_loader(calls, 2)))
+
+    assert sorted(calls) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_waiter_runs_its_own_load_after_timeout():
+    flight = SingleFlight("test")
+    calls = []
+
+    leader = asyncio.create_task(flight.do("k", slow_loader(calls, "slow", delay=1)))
+    await asyncio.sleep(0)
+    result = await flight.do("k", slow_loader(calls, "own", delay=0), timeout_seconds=0.01)
+
+    assert result.data == "own"
+    assert flight.metrics["timeouts"] == 1
+    leader.cancel()
+
+
+@pytest.mark.asyncio
+async def test_waiters_retry_when_the_leader_is_cancelled():
+    flight = SingleFlight("test")
+    calls = []
+
+    leader = asyncio.create_task(flight.do("k", slow_loader(calls, "leader", delay=1)))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flight.do("k", slow_loader(calls, "waiter", delay=0)))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert (await waiter).data == "waiter"
+    assert flight.metrics["retried"] == 1
+
+
+@pytest.mark.asyncio
+async def test_leader_errors_reach_every_waiter():
+    flight = SingleFlight("test")
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(*(flight.do("k", failing) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_coalescing_applies_with_the_cache_disabled(monkeypatch):
+    monkeypatch.setattr(cache_module.settings, "CACHE_ENABLED", False)
+    cache = ServiceCache("test")
+    calls = []
+
+    await asyncio.gather(*(cache.get_or_load(("id", 1), slow_loader(calls, "Acme")) for _ in range(5)))
+
+    assert calls == ["Acme"]
+    assert cache.stats()["coalescing"]["deduplicated"] == 4
+
+
+@pytest.mark.asyncio
+async def test_write_during_a_load_is_not_hidden_by_it():
+    cache = ServiceCache("test")
+    calls = []
+
+    stale = asyncio.create_task(cache.get_or_load(("id", 1), slow_loader(calls, "old")))
+    await asyncio.sleep(0)
+    await cache.invalidate()
+    fresh = await cache.get_or_load(("id", 1), slow_loader(calls, "new"))
+
+    assert ((await stale).data, fresh.data) == ("old", "new")
+    assert (await cache.get_or_load(("id", 1), slow_loader(calls, "unused"))).data == "new"
@@ -0,0 +1,48 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from app.core import startup
+from app.core.config import settings
+from app.core.startup import MigrationsOutOfDate, check_migrations
+
+
+def alembic_head():
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config()
+    config.set_main_option("script_location", str(startup.ALEMBIC_DIR))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+def stamp(engine, revision):
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS invoai.alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        conn.execute(text("DELETE FROM invoai.alembic_version"))
+        conn.execute(text("INSERT INTO invoai.alembic_version VALUES (:rev)"), {"rev": revision})
+
+
+def test_check_migrations_accepts_head(sync_engine):
+    stamp(sync_engine, alembic_head())
+    assert check_migrations(sync_engine) == alembic_head()
+
+
+@pytest.mark.parametrize("revision", [None, "2f3404437eee"])
+def test_check_migrations_rejects_missing_or_old_revision(sync_engine, revision):
+    if revision:
+        stamp(sync_engine, revision)
+    with pytest.raises(MigrationsOutOfDate):
+        check_migrations(sync_engine)
+
+
+def test_lifespan_reports_startup_phases(monkeypatch, tmp_path):
+    import app.main as main
+
+    monkeypatch.chdir(tmp_path)  # logs/ is created relative to the working directory
+    monkeypatch.setattr(settings, "DB_STARTUP_MODE", "skip")
+
+    with TestClient(main.app):
+        report = main.app.state.startup_report
+    assert report["phases"]["import"] > 0
+    assert set(report["phases"]) == {"import", "logging", "database", "cache"}
+    assert report["budget_ms"] == settings.STARTUP_BUDGET_MS
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import event
+from datetime import datetime
+from app.models.vendor_model import Vendor
+from app.repositories.vendor_repository import VendorRepository
+
+
+@pytest.fixture(params=["sync", "async"])
+def vendor_repo(request):
+    session = request.getfixturevalue("db_session" if request.param == "sync" else "async_db_session")
+    return VendorRepository(session)
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_vendor(vendor_repo):
+    created = await vendor_repo.create(Vendor(vendor_name="Acme", created_at=datetime.now()))
+    assert created.success
+
+    fetched = await vendor_repo.get_by_id(created.data.vendor_id)
+    assert fetched.success
+    assert fetched.data.vendor_name == "Acme"
+
+
+@pytest.mark.asyncio
+async def test_get_all_skips_soft_deleted(vendor_repo):
+    await vendor_repo.create(Vendor(vendor_name="Active"))
+    deleted = await vendor_repo.create(Vendor(vendor_name="Deleted"))
+    deleted.data.is_deleted = 1
+    await vendor_repo.update(deleted.data)
+
+    result = await vendor_repo.get_all()
+    assert [v.vendor_name for v in result.data.items] == ["Active"]
+
+    missing = await vendor_repo.get_by_id(deleted.data.vendor_id)
+    assert not missing.success
+    assert missing.code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_by_id_and_soft_delete(vendor_repo):
+    created = await vendor_repo.create(Vendor(vendor_name="Acme"))
+    vendor_id = created.data.vendor_id
+
+    updated = await vendor_repo.update_by_id(vendor_id, {"vendor_name": "Acme Ltd", "updated_by": 2})
+    assert (updated.data.vendor_name, updated.data.updated_by) == ("Acme Ltd", 2)
+
+    assert (await vendor_repo.soft_delete(vendor_id)).success
+    missing = await vendor_repo.soft_delete(vendor_id)
+    assert missing.code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_reuses_identity_map(db_session, sync_engine):
+    repo = VendorRepository(db_session)
+    created = await repo.create(Vendor(vendor_name="Acme"))
+    statements = []
+    event.listen(sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    fetched = await repo.get_by_id(created.data.vendor_id)
+    assert fetched.data is created.data
+    assert statements == []
+
+    db_session.expunge_all()
+    assert (await repo.get_by_id(created.data.vendor_id)).data.vendor_name == "Acme"
+    assert len(statements) == 1
@@ -0,0 +1,44 @@
+import math
+from sqlalchemy import event, insert
+from app.models.extraction_model import Extraction
+from app.models.vendor_model import Vendor
+
+VENDORS = 1000
+
+
+def seed_templates(db_session):
+    db_session.execute(insert(Vendor), [
+        {"vendor_id": v, "vendor_name": f"vendor_{v:04d}", "is_deleted": 0} for v in range(1, VENDORS + 1)])
+    db_session.execute(insert(Extraction), [
+        {"extraction_name": f"zone_{z}", "vendor_id": v, "is_deleted": int(z == 2)}
+        for v in range(1, VENDORS + 1) for z in range(3)])
+    db_session.commit()
+    db_session.expunge_all()
+
+
+def test_templates_load_zones_in_fixed_number_of_queries(api_client, db_session, sync_engine):
+    seed_templates(db_session)
+    selects = []
+    event.listen(sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: selects.append(statement))
+
+    response = api_client.get(f"/api/v1/vendor/get-vendor-templates?limit={VENDORS}")
+
+    body = response.json()["source_output"]
+    assert response.status_code == 200
+    assert len(body["vendors"]) == VENDORS
+    assert all([z["extraction_name"] for z in v["extraction_details"]] == ["zone_0", "zone_1"]
+               for v in body["vendors"])
+    # 1 vendor page query + 1 zone query per 500 vendors; a lazy load would issue one per vendor
+    assert len(selects) == 1 + math.ceil(VENDORS / 500)
+
+
+def test_template_by_id_skips_deleted_zones(api_client, db_session):
+    seed_templates(db_session)
+
+    response = api_client.get("/api/v1/vendor/get-vendor-template-by-id?vendor_id=7")
+
+    body = response.json()["source_output"]
+    assert body["vendor_name"] == "vendor_0007"
+    assert [z["extraction_name"] for z in body["extraction_details"]] == ["zone_0", "zone_1"]
+    assert api_client.get("/api/v1/vendor/get-vendor-template-by-id?vendor_id=99999").status_code == 404
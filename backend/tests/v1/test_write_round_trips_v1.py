@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import event
+from app.models.extraction_model import Extraction
+from app.models.extracted_json_model import ReturnJson
+from app.models.user_model import User
+from app.models.vendor_model import Vendor
+
+
+@pytest.fixture
+def statements(sync_engine):
+    """SQL statements sent to the database while the test runs."""
+    captured = []
+
+    def record(conn, cursor, statement, *args):
+        captured.append(statement.split()[0].upper())
+
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield captured
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def seeded(db_session):
+    vendor = Vendor(vendor_name="Acme")
+    db_session.add(vendor)
+    db_session.flush()
+    user = User(bio_id=1, user_name="alice", password_hash="x")
+    zone = Extraction(extraction_name="total", vendor_id=vendor.vendor_id)
+    record = ReturnJson(invoice_number="INV-1", vendor_id=vendor.vendor_id, extracted_json={"total": 1})
+    db_session.add_all([user, zone, record])
+    db_session.commit()
+    return {"vendor": vendor.vendor_id, "user": user.user_id, "zone": zone.extraction_id,
+            "record": record.return_id}
+
+
+@pytest.mark.parametrize("method, url, payload, expected", [
+    ("post", "/api/v1/vendor/create-new-vendor", {"vendor_name": "Globex"}, ["INSERT"]),
+    ("put", "/api/v1/vendor/update-vendor-details?vendor_id={vendor}", {"vendor_name": "Acme Ltd", "updated_by": 3},
+     ["UPDATE"]),
+    ("delete", "/api/v1/vendor/delete-vendor?vendor_id={vendor}", None, ["UPDATE"]),
+    ("put", "/api/v1/user/update-user-details?user_id={user}", {"user_name": "bob", "bio_id": 2}, ["UPDATE"]),
+    ("patch", "/api/v1/user/update-password?user_id={user}", {"password": "s3cret"}, ["UPDATE"]),
+    ("delete", "/api/v1/user/delete-user?user_id={user}", None, ["UPDATE"]),
+    ("post", "/api/v1/extraction-details/", {"extraction_name": "date", "vendor_id": 1}, ["INSERT"]),
+    ("put", "/api/v1/extraction-details/{zone}", {"x_min": 5}, ["UPDATE"]),
+    ("delete", "/api/v1/extraction-details/{zone}", None, ["UPDATE"]),
+    ("post", "/api/v1/extracted-json/", {"invoice_number": "INV-2", "extracted_json": {}}, ["INSERT"]),
+    ("put", "/api/v1/extracted-json/{record}", {"invoice_number": "INV-9"}, ["UPDATE"]),
+    ("delete", "/api/v1/extracted-json/{record}", None, ["UPDATE"]),
+])
+def test_each_mutation_is_a_single_statement(api_client, seeded, statements, method, url, payload, expected):
+    kwargs = {"json": payload} if payload is not None else {}
+    response = getattr(api_client, method)(url.format(**seeded), **kwargs)
+
+    assert response.status_code in (200, 201, 204), response.text
+    assert statements == expected
+
+
+def test_update_returns_new_values(api_client, seeded):
+    response = api_client.put(f"/api/v1/extraction-details/{seeded['zone']}", json={"x_min": 5, "updated_by": 3})
+
+    body = response.json()["source_output"]
+    assert (body["extraction_name"], body["x_min"], body["updated_by"]) == ("total", 5, 3)
+    assert body["updated_at"] is not None
+
+
+def test_update_of_deleted_row_is_404_without_writing(api_client, seeded, statements):
+    api_client.delete(f"/api/v1/user/delete-user?user_id={seeded['user']}")
+    statements.clear()
+
+    response = api_client.delete(f"/api/v1/user/delete-user?user_id={seeded['user']}")
+
+    assert response.status_code == 404
+    assert statements == ["UPDATE"]
@@ -4,13 +4,33 @@ from utils.result import Result
 
 api_base_url = os.getenv("API_BASE_URL")
 
+# url -> (ETag, body) of the last 200 response, revalidated with If-None-Match
+_etag_cache = {}
+_ETAG_CACHE_MAX_ENTRIES = 256
+
+
+def _conditional_get(client, url):
+    """GET that sends the cached ETag and reuses the cached body on 304 Not Modified."""
+    cached = _etag_cache.get(url)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    response = client.get(url, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    response.raise_for_status()
+    body = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        if url not in _etag_cache and len(_etag_cache) >= _ETAG_CACHE_MAX_ENTRIES:
+            _etag_cache.pop(next(iter(_etag_cache)))
+        _etag_cache[url] = (etag, body)
+    return body
+
 
 def get_vendor_list():
     try:
         with httpx.Client(verify=False, timeout=10.0) as client:
-            response = client.get(f"{api_base_url}/v1/vendor/get-all-vendors")
-            response.raise_for_status()
-            return Result.Ok(data=response.json())
+            return Result.Ok(data=_conditional_get(client, f"{api_base_url}/v1/vendor/get-all-vendors"))
     except httpx.HTTPStatusError as e:
         return Result.Fail(message=f"HTTP error: {e.response.status_code} - {e.response.text}", code=e.response.status_code)
     except Exception as e:
@@ -40,12 +60,10 @@ def add_vendor(vendor_name, created_by=30026427):
 
 
 def get_vendor_by_id(id):
-    url = f"{api_base_url}/v1/vendor/get-vendor-by-id/{id}"
+    url = f"{api_base_url}/v1/vendor/get-vendor-details-by-id?vendor_id={id}"
     try:
         with httpx.Client(verify=False, timeout=10.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return Result.Ok(data=response.json())
+            return Result.Ok(data=_conditional_get(client, url))
     except httpx.HTTPStatusError as e:
         return Result.Fail(message=f"HTTP error: {e.response.status_code} - {e.response.text}", code=e.response.status_code)
     except Exception as e: